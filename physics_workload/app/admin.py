@@ -4,10 +4,12 @@ from django.contrib.admin import ModelAdmin
 from app.models import (
     AcademicGroup,
     Assignment,
+    RecalculationJob,
     Staff,
     StandardLoad,
     Task,
     Unit,
+    YearSnapshot,
 )
 
 
@@ -69,3 +71,27 @@ class StaffAdmin(ModelAdmin):
     """
 
     pass
+
+
+@admin.register(RecalculationJob)
+class RecalculationJobAdmin(ModelAdmin):
+    """
+    Admin class for the RecalculationJob model.
+    Lists the queued recalculations, so any that failed can be seen.
+    """
+
+    list_display = ("pk", "status", "created", "started", "error")
+    list_filter = ("status",)
+
+
+@admin.register(YearSnapshot)
+class YearSnapshotAdmin(ModelAdmin):
+    """
+    Admin class for the YearSnapshot model.
+    Snapshots can't be changed once taken, so they're read-only.
+    """
+
+    list_display = ("year", "date")
+
+    def has_change_permission(self, request, obj=None) -> bool:
+        return False
@@ -1,7 +1,26 @@
+from functools import cache
+from hashlib import md5
 from typing import Any, Dict
 
+import plotly
+from django.contrib.staticfiles import finders
+from django.templatetags.static import static
 from iommi import Asset
 
+
+@cache
+def static_versioned(path: str) -> str:
+    """
+    Gets the URL of one of the site's own static files, with a hash of its contents as the version,
+    so a cached copy isn't used after the file changes.
+
+    :param path: The path of the file, relative to the static files.
+    :return: The URL of the file.
+    """
+    with open(finders.find(path), "rb") as file:
+        return f"{static(path)}?v={md5(file.read(), usedforsecurity=False).hexdigest()[:12]}"
+
+
 mathjax_js: Dict[str, Any] = dict(
     mathjax_inline=Asset.js(attrs__src="/static/js/mathjax-inline.js"),
     mathjax_js=Asset.js(
@@ -17,3 +36,19 @@ autosize_js: Dict[str, Any] = dict(
         attrs__defer=True,
     )
 )
+
+# Served from the static files rather than inlined in each page, so browsers only download it once.
+# The version's in the URL, so a cached copy isn't used with figures from a newer plotly.
+plotly_js: Dict[str, Any] = dict(
+    plotly_js=Asset.js(
+        attrs__src=lambda **_: f"{static('js/plotly.min.js')}?v={plotly.__version__}",
+    )
+)
+
+# Draws the charts from `app.charts`, once plotly.js has loaded.
+chart_js: Dict[str, Any] = dict(
+    **plotly_js,
+    charts_js=Asset.js(
+        attrs__src=lambda **_: static_versioned("js/charts.js"),
+    ),
+)
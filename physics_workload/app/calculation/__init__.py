@@ -0,0 +1,11 @@
+"""
+Recalculation of the loads across the whole department, or just the parts affected by an edit.
+"""
+
+from app.calculation.context import CalculationContext
+from app.calculation.engine import Department, RecalculationResult, recalculate_all_loads, recalculate_loads
+from app.calculation.graph import Subgraph
+from app.calculation.profiling import Profile, Profiler, get_recent_profiles
+from app.calculation.rollover import RolloverError, RolloverResult, roll_over_year
+from app.calculation.unit_of_work import UnitOfWork
+from app.calculation.worker import queue_recalculation
@@ -0,0 +1,55 @@
+"""
+Set-based recalculation of the staff and academic group balances, in the database.
+
+Rather than loading the rows and saving them one at a time, each is a single `UPDATE` of every row,
+with the totals worked out by grouped subqueries; so it takes the same few queries however big the department is.
+The staff loads themselves come from the full recalculation in `app.calculation.engine`.
+"""
+
+from django.db.models import F, OuterRef, QuerySet, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from app.models import AcademicGroup, Staff
+
+
+def get_academic_group_balance_total() -> Coalesce:
+    """
+    :return: The total load balance of each academic group's staff, for a query on the academic groups.
+    """
+    return Coalesce(
+        Subquery(
+            Staff.objects.filter(academic_group=OuterRef("pk"))
+            .values("academic_group")
+            .annotate(total=Sum(F("load_assigned") - F("load_target")))
+            .values("total")
+        ),
+        Value(0),
+    )
+
+
+def update_staff_balances(queryset: QuerySet | None = None) -> int:
+    """
+    Updates the load balance of staff, from their assigned and target loads.
+
+    The assigned and target loads have to be up to date first, e.g. after a recalculation.
+
+    :param queryset: The staff to update, defaults to all of them.
+    :return: The number of staff updated.
+    """
+    if queryset is None:
+        queryset = Staff.objects.all()
+
+    return queryset.update(load_balance_final=F("load_assigned") - F("load_target"))
+
+
+def update_academic_group_balances(queryset: QuerySet | None = None) -> int:
+    """
+    Updates the load balance of academic groups, from the balances of their staff.
+
+    :param queryset: The academic groups to update, defaults to all of them.
+    :return: The number of academic groups updated.
+    """
+    if queryset is None:
+        queryset = AcademicGroup.objects.all()
+
+    return queryset.update(load_balance_final=get_academic_group_balance_total())
@@ -0,0 +1,57 @@
+"""
+The standard load a calculation is made against, resolved once and passed through the calculation.
+"""
+
+from dataclasses import dataclass
+
+from django.http import HttpRequest
+
+from app.models import StandardLoad
+
+
+@dataclass(frozen=True)
+class CalculationContext:
+    """
+    The standard load for a year, and the coefficients derived from it.
+
+    :attribute standard_load: The standard load for the year.
+    :attribute target_load_per_fte: The teaching load per FTE; the calculated value if there is one, else the default.
+    """
+
+    standard_load: StandardLoad
+    target_load_per_fte: int
+
+    @classmethod
+    def for_standard_load(cls, standard_load: StandardLoad) -> "CalculationContext":
+        """
+        :param standard_load: The standard load to calculate against.
+        :return: The context for that standard load.
+        """
+        return cls(
+            standard_load=standard_load,
+            target_load_per_fte=standard_load.target_load_per_fte_calc or standard_load.target_load_per_fte,
+        )
+
+    @classmethod
+    def for_year(cls, year: int | None = None) -> "CalculationContext":
+        """
+        :param year: The year to calculate against, defaults to the latest.
+        :raises StandardLoad.DoesNotExist: If there is no standard load for the year.
+        :return: The context for that year.
+        """
+        if year is None:
+            return cls.for_standard_load(StandardLoad.objects.latest())
+        else:
+            return cls.for_standard_load(StandardLoad.objects.get(year=year))
+
+    @classmethod
+    def for_request(cls, request: HttpRequest) -> "CalculationContext":
+        """
+        Gets the context for the latest year, cached on the request so it's only looked up once per request.
+
+        :param request: The current request.
+        :return: The context for the latest year.
+        """
+        if not hasattr(request, "_calculation_context"):
+            request._calculation_context = cls.for_year()
+        return request._calculation_context
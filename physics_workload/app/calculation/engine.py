@@ -0,0 +1,536 @@
+"""
+Array-based recalculation of every load in the department.
+
+Rather than walking the models one at a time, issuing queries and saves for each, this loads everything
+the calculation depends on in a handful of queries, calculates the loads as NumPy arrays,
+then writes back only the rows that have changed, in bulk; see `app.calculation.unit_of_work`.
+The loads are the same as `Task.calculate_load` gives for each task and assignment on its own.
+
+After an edit, only the subgraph of rows it affects needs loading; see `app.calculation.graph`.
+"""
+
+from dataclasses import dataclass
+from logging import Logger, getLogger
+from typing import Any, Dict, List, Tuple
+
+import numpy
+from django.db.models import F, Q, QuerySet, Sum
+from numpy.typing import NDArray
+
+from app.calculation.context import CalculationContext
+from app.calculation.full_time import FullTimeSolution, solve_target_load_per_fte
+from app.calculation.graph import Subgraph
+from app.calculation.profiling import Profile, Profiler
+from app.calculation.unit_of_work import UnitOfWork
+from app.models import AcademicGroup, Assignment, LoadFunction, Staff, StandardLoad, Task, Unit
+from app.models.common import suspend_history
+
+logger: Logger = getLogger(__name__)
+
+
+@dataclass
+class RecalculationResult:
+    """
+    Summary of a recalculation.
+
+    :attribute cycles: The number of cycles taken to settle the full-time equivalent load.
+    :attribute converged: Whether the full-time equivalent load settled.
+    :attribute target_load_per_fte: The calculated teaching load per FTE.
+    :attribute tasks_updated: The number of tasks changed.
+    :attribute assignments_updated: The number of assignments changed.
+    :attribute staff_updated: The number of staff changed.
+    :attribute academic_groups_updated: The number of groups changed.
+    :attribute profile: How long each phase of the recalculation took.
+    """
+
+    cycles: int = 0
+    converged: bool = True
+    target_load_per_fte: int = 0
+    tasks_updated: int = 0
+    assignments_updated: int = 0
+    staff_updated: int = 0
+    academic_groups_updated: int = 0
+    profile: Profile | None = None
+
+
+def truncate(values: NDArray[numpy.float64]) -> NDArray[numpy.int64]:
+    """
+    Converts loads to integers the same way an `IntegerField` does on save.
+
+    :param values: The loads.
+    :return: The loads, truncated towards zero.
+    """
+    return numpy.trunc(values).astype(numpy.int64)
+
+
+class Department:
+    """
+    Snapshot of everything that goes into the load calculation for the department, held as arrays.
+
+    Each model is stored as parallel arrays indexed by row, with foreign keys converted to row indices
+    (or -1 where null) so that they can be used to gather values from other arrays.
+    """
+
+    def __init__(self, context: CalculationContext, subgraph: Subgraph | None = None):
+        """
+        Loads the department from the database.
+
+        If a subgraph is given, only the rows within it are loaded. The loads of assignments and staff outside of it
+        are summed in the database and carried as offsets, so staff and group totals still come out right.
+
+        :param context: The standard load to calculate against, and the current target load per FTE.
+        :param subgraph: The rows to load, defaults to everything.
+        """
+        self.context: CalculationContext = context
+        self.standard_load: StandardLoad = context.standard_load
+        self.subgraph: Subgraph | None = subgraph
+
+        # ==== ASSIGNMENTS ====
+        assignment_queryset: QuerySet = Assignment.objects.all()
+        if subgraph:
+            assignment_queryset = assignment_queryset.filter(Q(pk__in=subgraph.assignments) | Q(task_id__in=subgraph.tasks))
+        assignment_rows: List[Tuple] = list(assignment_queryset.values_list("pk", "task_id", "staff_id", "students", "is_first_time", "load_calc"))
+
+        # ==== TASKS ====
+        task_queryset: QuerySet = Task.objects.all()
+        if subgraph:
+            task_queryset = task_queryset.filter(pk__in=subgraph.tasks | {row[1] for row in assignment_rows})
+        task_rows: List[Tuple] = list(
+            task_queryset.values_list(
+                "pk",
+                "title",
+                "unit_id",
+                "academic_group__short_name",
+                "load_function_id",
+                "students",
+                "is_full_time",
+                "is_lead",
+                "load_fixed",
+                "load_fixed_first",
+                "load_multiplier",
+                "coursework_fraction",
+                "exam_fraction",
+                "load_calc",
+                "load_calc_first",
+                "name",
+            )
+        )
+
+        # ==== UNITS ====
+        unit_queryset: QuerySet = Unit.objects.all()
+        load_function_queryset: QuerySet = LoadFunction.objects.all()
+        if subgraph:
+            unit_queryset = unit_queryset.filter(pk__in={row[2] for row in task_rows if row[2]})
+            load_function_queryset = load_function_queryset.filter(pk__in={row[4] for row in task_rows if row[4]})
+
+        self.load_functions: Dict[int, LoadFunction] = load_function_queryset.in_bulk()
+        self.units: List[Unit] = list(unit_queryset)
+        unit_index: Dict[str, int] = {unit.pk: index for index, unit in enumerate(self.units)}
+        self.unit_students = self._array([unit.students for unit in self.units])
+        self.unit_contact_sessions = self._array([unit.lectures + unit.synoptic_lectures + unit.problem_classes for unit in self.units])
+        self.unit_coursework = self._array([unit.coursework for unit in self.units])
+        self.unit_credits = self._array([unit.credits for unit in self.units])
+        self.unit_coursework_mark_fraction = self._array([unit.coursework_mark_fraction for unit in self.units])
+        self.unit_exam_mark_fraction = self._array([unit.exam_mark_fraction for unit in self.units])
+
+        # ==== STAFF ====
+        # Each staff member's total from assignments that haven't been loaded.
+        staff_queryset: QuerySet = Staff.objects.all()
+        staff_fields: List[str] = ["pk", "academic_group_id", "fte_fraction", "hours_fixed", "load_assigned", "load_target"]
+        if subgraph:
+            if not subgraph.staff_all:
+                staff_queryset = staff_queryset.filter(pk__in=subgraph.staff | {row[2] for row in assignment_rows})
+            staff_queryset = staff_queryset.annotate(
+                load_assigned_other=Sum(
+                    "assignment_set__load_calc",
+                    filter=~Q(assignment_set__pk__in=[row[0] for row in assignment_rows]),
+                    default=0,
+                )
+            )
+            staff_fields.append("load_assigned_other")
+        staff_rows: List[Tuple] = list(staff_queryset.values_list(*staff_fields))
+        self.staff_pk: List[str] = [row[0] for row in staff_rows]
+        staff_index: Dict[str, int] = {pk: index for index, pk in enumerate(self.staff_pk)}
+        self.staff_academic_group: List[str | None] = [row[1] for row in staff_rows]
+        self.staff_fte_fraction = self._array([row[2] for row in staff_rows])
+        self.staff_hours_fixed = self._array([row[3] for row in staff_rows])
+        self.staff_load_assigned = self._array([row[4] for row in staff_rows], numpy.int64)
+        self.staff_load_target = self._array([row[5] for row in staff_rows], numpy.int64)
+        self.staff_load_assigned_other = self._array([row[6] if subgraph else 0 for row in staff_rows], numpy.int64)
+
+        # ==== ACADEMIC GROUPS ====
+        # There are only a handful of groups, so they're always loaded. That way, a staff member moving group is picked up.
+        # Each group's balance from staff that haven't been loaded.
+        group_queryset: QuerySet = AcademicGroup.objects.all()
+        group_fields: List[str] = ["pk", "load_balance_final"]
+        if subgraph:
+            group_queryset = group_queryset.annotate(
+                load_balance_other=Sum(
+                    F("staff__load_assigned") - F("staff__load_target"),
+                    filter=~Q(staff__pk__in=self.staff_pk),
+                    default=0,
+                )
+            )
+            group_fields.append("load_balance_other")
+        group_rows: List[Tuple] = list(group_queryset.values_list(*group_fields))
+        self.academic_group_pk: List[str] = [row[0] for row in group_rows]
+        academic_group_index: Dict[str, int] = {pk: index for index, pk in enumerate(self.academic_group_pk)}
+        self.academic_group_load_balance_final = self._array([row[1] for row in group_rows], numpy.int64)
+        self.academic_group_load_balance_other = self._array([row[2] if subgraph else 0 for row in group_rows], numpy.int64)
+        self.staff_academic_group_index = self._array(
+            [academic_group_index.get(pk, -1) for pk in self.staff_academic_group],
+            numpy.int64,
+        )
+
+        self.task_pk: List[int] = [row[0] for row in task_rows]
+        task_index: Dict[int, int] = {pk: index for index, pk in enumerate(self.task_pk)}
+        self.task_name_base: List[str] = [Task.format_name(row[1], row[2], row[3]) for row in task_rows]
+        self.task_unit_index = self._array([unit_index.get(row[2], -1) for row in task_rows], numpy.int64)
+        self.task_load_function: List[int | None] = [row[4] for row in task_rows]
+        self.task_students: List[int | None] = [row[5] for row in task_rows]
+        self.task_is_full_time = self._array([row[6] for row in task_rows], bool)
+        self.task_is_lead = self._array([row[7] for row in task_rows], bool)
+        self.task_load_fixed = self._array([row[8] for row in task_rows])
+        self.task_load_fixed_first = self._array([row[9] for row in task_rows])
+        self.task_load_multiplier = self._array([row[10] for row in task_rows])
+        self.task_coursework_fraction = self._array([row[11] for row in task_rows])
+        self.task_exam_fraction = self._array([row[12] for row in task_rows])
+        self.task_load_calc = self._array([row[13] for row in task_rows], numpy.int64)
+        self.task_load_calc_first = self._array([row[14] for row in task_rows], numpy.int64)
+        self.task_name: List[str] = [row[15] for row in task_rows]
+
+        self.assignment_pk: List[int] = [row[0] for row in assignment_rows]
+        self.assignment_task_index = self._array([task_index[row[1]] for row in assignment_rows], numpy.int64)
+        self.assignment_staff_index = self._array([staff_index[row[2]] for row in assignment_rows], numpy.int64)
+        self.assignment_students: List[int | None] = [row[3] for row in assignment_rows]
+        self.assignment_is_first_time = self._array([row[4] for row in assignment_rows], bool)
+        self.assignment_load_calc = self._array([row[5] for row in assignment_rows], numpy.int64)
+
+    @staticmethod
+    def _array(values: List[Any], dtype: type = numpy.float64) -> NDArray:
+        """
+        :param values: The column of values, which may contain nulls.
+        :param dtype: The type of the array.
+        :return: The values as an array, with nulls treated as zero.
+        """
+        return numpy.array([value if value is not None else 0 for value in values], dtype=dtype)
+
+    def evaluate_load_functions(self, task_indices: NDArray[numpy.int64], students: List[int | None]) -> NDArray[numpy.float64]:
+        """
+        Evaluates the load function of each task for a number of students.
+
+        :param task_indices: The tasks to evaluate the functions of.
+        :param students: The number of students to evaluate for, per task.
+        :return: The load from each function, or zero if a task has none.
+        """
+        loads: NDArray[numpy.float64] = numpy.zeros(len(task_indices))
+
+        # Group the rows by load function, so each function is evaluated in one batch.
+        rows_by_function: Dict[int, List[int]] = {}
+        for row, task in enumerate(task_indices):
+            if (load_function_pk := self.task_load_function[task]) is not None:
+                rows_by_function.setdefault(load_function_pk, []).append(row)
+
+        for load_function_pk, rows in rows_by_function.items():
+            units: List[Unit | None] = [self.units[unit] if unit >= 0 else None for unit in self.task_unit_index[task_indices[rows]]]
+            loads[rows] = self.load_functions[load_function_pk].evaluate_batch(
+                students=[students[row] for row in rows],
+                lectures=[unit.lectures if unit else None for unit in units],
+                exams=[unit.exams if unit else None for unit in units],
+            )
+
+        return loads
+
+    def calculate_lead_loads(self) -> Tuple[NDArray[numpy.float64], NDArray[numpy.float64]]:
+        """
+        Calculates the unit co-ordinator part of the load for each task, as per the spreadsheet logic.
+
+        :return: The co-ordinator loads for normal and first-time assignments, zero for tasks that aren't leads.
+        """
+        standard_load: StandardLoad = self.standard_load
+        unit: NDArray[numpy.int64] = numpy.where(self.task_is_lead, self.task_unit_index, 0)
+        if not len(self.units):
+            return numpy.zeros(len(self.task_pk)), numpy.zeros(len(self.task_pk))
+
+        students = self.unit_students[unit]
+        coursework = self.unit_coursework[unit]
+        credits = self.unit_credits[unit]
+        coursework_mark_fraction = self.unit_coursework_mark_fraction[unit]
+
+        load_lecture = self.unit_contact_sessions[unit] * standard_load.load_lecture
+        load_lecture_first = self.unit_contact_sessions[unit] * standard_load.load_lecture_first
+
+        load_coursework = numpy.where(
+            (coursework != 0) & (self.task_coursework_fraction != 0),
+            coursework * standard_load.load_coursework_set
+            + coursework_mark_fraction * credits * standard_load.load_coursework_credit
+            + (coursework + coursework_mark_fraction * credits) * self.task_coursework_fraction * students * standard_load.load_coursework_marked,
+            0.0,
+        )
+        load_exam = numpy.where(
+            self.task_exam_fraction != 0,
+            self.unit_exam_mark_fraction[unit] * credits * standard_load.load_exam_credit
+            + students * self.task_exam_fraction * standard_load.load_exam_marked,
+            0.0,
+        )
+        load = load_coursework + load_exam
+
+        return (
+            numpy.where(self.task_is_lead, load + self.task_load_fixed + load_lecture, 0.0),
+            numpy.where(self.task_is_lead, load + self.task_load_fixed + load_lecture_first + self.task_load_fixed_first, 0.0),
+        )
+
+    def solve_target_load_per_fte(self, loads: NDArray[numpy.int64], multipliers: NDArray[numpy.float64]) -> FullTimeSolution:
+        """
+        Settles the teaching load per FTE, and so the loads of the assignments to full-time tasks.
+
+        When only a subgraph is loaded, the rest of the department's totals come from the database.
+        If nothing that feeds into the target has changed, the current target is kept without re-solving.
+
+        :param loads: The loads of the loaded assignments that aren't to full-time tasks.
+        :param multipliers: The load multipliers of the loaded assignments to full-time tasks.
+        :return: The settled target, and the loads of the loaded full-time assignments.
+        """
+        standard_load: StandardLoad = self.standard_load
+        total_fte_fraction: float = float(self.staff_fte_fraction.sum())
+        total_hours_fixed: float = float(self.staff_hours_fixed.sum())
+        total_assigned_hours: int = int(loads.sum())
+        multipliers_all: NDArray[numpy.float64] = multipliers
+
+        if self.subgraph:
+            # The target only depends on the total assigned load, so if that's the same at the current target, it still holds.
+            target: int = self.context.target_load_per_fte
+            if not self.subgraph.target:
+                loads_full_time: NDArray[numpy.int64] = truncate(target * multipliers)
+                if total_assigned_hours + int(loads_full_time.sum()) == int(self.assignment_load_calc.sum()):
+                    return FullTimeSolution(target_load_per_fte=target, loads=loads_full_time, cycles=0, converged=True)
+
+            totals: Dict[str, float | None] = Staff.objects.aggregate(fte_fraction=Sum("fte_fraction"), hours_fixed=Sum("hours_fixed"))
+            total_fte_fraction = float(totals["fte_fraction"] or 0)
+            total_hours_fixed = float(totals["hours_fixed"] or 0)
+
+            assignments_other: QuerySet = Assignment.objects.exclude(pk__in=self.assignment_pk)
+            total_assigned_hours += assignments_other.filter(task__is_full_time=False).aggregate(total=Sum("load_calc", default=0))["total"]
+            multipliers_all = numpy.concatenate(
+                [multipliers, self._array(list(assignments_other.filter(task__is_full_time=True).values_list("task__load_multiplier", flat=True)))]
+            )
+
+        solution: FullTimeSolution = solve_target_load_per_fte(
+            load_fte_misc=standard_load.load_fte_misc,
+            target_load_per_fte=standard_load.target_load_per_fte,
+            total_fte_fraction=total_fte_fraction,
+            total_hours_fixed=total_hours_fixed,
+            total_assigned_hours=total_assigned_hours,
+            multipliers=multipliers_all,
+            target_initial=self.context.target_load_per_fte,
+        )
+        # The loaded assignments come first.
+        solution.loads = solution.loads[: len(multipliers)]
+        return solution
+
+    def calculate(self) -> RecalculationResult:
+        """
+        Calculates the loads of every task, assignment, staff member and group, updating the arrays in place.
+
+        :return: A summary of the calculation; the numbers of rows changed are filled in when written back.
+        """
+        task_indices: NDArray[numpy.int64] = numpy.arange(len(self.task_pk))
+        lead, lead_first = self.calculate_lead_loads()
+
+        # Loads for non-full-time tasks, with the students falling back to the unit's.
+        task_students: List[int | None] = [
+            students if students or unit < 0 else self.units[unit].students for students, unit in zip(self.task_students, self.task_unit_index)
+        ]
+        generic: NDArray[numpy.float64] = self.task_load_fixed + self.evaluate_load_functions(task_indices, task_students)
+        task_raw = numpy.where(self.task_is_lead, lead, generic)
+        task_raw_first = numpy.where(self.task_is_lead, lead_first, generic + self.task_load_fixed_first)
+
+        # Loads for assignments to non-full-time tasks, which use their own students.
+        assignment_task: NDArray[numpy.int64] = self.assignment_task_index
+        assignment_generic = self.task_load_fixed[assignment_task] + self.evaluate_load_functions(assignment_task, self.assignment_students)
+        assignment_raw = numpy.where(
+            self.task_is_lead[assignment_task],
+            numpy.where(self.assignment_is_first_time, lead_first[assignment_task], lead[assignment_task]),
+            numpy.where(self.assignment_is_first_time, assignment_generic + self.task_load_fixed_first[assignment_task], assignment_generic),
+        )
+        assignment_multiplier = self.task_load_multiplier[assignment_task]
+        assignment_is_full_time = self.task_is_full_time[assignment_task]
+        assignment_load_partial: NDArray[numpy.int64] = truncate(assignment_raw * assignment_multiplier)
+
+        # Full-time tasks are worth the teaching load per FTE, which depends on the total assigned load.
+        solution: FullTimeSolution = self.solve_target_load_per_fte(
+            assignment_load_partial[~assignment_is_full_time],
+            assignment_multiplier[assignment_is_full_time],
+        )
+        target: int = solution.target_load_per_fte
+        logger.info(f"Settled target load per FTE at {target} after {solution.cycles} cycles.")
+
+        assignment_load_full_time: NDArray[numpy.int64] = numpy.zeros(len(assignment_task), dtype=numpy.int64)
+        assignment_load_full_time[assignment_is_full_time] = solution.loads
+        self.target_load_per_fte: int = target
+        self.task_load_calc = truncate(numpy.where(self.task_is_full_time, target, task_raw) * self.task_load_multiplier)
+        self.task_load_calc_first = truncate(numpy.where(self.task_is_full_time, target, task_raw_first) * self.task_load_multiplier)
+        self.assignment_load_calc = numpy.where(assignment_is_full_time, assignment_load_full_time, assignment_load_partial)
+
+        # Staff totals and targets
+        assigned: NDArray[numpy.float64] = numpy.bincount(
+            self.assignment_staff_index,
+            weights=self.assignment_load_calc,
+            minlength=len(self.staff_pk),
+        )
+        self.staff_load_assigned = truncate(self.standard_load.load_fte_misc * self.staff_fte_fraction + self.staff_load_assigned_other + assigned)
+        self.staff_load_target = numpy.where(
+            self.staff_hours_fixed != 0,
+            self.staff_hours_fixed.astype(numpy.int64),
+            numpy.where(self.staff_fte_fraction != 0, truncate(self.staff_fte_fraction * target), self.staff_load_target),
+        )
+
+        # Group balances
+        in_group = self.staff_academic_group_index >= 0
+        self.academic_group_load_balance_final = (
+            numpy.bincount(
+                self.staff_academic_group_index[in_group],
+                weights=(self.staff_load_assigned - self.staff_load_target)[in_group],
+                minlength=len(self.academic_group_pk),
+            ).astype(numpy.int64)
+            + self.academic_group_load_balance_other
+        )
+
+        return RecalculationResult(cycles=solution.cycles, converged=solution.converged, target_load_per_fte=target)
+
+
+def recalculate_loads(
+    subgraph: Subgraph | None,
+    context: CalculationContext | None = None,
+    unit_of_work: UnitOfWork | None = None,
+) -> RecalculationResult:
+    """
+    Recalculates the loads within a subgraph of the department, and saves any that have changed.
+
+    If the edits behind the subgraph change the target load per FTE, every staff target and full-time task
+    depends on it, so this falls back to recalculating everything.
+
+    :param subgraph: The rows affected by an edit, or None to recalculate everything.
+    :param context: The standard load to calculate against, defaults to the latest.
+    :param unit_of_work: The unit of work to register changes with, for the caller to flush.
+        Defaults to a new one, flushed before returning.
+    :return: A summary of the recalculation, with its profile.
+    """
+    with Profiler("all loads" if subgraph is None else "affected loads") as profiler, suspend_history("Recalculated loads"):
+        result: RecalculationResult = _recalculate_loads(subgraph, context, unit_of_work, profiler)
+
+    result.profile = profiler.profile
+    return result
+
+
+def _recalculate_loads(
+    subgraph: Subgraph | None,
+    context: CalculationContext | None,
+    unit_of_work: UnitOfWork | None,
+    profiler: Profiler,
+) -> RecalculationResult:
+    """
+    Recalculates the loads within a subgraph of the department, timing each phase; see `recalculate_loads`.
+
+    :param subgraph: The rows affected by an edit, or None to recalculate everything.
+    :param context: The standard load to calculate against, defaults to the latest.
+    :param unit_of_work: The unit of work to register changes with, defaults to a new one flushed before returning.
+    :param profiler: The profiler timing the recalculation.
+    :return: A summary of the recalculation.
+    """
+    with profiler.phase("load"):
+        if not context:
+            context = CalculationContext.for_year()
+
+        standard_load: StandardLoad = context.standard_load
+        department: Department = Department(context, subgraph)
+
+    task_load_calc_old = department.task_load_calc
+    task_load_calc_first_old = department.task_load_calc_first
+    assignment_load_calc_old = department.assignment_load_calc
+    staff_load_assigned_old = department.staff_load_assigned
+    staff_load_target_old = department.staff_load_target
+    academic_group_load_balance_final_old = department.academic_group_load_balance_final
+
+    with profiler.phase("calculate"):
+        result: RecalculationResult = department.calculate()
+
+    if subgraph and result.target_load_per_fte != standard_load.target_load_per_fte_calc:
+        logger.info("Edits change the load target per FTE, recalculating all loads.")
+        profiler.profile.label = "all loads, as edits changed the target"
+        return _recalculate_loads(None, context, unit_of_work, profiler)
+
+    # ==== FIND WHAT'S CHANGED ====
+    with profiler.phase("compare"):
+        flush: bool = unit_of_work is None
+        if unit_of_work is None:
+            unit_of_work = UnitOfWork()
+
+        if standard_load.target_load_per_fte_calc != result.target_load_per_fte:
+            logger.info(f"Recalculated load target per FTE from {standard_load.target_load_per_fte_calc} to {result.target_load_per_fte}.")
+            standard_load.target_load_per_fte_calc = result.target_load_per_fte
+            unit_of_work.register(standard_load, ["target_load_per_fte_calc"])
+
+        for index in range(len(department.task_pk)):
+            load_calc: int = int(department.task_load_calc[index])
+            load_calc_first: int = int(department.task_load_calc_first[index])
+            name: str = Task.format_name_with_load(department.task_name_base[index], load_calc, load_calc_first)
+
+            if load_calc != task_load_calc_old[index] or load_calc_first != task_load_calc_first_old[index] or name != department.task_name[index]:
+                unit_of_work.register(
+                    Task(pk=department.task_pk[index], load_calc=load_calc, load_calc_first=load_calc_first, name=name),
+                    ["load_calc", "load_calc_first", "name"],
+                )
+                result.tasks_updated += 1
+
+        for index in numpy.flatnonzero(department.assignment_load_calc != assignment_load_calc_old):
+            unit_of_work.register(
+                Assignment(pk=department.assignment_pk[index], load_calc=int(department.assignment_load_calc[index])), ["load_calc"]
+            )
+            result.assignments_updated += 1
+
+        for index in numpy.flatnonzero(
+            (department.staff_load_assigned != staff_load_assigned_old) | (department.staff_load_target != staff_load_target_old)
+        ):
+            unit_of_work.register(
+                Staff(
+                    pk=department.staff_pk[index],
+                    load_assigned=int(department.staff_load_assigned[index]),
+                    load_target=int(department.staff_load_target[index]),
+                ),
+                ["load_assigned", "load_target"],
+            )
+            result.staff_updated += 1
+
+        for index in numpy.flatnonzero(department.academic_group_load_balance_final != academic_group_load_balance_final_old):
+            unit_of_work.register(
+                AcademicGroup(pk=department.academic_group_pk[index], load_balance_final=int(department.academic_group_load_balance_final[index])),
+                ["load_balance_final"],
+            )
+            result.academic_groups_updated += 1
+
+    # ==== WRITE BACK ====
+    if flush:
+        with profiler.phase("write"):
+            unit_of_work.flush()
+
+    profiler.profile.rows_written = result.tasks_updated + result.assignments_updated + result.staff_updated + result.academic_groups_updated
+    profiler.profile.cycles = result.cycles
+    profiler.profile.converged = result.converged
+
+    logger.info(
+        f"Recalculated {'all' if subgraph is None else 'affected'} loads in {result.cycles} cycles, "
+        f"updating {result.tasks_updated} tasks, {result.assignments_updated} assignments, {result.staff_updated} staff and {result.academic_groups_updated} groups."
+    )
+    return result
+
+
+def recalculate_all_loads(context: CalculationContext | None = None, unit_of_work: UnitOfWork | None = None) -> RecalculationResult:
+    """
+    Recalculates the loads of every task, assignment, staff member and group, and saves any that have changed.
+
+    :param context: The standard load to calculate against, defaults to the latest.
+    :param unit_of_work: The unit of work to register changes with, defaults to a new one flushed before returning.
+    :return: A summary of the recalculation.
+    """
+    return recalculate_loads(None, context, unit_of_work)
@@ -0,0 +1,112 @@
+"""
+Solver for the recursively-defined full-time task load.
+
+A full-time task is worth the teaching load per FTE, which is calculated from the total load assigned,
+which includes the full-time tasks. Ignoring the truncation to whole hours, the target is:
+
+    T = L_m + (H_assigned + T * sum(M_ft) - H_fixed) / F
+
+where `M_ft` are the load multipliers of the assignments to full-time tasks, and `F` is the total FTE fraction.
+That's linear in T, so it can be solved for directly:
+
+    T = (L_m * F + H_assigned - H_fixed) / (F - sum(M_ft))
+
+The truncation of each assignment to whole hours means that's only approximately right,
+so it's then refined to the exact whole-hour fixed point by iteration, which takes a cycle or two.
+"""
+
+from dataclasses import dataclass
+from logging import Logger, getLogger
+from typing import Tuple
+
+import numpy
+from numpy.typing import NDArray
+
+logger: Logger = getLogger(__name__)
+
+# The refinement should take one or two cycles; if it hasn't settled by this point it never will.
+CYCLES_MAXIMUM: int = 100
+
+
+@dataclass
+class FullTimeSolution:
+    """
+    The settled teaching load per FTE.
+
+    :attribute target_load_per_fte: The teaching load per FTE, in whole hours.
+    :attribute loads: The load of each assignment to a full-time task at that target.
+    :attribute cycles: The number of refinement cycles taken.
+    :attribute converged: Whether the target is a fixed point; if not, it's the last value tried.
+    """
+
+    target_load_per_fte: int
+    loads: NDArray[numpy.int64]
+    cycles: int
+    converged: bool
+
+
+def solve_target_load_per_fte(
+    load_fte_misc: float,
+    target_load_per_fte: int,
+    total_fte_fraction: float,
+    total_hours_fixed: float,
+    total_assigned_hours: int,
+    multipliers: NDArray[numpy.float64],
+    target_initial: int | None = None,
+) -> FullTimeSolution:
+    """
+    Finds the teaching load per FTE that is consistent with the load of the full-time tasks it defines.
+
+    :param load_fte_misc: The misc. load per FTE fraction.
+    :param target_load_per_fte: The default teaching load per FTE, used if there's nothing to calculate from.
+    :param total_fte_fraction: The total FTE fraction of all staff.
+    :param total_hours_fixed: The total fixed teaching hours of all staff.
+    :param total_assigned_hours: The total load of all assignments that aren't to full-time tasks.
+    :param multipliers: The load multiplier of each assignment to a full-time task.
+    :param target_initial: The target to fall back to if there is no solution, defaults to the default load.
+    :return: The settled target, and the loads of the full-time assignments at that target.
+    """
+
+    def calculate_target(target: int) -> Tuple[int, NDArray[numpy.int64]]:
+        """
+        The target calculated from the totals, with the full-time tasks at a given target.
+
+        :param target: The target to calculate the full-time loads with.
+        :return: The new target, and the full-time loads used to calculate it.
+        """
+        loads: NDArray[numpy.int64] = numpy.trunc(target * multipliers).astype(numpy.int64)
+        total: int = total_assigned_hours + int(loads.sum())
+
+        if total_fte_fraction and total:
+            return int(load_fte_misc + (total - total_hours_fixed) / total_fte_fraction), loads
+        else:
+            return int(target_load_per_fte), loads
+
+    multiplier_total: float = float(multipliers.sum())
+    if total_fte_fraction and multiplier_total >= total_fte_fraction:
+        # The full-time posts are worth at least as many FTE as there are staff, so each cycle only grows the target.
+        logger.warning(f"Full-time tasks total {multiplier_total} FTE against {total_fte_fraction} FTE of staff; cannot settle the target.")
+        target: int = target_initial if target_initial is not None else int(target_load_per_fte)
+        return FullTimeSolution(target_load_per_fte=target, loads=calculate_target(target)[1], cycles=0, converged=False)
+
+    elif total_fte_fraction:
+        target = int((load_fte_misc * total_fte_fraction + total_assigned_hours - total_hours_fixed) / (total_fte_fraction - multiplier_total))
+
+    else:
+        target = int(target_load_per_fte)
+
+    # Truncating to whole hours makes the update a non-decreasing step function of the target,
+    # so iterating from near the solution moves monotonically onto a fixed point.
+    cycles: int = 0
+    while True:
+        cycles += 1
+        target_new, loads = calculate_target(target)
+
+        if target_new == target:
+            return FullTimeSolution(target_load_per_fte=target, loads=loads, cycles=cycles, converged=True)
+
+        elif cycles >= CYCLES_MAXIMUM:
+            logger.warning(f"Full-time load failed to settle after {cycles} cycles, stopping at {target}.")
+            return FullTimeSolution(target_load_per_fte=target, loads=loads, cycles=cycles, converged=False)
+
+        target = target_new
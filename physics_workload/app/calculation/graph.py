@@ -0,0 +1,130 @@
+"""
+Tracks which rows an edit can affect, so recalculation only needs to touch those.
+
+Loads depend on each other as:
+
+    LoadFunction -> Task -> Assignment -> Staff -> AcademicGroup
+    Unit ---------^
+    StandardLoad -> (every Task, via full-time and unit lead loads) and (every Staff, via the target per FTE)
+
+The target load per FTE depends on the total of all assignment loads, staff FTE fractions and fixed hours,
+so an edit only spreads to the whole department if it changes that target.
+"""
+
+from dataclasses import dataclass, field
+from logging import Logger, getLogger
+from typing import Any, Dict, Set
+
+from app.models import AcademicGroup, Assignment, LoadFunction, Staff, StandardLoad, Task, Unit
+from app.models.common import ModelCommon
+
+logger: Logger = getLogger(__name__)
+
+
+@dataclass
+class Subgraph:
+    """
+    The rows directly affected by an edit.
+
+    Assignments to the tasks, and staff on the assignments, are followed when the subgraph is loaded,
+    so only the rows that were edited (or deleted, and so can no longer be followed) need adding.
+
+    :attribute tasks: The tasks whose loads need recalculating, along with their assignments.
+    :attribute assignments: The assignments whose loads need recalculating.
+    :attribute staff: The staff whose loads need recalculating.
+    :attribute staff_all: If set, any staff member may be affected (e.g. after a bulk delete), so all are checked.
+    :attribute target: If set, the totals behind the target load per FTE may have changed, even if no loaded assignment has.
+    """
+
+    tasks: Set[int] = field(default_factory=set)
+    assignments: Set[int] = field(default_factory=set)
+    staff: Set[str] = field(default_factory=set)
+    staff_all: bool = False
+    target: bool = False
+
+    def __or__(self, other: "Subgraph") -> "Subgraph":
+        """
+        :param other: Another subgraph.
+        :return: A subgraph covering both.
+        """
+        return Subgraph(
+            tasks=self.tasks | other.tasks,
+            assignments=self.assignments | other.assignments,
+            staff=self.staff | other.staff,
+            staff_all=self.staff_all or other.staff_all,
+            target=self.target or other.target,
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        """
+        :return: The subgraph as a JSON-serialisable dict, e.g. for storing on a recalculation job.
+        """
+        return {
+            "tasks": sorted(self.tasks),
+            "assignments": sorted(self.assignments),
+            "staff": sorted(self.staff),
+            "staff_all": self.staff_all,
+            "target": self.target,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "Subgraph":
+        """
+        :param data: A subgraph, as output by `to_json`.
+        :return: The subgraph.
+        """
+        return cls(
+            tasks=set(data.get("tasks", [])),
+            assignments=set(data.get("assignments", [])),
+            staff=set(data.get("staff", [])),
+            staff_all=data.get("staff_all", False),
+            target=data.get("target", False),
+        )
+
+    @classmethod
+    def for_instance(cls, instance: ModelCommon, deleted: bool = False) -> "Subgraph | None":
+        """
+        Works out the subgraph affected by an edit to an instance.
+
+        For deletions, this needs calling *before* the instance is deleted, as afterwards its dependants can't be found.
+
+        :param instance: The instance that has been (or will be) created, edited or deleted.
+        :param deleted: Whether the instance is being deleted, which removes its load from the totals.
+        :return: The subgraph of rows affected, or None if the whole department is (or might be).
+        """
+        if isinstance(instance, StandardLoad):
+            return None
+
+        elif isinstance(instance, LoadFunction):
+            return cls(tasks=set(instance.task_set.values_list("pk", flat=True)))
+
+        elif isinstance(instance, Unit):
+            return cls(tasks=set(instance.task_set.values_list("pk", flat=True)))
+
+        elif isinstance(instance, Task):
+            # The staff are needed in case the task (and its assignments) are deleted.
+            return cls(
+                tasks={instance.pk},
+                staff=set(instance.assignment_set.values_list("staff_id", flat=True)),
+                target=deleted,
+            )
+
+        elif isinstance(instance, Assignment):
+            # Before an edit is saved, the database still has the staff member it's being moved from.
+            return cls(
+                assignments={instance.pk} if instance.pk else set(),
+                staff={instance.staff_id} | set(Assignment.objects.filter(pk=instance.pk).values_list("staff_id", flat=True)),
+                target=deleted,
+            )
+
+        elif isinstance(instance, Staff):
+            # Changing FTE fraction or fixed hours changes the totals behind the target.
+            return cls(staff={instance.pk}, target=True)
+
+        elif isinstance(instance, AcademicGroup):
+            return cls()
+
+        else:
+            # Safer to recalculate everything than to miss something.
+            logger.warning(f"Unknown dependencies for {type(instance)}, recalculating all loads.")
+            return None
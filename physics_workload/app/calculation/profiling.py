@@ -0,0 +1,179 @@
+"""
+Records how long each recalculation takes, and where the time goes.
+
+Each recalculation is timed as a series of phases (loading the department, calculating, writing back),
+counting the database queries run in each. The most recent profiles are kept in the cache, like the data version,
+so the diagnostics page shows them whichever process ran them (e.g. the background worker, or the
+`profile_recalculation` management command).
+"""
+
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from logging import Logger, getLogger
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.utils.timezone import now
+
+logger: Logger = getLogger(__name__)
+
+
+@dataclass
+class Phase:
+    """
+    A timed part of a recalculation.
+
+    :attribute name: What was being done, e.g. "load".
+    :attribute seconds: The wall-clock time taken.
+    :attribute queries: The number of database queries run.
+    """
+
+    name: str
+    seconds: float = 0.0
+    queries: int = 0
+
+
+@dataclass
+class Profile:
+    """
+    The timings of a recalculation.
+
+    :attribute label: What was recalculated, e.g. "affected loads".
+    :attribute started: When the recalculation started.
+    :attribute phases: The timed parts of the recalculation, in order.
+    :attribute seconds: The total wall-clock time taken.
+    :attribute queries: The total number of database queries run.
+    :attribute rows_written: The number of rows written back.
+    :attribute cycles: The number of cycles taken to settle the full-time equivalent load.
+    :attribute converged: Whether the full-time equivalent load settled.
+    """
+
+    label: str
+    started: datetime = field(default_factory=now)
+    phases: List[Phase] = field(default_factory=list)
+    seconds: float = 0.0
+    queries: int = 0
+    rows_written: int = 0
+    cycles: int = 0
+    converged: bool = True
+
+    def __str__(self) -> str:
+        phases: str = ", ".join(f"{phase.name} {phase.seconds:.3f}s/{phase.queries}q" for phase in self.phases)
+        return f"Recalculated {self.label} in {self.seconds:.3f}s, {self.queries} queries, {self.rows_written} rows written, {self.cycles} cycles ({phases})"
+
+    def to_json(self) -> Dict[str, Any]:
+        """
+        :return: The profile in a form that can be dumped to JSON.
+        """
+        data: Dict[str, Any] = asdict(self)
+        data["started"] = self.started.isoformat()
+        return data
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "Profile":
+        """
+        :param data: A profile, as output by `to_json`.
+        :return: The profile.
+        """
+        return cls(
+            **{
+                **data,
+                "started": datetime.fromisoformat(data["started"]),
+                "phases": [Phase(**phase) for phase in data["phases"]],
+            }
+        )
+
+
+class Profiler:
+    """
+    Times a recalculation, phase by phase, and records the profile once it's finished.
+
+    Used as a context manager around the whole recalculation, with `phase` around each part of it:
+
+        with Profiler("all loads") as profiler:
+            with profiler.phase("load"):
+                ...
+    """
+
+    def __init__(self, label: str):
+        """
+        :param label: What's being recalculated.
+        """
+        self.profile: Profile = Profile(label=label)
+        self._started: float = 0.0
+        self._stack: ExitStack = ExitStack()
+
+    def _count_query(self, execute: Callable, sql: str, params: Any, many: bool, context: Dict) -> Any:
+        """
+        Database execute wrapper that counts the queries run.
+        """
+        self.profile.queries += 1
+        return execute(sql, params, many, context)
+
+    def __enter__(self) -> "Profiler":
+        self.profile.started = now()
+        self._started = perf_counter()
+        self._stack.enter_context(connection.execute_wrapper(self._count_query))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stack.close()
+        self.profile.seconds = perf_counter() - self._started
+        if exc_type is None:
+            record_profile(self.profile)
+            logger.info(self.profile)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[Phase]:
+        """
+        Times a part of the recalculation.
+
+        :param name: What's being done.
+        :return: The phase, which is filled in when the context exits.
+        """
+        phase: Phase = Phase(name=name)
+        self.profile.phases.append(phase)
+        started: float = perf_counter()
+        queries: int = self.profile.queries
+        try:
+            yield phase
+        finally:
+            phase.seconds = perf_counter() - started
+            phase.queries = self.profile.queries - queries
+
+
+PROFILES_KEY: str = "recalculation_profiles"
+
+# Recording a profile reads the list from the cache then writes it back, so threads in the same process take turns.
+# Two processes recording at the same moment may lose one of them, which is fine for diagnostics.
+_profiles_lock: Lock = Lock()
+
+
+def record_profile(profile: Profile):
+    """
+    Keeps a profile, dropping the oldest if there are more than `RECALCULATION_PROFILE_HISTORY`.
+
+    :param profile: The profile of a finished recalculation.
+    """
+    with _profiles_lock:
+        profiles: List[Dict[str, Any]] = [profile.to_json()] + cache.get(PROFILES_KEY, [])
+        cache.set(PROFILES_KEY, profiles[: settings.RECALCULATION_PROFILE_HISTORY], timeout=None)
+
+
+def get_recent_profiles() -> List[Profile]:
+    """
+    :return: The most recent profiles, newest first.
+    """
+    return [Profile.from_json(data) for data in cache.get(PROFILES_KEY, [])]
+
+
+def clear_profiles():
+    """
+    Forgets all the recorded profiles.
+    """
+    cache.delete(PROFILES_KEY)
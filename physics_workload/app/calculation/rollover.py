@@ -0,0 +1,209 @@
+"""
+Rolls the department over into a new academic year, keeping a snapshot of the year that's ending.
+
+The snapshot is a historical record of every row, all stamped with the same date,
+plus a compact `YearSnapshot` of the loads that the history pages read each past year from.
+Rather than turning history on and saving every row in turn, the balances are worked out in the database with
+`UPDATE` statements, and the historical records are copied straight from the tables in bulk.
+
+It all happens in one transaction, so a rollover that's interrupted leaves the database as it was and can simply be run again.
+A year that's already been rolled over isn't rolled over a second time.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from logging import Logger, getLogger
+from typing import Callable, Dict, Iterator, List, Tuple, Type
+
+from django.contrib.auth.models import AbstractUser
+from django.db import transaction
+from django.db.models import Model, OuterRef, QuerySet, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils.timezone import localtime
+
+from app.calculation.balances import update_academic_group_balances, update_staff_balances
+from app.calculation.profiling import Profiler
+from app.calculation.unit_of_work import BATCH_SIZE
+from app.models import AcademicGroup, Assignment, LoadFunction, Staff, StandardLoad, Task, Unit, YearSnapshot, bump_data_version
+
+logger: Logger = getLogger(__name__)
+
+# The models snapshotted, in the order they're written.
+SNAPSHOT_MODELS: List[Type[Model]] = [StandardLoad, Staff, Assignment, Task, Unit, LoadFunction, AcademicGroup]
+
+# Called with the model being snapshotted, the number of its rows done so far, and its total.
+Progress = Callable[[str, int, int], None]
+
+
+def log_progress(name: str, done: int, total: int):
+    """
+    Default progress report, which just logs it.
+
+    :param name: The model being snapshotted.
+    :param done: The number of rows done so far.
+    :param total: The number of rows in total.
+    """
+    logger.info(f"Snapshotted {done}/{total} {name} rows.")
+
+
+@dataclass
+class RolloverResult:
+    """
+    Summary of a rollover.
+
+    :attribute year: The year that was ended.
+    :attribute snapshotted: The number of historical records written, for each model.
+    """
+
+    year: int
+    snapshotted: Dict[str, int]
+
+
+class RolloverError(Exception):
+    """
+    Raised when the department can't be rolled over into the new year.
+    """
+
+
+def iterate_rows(queryset: QuerySet, fields: List[str]) -> Iterator[List[Tuple]]:
+    """
+    :param queryset: The rows to read.
+    :param fields: The columns to read.
+    :return: The values of the rows, in batches.
+    """
+    batch: List[Tuple] = []
+    for row in queryset.values_list(*fields).iterator(chunk_size=BATCH_SIZE):
+        batch.append(row)
+        if len(batch) == BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def snapshot(
+    model: Type[Model],
+    history_date: datetime,
+    change_reason: str,
+    user: AbstractUser | None = None,
+    queryset: QuerySet | None = None,
+    progress: Progress = log_progress,
+) -> int:
+    """
+    Writes a historical record of every row of a model, as it is in the database, in bulk.
+
+    Unlike `bulk_history_create`, this writes the records whether history is turned on or not,
+    and reads the rows as plain values rather than loading them as instances.
+
+    :param model: The model to snapshot.
+    :param history_date: The date to give the historical records.
+    :param change_reason: The reason to give the historical records.
+    :param user: The user to record as making the change.
+    :param queryset: The rows to snapshot, defaults to all of them.
+    :param progress: Called after each batch of rows is written.
+    :return: The number of historical records written.
+    """
+    history_model: Type[Model] = model.history.model
+    fields: List[str] = [field.attname for field in history_model.tracked_fields]
+    if queryset is None:
+        queryset = model.objects.all()
+
+    total: int = queryset.count()
+    done: int = 0
+    for rows in iterate_rows(queryset.order_by("pk"), fields):
+        history_model.objects.bulk_create(
+            [
+                history_model(
+                    history_date=history_date,
+                    history_type="~",
+                    history_change_reason=change_reason,
+                    history_user=user,
+                    **dict(zip(fields, row)),
+                )
+                for row in rows
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        done += len(rows)
+        progress(model.__name__, done, total)
+
+    return done
+
+
+def roll_over_year(
+    standard_load_new: StandardLoad,
+    user: AbstractUser | None = None,
+    history_date: datetime | None = None,
+    progress: Progress = log_progress,
+) -> RolloverResult:
+    """
+    Ends the current year, snapshotting every model, then starts the new year.
+
+    The final balance of each staff member and academic group is recorded in the snapshot,
+    then added to their historic balance and reset for the new year. Assignments are marked as provisional,
+    and the new standard load saved. The loads aren't recalculated against the new standard load; that's up to the caller.
+
+    :param standard_load_new: The unsaved standard load for the new year.
+    :param user: The user rolling the year over.
+    :param history_date: The date to record the snapshot as taken, defaults to now.
+    :param progress: Called as each model is snapshotted.
+    :raises RolloverError: If the new year already exists, e.g. if it's been rolled over already.
+    :return: A summary of the rollover.
+    """
+    if history_date is None:
+        history_date = localtime()
+
+    with Profiler("year rollover") as profiler, transaction.atomic():
+        standard_load_old: StandardLoad = StandardLoad.objects.select_for_update().latest()
+        if StandardLoad.objects.filter(year__gte=standard_load_new.year).exists():
+            raise RolloverError(f"The year {standard_load_new.year} already exists, so {standard_load_old.year} has already been rolled over.")
+
+        change_reason: str = f"End of {standard_load_old}"
+        logger.info(f"Rolling over from {standard_load_old} to {standard_load_new}.")
+
+        # ==== FINAL BALANCES ====
+        with profiler.phase("balances"):
+            update_staff_balances()
+            update_academic_group_balances()
+
+        # ==== SNAPSHOT ====
+        with profiler.phase("snapshot"):
+            snapshotted: Dict[str, int] = {
+                model.__name__: snapshot(
+                    model,
+                    history_date,
+                    change_reason,
+                    user=user,
+                    queryset=StandardLoad.objects.filter(pk=standard_load_old.pk) if model is StandardLoad else None,
+                    progress=progress,
+                )
+                for model in SNAPSHOT_MODELS
+            }
+            YearSnapshot.take(standard_load_old, history_date)
+
+        # ==== NEW YEAR ====
+        with profiler.phase("reset"):
+            standard_load_new.save()
+
+            for model in (Staff, AcademicGroup):
+                model.objects.update(
+                    load_balance_historic=Coalesce(
+                        Subquery(
+                            model.history.filter(**{model._meta.pk.attname: OuterRef("pk")})
+                            .values(model._meta.pk.attname)
+                            .annotate(total=Sum("load_balance_final"))
+                            .values("total")
+                        ),
+                        Value(0),
+                    ),
+                    load_balance_final=0,
+                )
+
+            Assignment.objects.update(is_provisional=True)
+            # The updates don't send the save signals, so the cached pages need telling directly.
+            bump_data_version()
+
+        profiler.profile.rows_written = sum(snapshotted.values())
+
+    logger.info(f"Rolled over from {standard_load_old} to {standard_load_new}, writing {sum(snapshotted.values())} historical records.")
+    return RolloverResult(year=standard_load_old.year, snapshotted=snapshotted)
@@ -0,0 +1,119 @@
+"""
+Collects the changes made during a recalculation, and writes them back in bulk.
+
+Saving each instance separately costs a query (and on SQLite, a write to disk) per row,
+fires the model's save signals, and writes a historical record per row if history is enabled.
+Instead, changed instances are registered with a unit of work, then flushed with one
+`bulk_update` per model inside a single transaction, with their historical records created in bulk.
+Changes to nothing but a model's `DYNAMIC_FIELDS`, as the recalculation makes, don't get historical records.
+"""
+
+from datetime import datetime
+from logging import Logger, getLogger
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple, Type
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Model
+from simple_history.utils import bulk_update_with_history
+
+from app.models.common import defer_history
+from app.models.data_version import bump_data_version
+
+logger: Logger = getLogger(__name__)
+
+BATCH_SIZE: int = 500
+
+
+class UnitOfWork:
+    """
+    The instances changed by a recalculation, and which of their fields have changed.
+
+    Instances are kept per model, in the order the models were first registered,
+    so they're written back in dependency order.
+    """
+
+    def __init__(self, history_date: datetime | None = None, change_reason: str = "Recalculated loads"):
+        """
+        :param history_date: The date to give historical records, defaults to when they're written.
+        :param change_reason: The reason to give historical records.
+        """
+        self.history_date: datetime | None = history_date
+        self.change_reason: str = change_reason
+        self.changes: Dict[Type[Model], Dict[object, Tuple[Model, Set[str]]]] = {}
+
+    def __len__(self) -> int:
+        """
+        :return: The number of instances waiting to be written back.
+        """
+        return sum(len(changes) for changes in self.changes.values())
+
+    def register(self, instance: Model, fields: Iterable[str]) -> None:
+        """
+        Registers an instance as changed. If it's already registered, the changes are merged.
+
+        The instance only needs its primary key and the changed fields set,
+        as only those fields are written back.
+
+        :param instance: The changed instance.
+        :param fields: The names of the fields that have changed.
+        """
+        changes: Dict[object, Tuple[Model, Set[str]]] = self.changes.setdefault(type(instance), {})
+
+        if instance.pk in changes:
+            registered, registered_fields = changes[instance.pk]
+            for name in fields:
+                setattr(registered, name, getattr(instance, name))
+                registered_fields.add(name)
+        else:
+            changes[instance.pk] = (instance, set(fields))
+
+    def flush(self) -> Dict[Type[Model], int]:
+        """
+        Writes back every registered instance in one transaction, then clears them.
+
+        :return: The number of rows updated, for each model.
+        """
+        history_enabled: bool = getattr(settings, "SIMPLE_HISTORY_ENABLED", True)
+        updated: Dict[Type[Model], int] = {}
+
+        with transaction.atomic():
+            for model, changes in self.changes.items():
+                # Instances with different changed fields can't share a `bulk_update`, or they'd overwrite each other's fields.
+                batches: Dict[FrozenSet[str], List[Model]] = {}
+                for instance, fields in changes.values():
+                    batches.setdefault(frozenset(fields), []).append(instance)
+
+                updated[model] = 0
+                for fields, instances in batches.items():
+                    # If history is suspended, the records are written when it's resumed instead.
+                    if (
+                        history_enabled
+                        and not fields <= set(getattr(model, "DYNAMIC_FIELDS", []))
+                        and not defer_history(model, [instance.pk for instance in instances])
+                    ):
+                        # Historical records are a copy of the whole row, so the unchanged fields are needed too.
+                        rows: Dict[object, Model] = model.objects.in_bulk([instance.pk for instance in instances])
+                        for instance in instances:
+                            if row := rows.get(instance.pk):
+                                for name in fields:
+                                    setattr(row, name, getattr(instance, name))
+
+                        updated[model] += bulk_update_with_history(
+                            list(rows.values()),
+                            model,
+                            sorted(fields),
+                            batch_size=BATCH_SIZE,
+                            default_change_reason=self.change_reason,
+                            default_date=self.history_date,
+                        )
+                    else:
+                        updated[model] += model.objects.bulk_update(instances, sorted(fields), batch_size=BATCH_SIZE)
+
+            # Bulk updates don't send the save signals, so the cached pages need telling directly.
+            if self.changes:
+                bump_data_version()
+
+        logger.debug(f"Flushed {len(self)} changed instances across {len(updated)} models.")
+        self.changes.clear()
+        return updated
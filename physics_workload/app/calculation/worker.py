@@ -0,0 +1,98 @@
+"""
+Runs recalculations in a background thread, so edits don't wait for them.
+
+Edits queue a `RecalculationJob` in the database rather than recalculating in the request.
+A worker thread in each process waits a moment for any burst of edits to finish (they're merged into the same job),
+then claims and runs the job. As the queue is in the database, it works across processes without a separate broker,
+and jobs queued by a process that stopped before running them are picked up by the next worker to poll.
+"""
+
+from logging import Logger, getLogger
+from threading import Event, Lock, Thread
+from time import sleep
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from app.calculation.engine import recalculate_loads
+from app.calculation.graph import Subgraph
+from app.models import RecalculationJob
+
+logger: Logger = getLogger(__name__)
+
+_wake: Event = Event()
+_thread: Thread | None = None
+_thread_lock: Lock = Lock()
+
+
+def queue_recalculation(subgraph: Subgraph | None):
+    """
+    Queues a recalculation of the loads affected by an edit.
+
+    If background recalculation is turned off (`RECALCULATION_IN_BACKGROUND`), it's run straight away instead.
+
+    :param subgraph: The rows affected by the edit, or None for everything.
+    """
+    if not settings.RECALCULATION_IN_BACKGROUND:
+        recalculate_loads(subgraph)
+        return
+
+    RecalculationJob.queue(subgraph)
+    start_worker()
+    # If the edit is part of a transaction, the worker can't see it (or the job) until it's committed.
+    transaction.on_commit(_wake.set)
+
+
+def start_worker():
+    """
+    Starts the worker thread for this process, if it's not already running.
+    """
+    global _thread
+
+    with _thread_lock:
+        if _thread is None or not _thread.is_alive():
+            _thread = Thread(target=run_worker, name="recalculation-worker", daemon=True)
+            _thread.start()
+
+
+def run_worker():
+    """
+    Waits to be woken by an edit (or polls, for edits from other processes), then runs any pending jobs.
+
+    Each time, whether the loads are stale is flagged afresh, in case it was lost to another process flagging it at the same time.
+    """
+    logger.info("Started recalculation worker.")
+    while True:
+        _wake.wait(timeout=settings.RECALCULATION_POLL_INTERVAL)
+        _wake.clear()
+
+        # Give any burst of edits the chance to merge into the job before it's claimed.
+        sleep(settings.RECALCULATION_DELAY)
+        try:
+            while run_pending_job():
+                pass
+            RecalculationJob.update_stale()
+        except Exception:
+            logger.exception("Recalculation worker failed to run jobs.")
+        finally:
+            close_old_connections()
+
+
+def run_pending_job() -> bool:
+    """
+    Claims and runs the oldest pending job.
+
+    :return: True if a job was run, False if there was nothing to do.
+    """
+    job: RecalculationJob | None = RecalculationJob.claim()
+    if not job:
+        return False
+
+    try:
+        recalculate_loads(job.get_subgraph())
+    except Exception as error:
+        job.fail(error)
+    else:
+        job.finish()
+
+    return True
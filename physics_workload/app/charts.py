@@ -0,0 +1,101 @@
+"""
+Charts drawn in the browser by plotly.js, from series the page they're on serves as JSON.
+
+Each chart is a `div` saying what kind of chart it is, where to fetch its series from, and how to lay it out;
+`static/js/charts.js` fetches the series and draws it. The series are served by an endpoint on the page,
+so they're only worked out when the chart asks for them, and are cached by the browser like the page is.
+"""
+
+import json
+from functools import cache
+from typing import Any, Dict, List
+
+import plotly.io
+from dash_bootstrap_templates import load_figure_template
+from iommi import Fragment, Header, html
+
+from app.models import AcademicGroup, LoadFunction, Staff, StandardLoad, YearSnapshot
+
+# The endpoint on the page that serves a chart's series.
+CHART_ENDPOINT: str = "chart"
+
+
+@cache
+def get_template() -> Dict[str, Any]:
+    """
+    :return: The layout of the dark Bootstrap theme for plotly, as used throughout the site.
+    """
+    load_figure_template("bootstrap_dark")
+    return plotly.io.templates["bootstrap_dark"].layout.to_plotly_json()
+
+
+def chart(kind: str, x_title: str, y_title: str, is_fixed: bool = False, **kwargs: Any) -> Fragment:
+    """
+    Creates a chart, drawn in the browser from the series served by the page's chart endpoint.
+
+    :param kind: The kind of chart, which says how `charts.js` draws the series.
+    :param x_title: The title of the x-axis.
+    :param y_title: The title of the y-axis.
+    :param is_fixed: Whether the chart is fixed, rather than being able to be zoomed and panned, and has no margin.
+    :param kwargs: Any other options for the fragment, e.g. `include`.
+    :return: The chart.
+    """
+    layout: Dict[str, Any] = dict(
+        template=dict(layout=get_template()),
+        xaxis=dict(title=dict(text=x_title), fixedrange=is_fixed),
+        yaxis=dict(title=dict(text=y_title), fixedrange=is_fixed),
+    )
+    if is_fixed:
+        layout["margin"] = dict(l=0, r=0, b=0, t=0, pad=0)
+
+    return html.div(
+        attrs={
+            "data-chart": kind,
+            "data-chart-url": f"?/{CHART_ENDPOINT}",
+            "data-chart-layout": json.dumps(layout),
+            "data-chart-config": json.dumps(dict(displayModeBar=not is_fixed)),
+        },
+        **kwargs,
+    )
+
+
+def balance_chart() -> Fragment:
+    """
+    :return: A chart of the load balance of a staff member or academic group each year, under a header.
+    """
+    return html.div(
+        attrs__class={"mt-4": True},
+        children=dict(
+            header=Header("Load Balance"),
+            graph=chart("balance", x_title="Date", y_title="Load balance (hours)", is_fixed=True),
+        ),
+    )
+
+
+def get_balance_series(instance: Staff | AcademicGroup) -> Dict[str, List]:
+    """
+    Gets the load balance of a staff member or academic group this year and at the end of each past year.
+
+    :param instance: The staff member or academic group.
+    :return: The years, oldest first, with the balance for each year alone and as the running total.
+    """
+    # Labelled by the standard load, as the past years are, rather than the date, which is a year behind in the autumn.
+    dates: List[str] = [f"{StandardLoad.objects.latest()}"]
+    balance_yearly: List[float] = [instance.get_load_balance()]
+    balance_cumulative: List[float] = [instance.get_load_balance() + instance.load_balance_historic]
+
+    for instance_historic in YearSnapshot.get_history(type(instance), instance.pk):
+        dates.append(f"{instance_historic.snapshot}")
+        balance_yearly.append(instance_historic.load_balance_final)
+        balance_cumulative.append(instance_historic.load_balance_final + instance_historic.load_balance_historic)
+
+    return dict(dates=dates[::-1], yearly=balance_yearly[::-1], cumulative=balance_cumulative[::-1])
+
+
+def get_load_function_series(load_function: LoadFunction) -> Dict[str, List]:
+    """
+    :param load_function: The load function, which must have a plot range.
+    :return: The number of students across the plot range, and the load hours for each.
+    """
+    students: List[int] = list(range(load_function.plot_minimum, load_function.plot_maximum + 1))
+    return dict(students=students, hours=load_function.evaluate_batch(students).tolist())
@@ -0,0 +1,22 @@
+from typing import Dict
+
+from django.http import HttpRequest
+from django.utils.functional import SimpleLazyObject
+
+from app.models import RecalculationJob
+
+
+def recalculation_status(request: HttpRequest) -> Dict[str, bool | SimpleLazyObject]:
+    """
+    Flags whether the loads shown are out of date, as edits are still being recalculated.
+
+    The check is lazy, as every template rendered with the request gets this context, including each table cell;
+    it's only made if a template actually looks at the flag.
+
+    :param request: The current request.
+    :return: The template context, with `loads_stale` set if there are recalculations pending.
+    """
+    if not request.user.is_authenticated:
+        return {"loads_stale": False}
+
+    return {"loads_stale": SimpleLazyObject(RecalculationJob.is_stale)}
@@ -0,0 +1,265 @@
+"""
+Compiles load function expressions once, so they can be evaluated repeatedly without re-parsing.
+
+Expressions are evaluated using `simpleeval`, which walks the parsed tree rather than running Python code.
+Parsing is the expensive part, and `simpleeval` only finds unsupported syntax as it walks the tree,
+so each expression is parsed and checked up front and the result cached against the load function.
+Expressions that only do arithmetic on the variables can then be evaluated over whole NumPy arrays at once.
+"""
+
+import ast
+from logging import Logger, getLogger
+from threading import Lock
+from typing import Callable, Dict, Iterable, List, Set, Tuple, Type
+
+import numpy
+from numpy.typing import NDArray
+from simpleeval import DEFAULT_FUNCTIONS, DEFAULT_NAMES, MAX_POWER, FeatureNotAvailable, NameNotDefined, SimpleEval
+
+logger: Logger = getLogger(__name__)
+
+# The variables an expression can use: students, lectures and exams.
+NAMES: Set[str] = {"s", "l", "e"}
+
+# Equivalents of the `simpleeval` operators and functions that work element-wise on arrays.
+# Expressions using anything else (e.g. strings, or random numbers) are evaluated one value at a time.
+ARRAY_OPERATORS: Dict[Type[ast.AST], Callable] = {
+    ast.Add: numpy.add,
+    ast.Sub: numpy.subtract,
+    ast.Mult: numpy.multiply,
+    ast.Div: numpy.true_divide,
+    ast.FloorDiv: numpy.floor_divide,
+    ast.Mod: numpy.mod,
+    ast.Pow: lambda base, exponent: numpy.where(
+        (numpy.abs(base) > MAX_POWER) | (numpy.abs(exponent) > MAX_POWER),
+        numpy.nan,
+        numpy.power(base, exponent),
+    ),
+    ast.USub: numpy.negative,
+    ast.UAdd: numpy.positive,
+    ast.Not: numpy.logical_not,
+    ast.Eq: numpy.equal,
+    ast.NotEq: numpy.not_equal,
+    ast.Gt: numpy.greater,
+    ast.Lt: numpy.less,
+    ast.GtE: numpy.greater_equal,
+    ast.LtE: numpy.less_equal,
+}
+ARRAY_FUNCTIONS: Dict[str, Callable] = {
+    "int": numpy.trunc,
+    "float": lambda value: numpy.asarray(value, dtype=numpy.float64),
+}
+
+
+class CompiledExpression:
+    """
+    A load function expression that has been parsed and checked, ready to evaluate.
+    """
+
+    def __init__(self, expression: str):
+        """
+        :param expression: The expression, in `simpleeval` syntax.
+        :raises SyntaxError: If the expression isn't valid Python syntax.
+        :raises FeatureNotAvailable: If the expression uses syntax `simpleeval` doesn't support.
+        :raises NameNotDefined: If the expression uses a name that isn't a variable or function.
+        """
+        self.expression: str = expression
+        self.tree: ast.AST = SimpleEval.parse(expression)
+        self.validate()
+
+        self.names: Set[str] = {node.id for node in ast.walk(self.tree) if isinstance(node, ast.Name)} & NAMES
+        self.vectorizable: bool = self._is_vectorizable(self.tree)
+
+    def validate(self):
+        """
+        Checks every node in the expression against what `simpleeval` will evaluate.
+
+        :raises FeatureNotAvailable: If the expression uses syntax `simpleeval` doesn't support.
+        :raises NameNotDefined: If the expression uses a name that isn't a variable or function.
+        """
+        evaluator: SimpleEval = SimpleEval()
+        for node in ast.walk(self.tree):
+            if isinstance(node, (ast.operator, ast.unaryop, ast.cmpop, ast.boolop)):
+                if type(node) not in evaluator.operators:
+                    raise FeatureNotAvailable(f"Sorry, {type(node).__name__} is not available in this evaluator")
+
+            elif isinstance(node, ast.Name):
+                if node.id not in NAMES | DEFAULT_NAMES.keys() | DEFAULT_FUNCTIONS.keys():
+                    raise NameNotDefined(node.id, self.expression)
+
+            elif type(node) not in evaluator.nodes and not isinstance(node, (ast.expr_context, ast.keyword)):
+                raise FeatureNotAvailable(f"Sorry, {type(node).__name__} is not available in this evaluator")
+
+    def evaluate(self, names: Dict[str, float]) -> float:
+        """
+        :param names: The values of the variables.
+        :raises NameNotDefined: If the expression uses a variable that isn't given.
+        :return: The value of the expression.
+        """
+        return SimpleEval(names=names).eval(self.expression, previously_parsed=self.tree)
+
+    def evaluate_batch(
+        self,
+        students: Iterable[int | None],
+        lectures: Iterable[int | None] | None = None,
+        exams: Iterable[int | None] | None = None,
+    ) -> NDArray[numpy.float64]:
+        """
+        Evaluates the expression for many sets of variables.
+
+        As with `LoadFunction.evaluate`, a variable with no value (or no students) is left undefined,
+        and if no variables are defined the load is zero.
+
+        Where possible, the expression is evaluated element-wise over NumPy arrays in one go.
+        Rows that can't be (e.g. ones missing a variable, or that divide by zero) are evaluated one at a time,
+        so they give the same results and errors as `evaluate`.
+
+        :param students: The number of students, `s`.
+        :param lectures: The number of lectures, `l`, if the load is for a unit.
+        :param exams: The number of exams, `e`, if the load is for a unit.
+        :raises NameNotDefined: If the expression uses a variable that isn't given.
+        :return: The value of the expression for each set of variables.
+        """
+        students = [value if value else None for value in students]
+        lectures = list(lectures) if lectures is not None else [None] * len(students)
+        exams = list(exams) if exams is not None else [None] * len(students)
+        columns: Dict[str, List[int | None]] = {"s": students, "l": lectures, "e": exams}
+
+        loads: NDArray[numpy.float64] = numpy.zeros(len(students))
+        remaining: NDArray[numpy.int64] = numpy.arange(len(students))
+
+        if self.vectorizable and len(students):
+            defined: Dict[str, NDArray[numpy.bool_]] = {
+                name: numpy.array([value is not None for value in column]) for name, column in columns.items()
+            }
+            rows: NDArray[numpy.int64] = numpy.flatnonzero(
+                numpy.logical_and.reduce([defined[name] for name in self.names] + [defined["s"] | defined["l"] | defined["e"]])
+            )
+            arrays: Dict[str, NDArray[numpy.float64]] = {
+                name: numpy.array([columns[name][row] for row in rows], dtype=numpy.float64) for name in self.names
+            }
+
+            with numpy.errstate(all="ignore"):
+                values: NDArray[numpy.float64] = numpy.broadcast_to(self._evaluate_array(self.tree, arrays), rows.shape).astype(numpy.float64)
+
+            finite: NDArray[numpy.bool_] = numpy.isfinite(values)
+            loads[rows[finite]] = values[finite]
+            remaining = numpy.setdiff1d(remaining, rows[finite])
+
+        evaluator: SimpleEval = SimpleEval()
+        evaluated: Dict[Tuple, float] = {}
+        for row in remaining:
+            key: Tuple = (students[row], lectures[row], exams[row])
+            if key not in evaluated:
+                names: Dict[str, float] = {name: value for name, value in zip(("s", "l", "e"), key) if value is not None}
+                if names:
+                    evaluator.names = names
+                    evaluated[key] = evaluator.eval(self.expression, previously_parsed=self.tree)
+                else:
+                    evaluated[key] = 0
+
+            loads[row] = evaluated[key]
+
+        return loads
+
+    def _is_vectorizable(self, node: ast.AST) -> bool:
+        """
+        :param node: The node of the expression to check.
+        :return: Whether the node, and all below it, can be evaluated over NumPy arrays.
+        """
+        if isinstance(node, ast.Expr):
+            return self._is_vectorizable(node.value)
+        elif isinstance(node, ast.Constant):
+            return isinstance(node.value, (int, float))
+        elif isinstance(node, ast.Name):
+            return node.id in NAMES
+        elif isinstance(node, ast.BinOp):
+            return type(node.op) in ARRAY_OPERATORS and self._is_vectorizable(node.left) and self._is_vectorizable(node.right)
+        elif isinstance(node, ast.UnaryOp):
+            return type(node.op) in ARRAY_OPERATORS and self._is_vectorizable(node.operand)
+        elif isinstance(node, ast.Compare):
+            return all(type(op) in ARRAY_OPERATORS for op in node.ops) and all(
+                self._is_vectorizable(child) for child in [node.left] + node.comparators
+            )
+        elif isinstance(node, ast.IfExp):
+            return all(self._is_vectorizable(child) for child in (node.test, node.body, node.orelse))
+        elif isinstance(node, ast.Call):
+            return (
+                isinstance(node.func, ast.Name)
+                and node.func.id in ARRAY_FUNCTIONS
+                and len(node.args) == 1
+                and not node.keywords
+                and self._is_vectorizable(node.args[0])
+            )
+        else:
+            return False
+
+    def _evaluate_array(self, node: ast.AST, arrays: Dict[str, NDArray[numpy.float64]]) -> NDArray | float:
+        """
+        Evaluates a node of the expression element-wise, mirroring how `simpleeval` evaluates it for single values.
+
+        :param node: The node of the expression, which must be vectorizable.
+        :param arrays: The values of the variables.
+        :return: The values of the node.
+        """
+        if isinstance(node, ast.Expr):
+            return self._evaluate_array(node.value, arrays)
+        elif isinstance(node, ast.Constant):
+            return float(node.value)
+        elif isinstance(node, ast.Name):
+            return arrays[node.id]
+        elif isinstance(node, ast.BinOp):
+            return ARRAY_OPERATORS[type(node.op)](self._evaluate_array(node.left, arrays), self._evaluate_array(node.right, arrays))
+        elif isinstance(node, ast.UnaryOp):
+            return ARRAY_OPERATORS[type(node.op)](self._evaluate_array(node.operand, arrays))
+        elif isinstance(node, ast.Compare):
+            # Chained comparisons, e.g. 10 < s < 20, are true where every comparison is.
+            left = self._evaluate_array(node.left, arrays)
+            result = True
+            for op, comparator in zip(node.ops, node.comparators):
+                right = self._evaluate_array(comparator, arrays)
+                result = numpy.logical_and(result, ARRAY_OPERATORS[type(op)](left, right))
+                left = right
+            return result
+        elif isinstance(node, ast.IfExp):
+            return numpy.where(
+                self._evaluate_array(node.test, arrays),
+                self._evaluate_array(node.body, arrays),
+                self._evaluate_array(node.orelse, arrays),
+            )
+        else:
+            return ARRAY_FUNCTIONS[node.func.id](self._evaluate_array(node.args[0], arrays))
+
+
+# Compiled expressions, by load function primary key and expression hash.
+_cache: Dict[Tuple[int | None, int], CompiledExpression] = {}
+_cache_lock: Lock = Lock()
+
+
+def get_compiled_expression(pk: int | None, expression: str) -> CompiledExpression:
+    """
+    Gets the compiled version of a load function's expression, compiling it if it's not been seen before.
+
+    :param pk: The primary key of the load function.
+    :param expression: The load function's expression.
+    :return: The compiled expression.
+    """
+    key: Tuple[int | None, int] = (pk, hash(expression))
+    if compiled := _cache.get(key):
+        return compiled
+
+    compiled = CompiledExpression(expression)
+    with _cache_lock:
+        _cache[key] = compiled
+    return compiled
+
+
+def invalidate_compiled_expression(pk: int | None):
+    """
+    Removes any compiled expressions for a load function, e.g. when it's been edited.
+
+    :param pk: The primary key of the load function.
+    """
+    with _cache_lock:
+        for key in [key for key in _cache if key[0] == pk]:
+            del _cache[key]
@@ -0,0 +1,43 @@
+from pathlib import Path
+from typing import Any, Iterator, List, Tuple
+
+import plotly
+from django.contrib.staticfiles.finders import BaseFinder
+from django.core.files.storage import FileSystemStorage
+
+
+class PlotlyFinder(BaseFinder):
+    """
+    Finds the plotly.js bundle that comes with the installed plotly package, so it can be served as a static file.
+
+    The charts on the history and load function pages are drawn with it, so it matches the version that made them.
+
+    :attribute PATH: The static path the bundle is served at.
+    """
+
+    PATH: str = "js/plotly.min.js"
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.storage: FileSystemStorage = FileSystemStorage(location=Path(plotly.__file__).parent / "package_data")
+        # Collected into the same directory it's served from.
+        self.storage.prefix = str(Path(self.PATH).parent)
+
+    def check(self, **kwargs: Any) -> List:
+        return []
+
+    def find(self, path: str, find_all: bool = False, **kwargs: Any) -> str | List[str] | None:
+        """
+        :param path: The static path to find.
+        :param find_all: Whether to return every match, rather than the first.
+        :return: The absolute path of the bundle, if it's the path being looked for.
+        """
+        matches: List[str] = [self.storage.path(Path(self.PATH).name)] if path == self.PATH else []
+        return matches if find_all else next(iter(matches), None)
+
+    def list(self, ignore_patterns: List[str]) -> Iterator[Tuple[str, FileSystemStorage]]:
+        """
+        :param ignore_patterns: Patterns of paths to skip; the bundle is never skipped.
+        :return: The bundle's path within the package, and the storage it's in.
+        """
+        yield Path(self.PATH).name, self.storage
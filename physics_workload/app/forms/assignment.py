@@ -2,8 +2,8 @@ from logging import Logger, getLogger
 
 from iommi import Field, Form
 
+from app.calculation import Subgraph, queue_recalculation
 from app.models import Assignment
-from app.utility import update_all_loads
 
 logger: Logger = getLogger(__name__)
 
@@ -49,9 +49,16 @@ class AssignmentTaskUniqueForm(Form):
         @staticmethod
         def extra__on_delete(instance, **_):
             logger.info(f"Deleting assignment {instance}")
-            update_all_loads()
+            subgraph: Subgraph = Subgraph.for_instance(instance, deleted=True)
+            instance.delete()
+            queue_recalculation(subgraph)
+
+        @staticmethod
+        def extra__pre_save(form, instance, **_):
+            # Before saving, so the staff member the assignment may be moving from can still be found.
+            form.extra.subgraph = Subgraph.for_instance(instance)
 
         @staticmethod
         def extra__on_save(form, instance, **_):
             logger.info(f"Editing assignment {instance}, as {form.extra.crud_type}")
-            update_all_loads()
+            queue_recalculation(form.extra.subgraph | Subgraph.for_instance(instance))
@@ -1,12 +1,12 @@
 from logging import Logger, getLogger
 
 from iommi import Form
-from simpleeval import simple_eval
 
 from app.assets import mathjax_js
+from app.calculation import Subgraph, queue_recalculation
+from app.expression import CompiledExpression
 from app.models import LoadFunction
 from app.style import floating_fields_style
-from app.utility import update_all_loads
 
 logger: Logger = getLogger(__name__)
 
@@ -42,7 +42,7 @@ class LoadFunctionForm(Form):
             :return: True/False, and then the reason why it failed if false.
             """
             try:
-                simple_eval(parsed_data, names={"s": 1})
+                CompiledExpression(parsed_data).evaluate({"s": 1})
             except Exception as e:
                 return False, f"{e}"
 
@@ -58,7 +58,4 @@ class LoadFunctionForm(Form):
         @staticmethod
         def extra__on_save(form, instance, **_):
             logger.info(f"Editing load function {instance}, as {form.extra.crud_type}")
-
-            if any(task.update_load() for task in instance.task_set.all()):
-                logger.info("Load function changes require recalculation of global load target.")
-                update_all_loads()
+            queue_recalculation(Subgraph.for_instance(instance))
@@ -2,9 +2,9 @@ from logging import Logger, getLogger
 
 from iommi import Form
 
+from app.calculation import Subgraph, queue_recalculation
 from app.models import Staff
 from app.style import floating_fields_style
-from app.utility import update_all_loads
 
 logger: Logger = getLogger(__name__)
 
@@ -28,12 +28,11 @@ class StaffForm(Form):
         @staticmethod
         def extra__on_delete(instance, **_):
             logger.info(f"Deleting staff member {instance}")
+            subgraph: Subgraph = Subgraph.for_instance(instance, deleted=True)
             instance.delete()
-            update_all_loads()
+            queue_recalculation(subgraph)
 
         @staticmethod
         def extra__on_save(form, instance, **_):
             logger.info(f"Editing staff member {instance}, as {form.extra.crud_type}")
-            if instance.update_load_target():
-                logger.info("Staff changes require recalculation of global load target.")
-                update_all_loads()
+            queue_recalculation(Subgraph.for_instance(instance))
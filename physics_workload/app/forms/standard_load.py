@@ -1,14 +1,11 @@
-from datetime import datetime
 from logging import Logger, getLogger
 
-from django.conf import settings
-from django.db.models import Sum
 from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
-from django.utils.timezone import localtime
 from iommi import Form
 
 from app.assets import mathjax_js
-from app.models import AcademicGroup, Assignment, LoadFunction, Staff, StandardLoad, Task, Unit
+from app.calculation.rollover import RolloverError, roll_over_year
+from app.models import StandardLoad
 from app.style import floating_fields_style, horizontal_fields_style
 from app.utility import update_all_loads
 
@@ -109,66 +106,14 @@ class StandardLoadFormNewYear(Form):
 
             logger.debug("Submitted standard load form for new year successfully, so saving a timestamped version of all models.")
 
-            # Get the new standard load form the form
+            # Get the new standard load from the form, then snapshot the end of this year and start the new one.
             standard_load_new: StandardLoad = form.instance
-
-            # ------------------------------------------------------------------
-            # Save a timestamped version of all of the end-of-year models
-            # ------------------------------------------------------------------
-            settings.SIMPLE_HISTORY_ENABLED = True
-            current_date: datetime = localtime()
-
-            standard_load_old: StandardLoad = StandardLoad.objects.get(pk=standard_load_new.pk)
-            standard_load_old._history_date = current_date
-            standard_load_old.save()
-
-            for staff in Staff.objects.all():
-                staff.load_balance_final = staff.get_load_balance()
-                staff._history_date = current_date
-                staff.save()
-
-            for assignment in Assignment.objects.all():
-                assignment._history_date = current_date
-                assignment.save()
-
-            for task in Task.objects.all():
-                task._history_date = current_date
-                task.save()
-
-            for unit in Unit.objects.all():
-                unit._history_date = current_date
-                unit.save()
-
-            for load_function in LoadFunction.objects.all():
-                load_function._history_date = current_date
-                load_function.save()
-
-            for academic_group in AcademicGroup.objects.all():
-                academic_group._history_date = current_date
-                academic_group.load_balance_final = academic_group.get_load_balance()
-                academic_group.save()
-
-            settings.SIMPLE_HISTORY_ENABLED = False
-
-            # ------------------------------------------------------------------
-            # Now we have a historical record, apply the new year and save it
-            # ------------------------------------------------------------------
             form.apply(standard_load_new)
-            standard_load_new.save()
-
-            for staff in Staff.objects.all():
-                staff.load_balance_historic = staff.history.aggregate(Sum("load_balance_final"))["load_balance_final__sum"]
-                staff.load_balance_final = 0
-                staff.save()
-
-            for assignment in Assignment.objects.all():
-                assignment.is_provisional = True
-                assignment.save()
-
-            for academic_group in AcademicGroup.objects.all():
-                academic_group.load_balance_historic = academic_group.history.aggregate(Sum("load_balance_final"))["load_balance_final__sum"]
-                academic_group.load_balance_final = 0
-                academic_group.save()
+            try:
+                roll_over_year(standard_load_new, user=request.user)
+            except RolloverError as error:
+                form.add_error(f"{error}")
+                return None
 
             # Now, we trigger the update
             update_all_loads()
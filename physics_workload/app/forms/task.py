@@ -2,8 +2,8 @@ from logging import Logger, getLogger
 
 from iommi import Field, Form
 
+from app.calculation import Subgraph, queue_recalculation
 from app.models import Task
-from app.utility import update_all_loads
 
 logger: Logger = getLogger(__name__)
 
@@ -19,15 +19,14 @@ class TaskForm(Form):
         @staticmethod
         def extra__on_delete(instance, **_):
             logger.info(f"Deleting task {instance}")
+            subgraph: Subgraph = Subgraph.for_instance(instance, deleted=True)
             instance.delete()
-            update_all_loads()
+            queue_recalculation(subgraph)
 
         @staticmethod
         def extra__on_save(form, instance, **_):
             logger.info(f"Editing task {instance}, as {form.extra.crud_type}")
-            if instance.update_load():
-                logger.info("Task changes require recalculation of global load target.")
-                update_all_loads()
+            queue_recalculation(Subgraph.for_instance(instance))
 
 
 class TaskDetailForm(TaskForm):
@@ -177,15 +176,14 @@ class TaskEditForm(TaskForm):
         @staticmethod
         def extra__on_delete(instance, **_):
             logger.info(f"Deleting task {instance}")
+            subgraph: Subgraph = Subgraph.for_instance(instance, deleted=True)
             instance.delete()
-            update_all_loads()
+            queue_recalculation(subgraph)
 
         @staticmethod
         def extra__on_save(form, instance, **_):
             logger.info(f"Editing task {instance}, as {form.extra.crud_type}")
-            if instance.update_load():
-                logger.info("Task changes require recalculation of global load target.")
-                update_all_loads()
+            queue_recalculation(Subgraph.for_instance(instance))
 
 
 class UnitTaskLeadCreateForm(TaskForm):
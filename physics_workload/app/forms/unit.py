@@ -2,8 +2,8 @@ from logging import Logger, getLogger
 
 from iommi import Form
 
+from app.calculation import Subgraph, queue_recalculation
 from app.models import Unit
-from app.utility import update_all_loads
 
 logger: Logger = getLogger(__name__)
 
@@ -37,12 +37,11 @@ class UnitForm(Form):
         @staticmethod
         def extra__on_delete(instance, **_):
             logger.info(f"Deleting module member {instance}")
+            subgraph: Subgraph = Subgraph.for_instance(instance, deleted=True)
             instance.delete()
-            update_all_loads()
+            queue_recalculation(subgraph)
 
         @staticmethod
         def extra__on_save(form, instance, **_):
             logger.info(f"Editing module {instance}, as {form.extra.crud_type}")
-            if instance.update_load():
-                logger.info("Module changes require recalculation of global load target.")
-                update_all_loads()
+            queue_recalculation(Subgraph.for_instance(instance))
@@ -0,0 +1,74 @@
+from datetime import datetime
+from typing import List, Set, Tuple, Type
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Model
+
+from app.calculation.unit_of_work import BATCH_SIZE
+from app.models import StandardLoad, YearSnapshot
+from app.models.common import ModelCommon
+
+
+class Command(BaseCommand):
+    help = (
+        "Deletes historical records that don't record any change, or only changes to calculated fields. "
+        "The records written when each year was rolled over are always kept."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Report the records that would be deleted, without deleting them.")
+
+    def handle(self, *args, **options):
+        """
+
+        :param args:
+        :param options:
+        :return:
+        """
+        # Every rollover snapshots the standard load, so its records mark the dates of each year's snapshot.
+        rollover_dates: Set[datetime] = set(StandardLoad.history.values_list("history_date", flat=True))
+        rollover_dates |= set(YearSnapshot.objects.values_list("date", flat=True))
+
+        with transaction.atomic():
+            for model in apps.get_app_config("app").get_models():
+                if not issubclass(model, ModelCommon):
+                    continue
+
+                total: int = model.history.count()
+                redundant: List[int] = self.find_redundant(model, rollover_dates)
+                if not options["dry_run"]:
+                    for start in range(0, len(redundant), BATCH_SIZE):
+                        model.history.filter(history_id__in=redundant[start : start + BATCH_SIZE]).delete()
+
+                self.stdout.write(f"{model.__name__}: {len(redundant)} of {total} historical records redundant.")
+
+            if options["dry_run"]:
+                transaction.set_rollback(True)
+            else:
+                self.stdout.write(self.style.SUCCESS("Compacted the history."))
+
+    @staticmethod
+    def find_redundant(model: Type[Model], rollover_dates: Set[datetime]) -> List[int]:
+        """
+        Finds the updates to a model's rows that change nothing but its dynamic fields, since the row's last kept record.
+
+        :param model: The model to check the history of.
+        :param rollover_dates: The dates of the rollover snapshots, whose records are kept.
+        :return: The IDs of the redundant historical records.
+        """
+        pk: str = model._meta.pk.attname
+        fields: List[str] = [field.attname for field in model.history.model.tracked_fields if field.name not in model.DYNAMIC_FIELDS]
+
+        redundant: List[int] = []
+        previous_type: str | None = None
+        previous_values: Tuple | None = None
+        rows = model.history.order_by(pk, "history_date", "history_id").values_list("history_id", "history_type", "history_date", *fields)
+        for history_id, history_type, history_date, *values in rows.iterator(chunk_size=BATCH_SIZE):
+            if history_type == "~" and history_date not in rollover_dates and previous_type != "-" and previous_values == tuple(values):
+                redundant.append(history_id)
+            else:
+                previous_type, previous_values = history_type, tuple(values)
+
+        return redundant
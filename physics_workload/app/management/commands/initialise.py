@@ -1,6 +1,6 @@
 from django.core.management.base import BaseCommand  # , CommandError
 
-from app.utility import update_all_loads
+from app.calculation import RecalculationResult, recalculate_all_loads
 
 
 class Command(BaseCommand):
@@ -13,7 +13,14 @@ class Command(BaseCommand):
         :param options:
         :return:
         """
-        cycles: int = update_all_loads()
-        self.stdout.write(
-            self.style.SUCCESS(f"Successfully initialised the loads of all models in the database. Full-time loads took {cycles} cycles.")
-        )
+        result: RecalculationResult = recalculate_all_loads()
+        if result.converged:
+            self.stdout.write(
+                self.style.SUCCESS(f"Successfully initialised the loads of all models in the database. Full-time loads took {result.cycles} cycles.")
+            )
+        else:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Initialised the loads of all models in the database, but full-time loads failed to settle after {result.cycles} cycles."
+                )
+            )
@@ -0,0 +1,40 @@
+from json import dumps
+from typing import List
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from app.calculation import Profile, recalculate_all_loads
+
+
+class Command(BaseCommand):
+    help = "Recalculates the loads of all models in the database, and reports how long each phase took."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=1, help="The number of times to recalculate.")
+        parser.add_argument("--json", action="store_true", help="Output the profiles as JSON.")
+        parser.add_argument("--dry-run", action="store_true", help="Roll back any changes to the loads afterwards.")
+
+    def handle(self, *args, **options):
+        """
+
+        :param args:
+        :param options:
+        :return:
+        """
+        profiles: List[Profile] = []
+        with transaction.atomic():
+            for _ in range(options["repeat"]):
+                profiles.append(recalculate_all_loads().profile)
+
+            if options["dry_run"]:
+                transaction.set_rollback(True)
+
+        if options["json"]:
+            self.stdout.write(dumps([profile.to_json() for profile in profiles], indent=2))
+            return
+
+        for profile in profiles:
+            self.stdout.write(str(profile))
+            for phase in profile.phases:
+                self.stdout.write(f"    {phase.name:<10} {phase.seconds:8.3f}s {phase.queries:6d} queries")
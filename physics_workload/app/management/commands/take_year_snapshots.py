@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from app.models import StandardLoad, YearSnapshot
+
+
+class Command(BaseCommand):
+    help = "Takes snapshots of the years rolled over before snapshots were kept, from their historical records."
+
+    def handle(self, *args, **options):
+        """
+
+        :param args:
+        :param options:
+        :return:
+        """
+        years: set = set(YearSnapshot.objects.values_list("year", flat=True))
+        for standard_load_historic in StandardLoad.history.order_by("history_date"):
+            if standard_load_historic.year in years:
+                continue
+
+            with transaction.atomic():
+                snapshot: YearSnapshot = YearSnapshot.take_from_history(standard_load_historic)
+            years.add(snapshot.year)
+            self.stdout.write(self.style.SUCCESS(f"Took snapshot of {snapshot} from its history."))
@@ -1,3 +1,19 @@
+import json
+from hashlib import md5
+from logging import Logger, getLogger
+from typing import Any, Callable, Dict, Tuple
+
+from django.contrib.messages import get_messages
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+
+from app.auth import get_role
+from app.models import get_data_state
+from app.tables.paginator import get_page_sizes
+
+logger: Logger = getLogger(__name__)
+
+
 class AjaxMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
@@ -9,3 +25,66 @@ class AjaxMiddleware:
         request.is_ajax = is_ajax.__get__(request)
         response = self.get_response(request)
         return response
+
+
+class ConditionalPageMiddleware:
+    """
+    Answers repeat views of a page with 304 Not Modified if nothing it shows can have changed.
+
+    Each page gets an ETag from the data version, the user's role, and the page's full path,
+    so a browser that still has the page is told to reuse it, without it being fetched or rendered.
+    Pages are marked private and always revalidated, so they're never shown stale.
+
+    :attribute EXCLUDED_PATHS: Paths of pages that aren't worked out from the data, e.g. the admin site and sign-in,
+        or that change without it, like the diagnostics page's recent recalculations.
+    """
+
+    EXCLUDED_PATHS: Tuple[str, ...] = ("/admin/", "/oauth2/", "/login", "/logout", "/django_plotly_dash/", "/diagnostics/")
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if request.method not in ("GET", "HEAD") or request.path.startswith(self.EXCLUDED_PATHS):
+            return self.get_response(request)
+
+        # Messages are only shown once, so a page showing them can't be reused.
+        if len(get_messages(request)):
+            return self.get_response(request)
+
+        etag: str = self.get_etag(request)
+        if response := get_conditional_response(request, etag=etag):
+            logger.debug(f"Page {request.get_full_path()} not modified.")
+            return response
+
+        response: HttpResponse = self.get_response(request)
+        if response.status_code == 200 and not response.has_header("ETag"):
+            response["ETag"] = etag
+            patch_cache_control(response, private=True, no_cache=True)
+
+        return response
+
+    @staticmethod
+    def get_etag(request: HttpRequest) -> str:
+        """
+        Gets the ETag for a page; it's weak, as the page's forms have a fresh CSRF token each time it's rendered.
+
+        The CSRF cookie is included so a page isn't reused with a token from before the user last signed in.
+        Whether loads are still being recalculated is included, as it's flagged on every page; it's kept with the data version.
+        The page sizes the user has picked are included, as they change how many rows a page shows.
+
+        :param request: The request for the page.
+        :return: The ETag.
+        """
+        state: Dict[str, Any] = get_data_state()
+        parts: str = "|".join(
+            [
+                state["version"],
+                get_role(request.user),
+                request.META.get("CSRF_COOKIE", ""),
+                str(request.user.is_authenticated and state["stale"]),
+                json.dumps(get_page_sizes(request), sort_keys=True),
+                request.get_full_path(),
+            ]
+        )
+        return f'W/"{md5(parts.encode(), usedforsecurity=False).hexdigest()}"'
@@ -0,0 +1,890 @@
+# Generated by Django 5.2.5 on 2026-10-17 19:51
+
+import django.core.validators
+import simple_history.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="AcademicGroup",
+            fields=[
+                ("code", models.CharField(max_length=1, primary_key=True, serialize=False, unique=True)),
+                ("short_name", models.CharField(db_index=True, max_length=16, unique=True)),
+                ("name", models.CharField(max_length=128, unique=True)),
+                (
+                    "load_balance_final",
+                    models.IntegerField(
+                        default=0, help_text="Final load balance for the current year. Positive if overloaded.", verbose_name="Load balance"
+                    ),
+                ),
+                (
+                    "load_balance_historic",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Total of previous end-of-year load balances. Positive if overloaded.",
+                        verbose_name="Historic load balance",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Group",
+                "verbose_name_plural": "Groups",
+                "ordering": ("name",),
+            },
+        ),
+        migrations.CreateModel(
+            name="Assignment",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("students", models.IntegerField(blank=True, help_text="If not specified, defaults to student count on Task or Module.", null=True)),
+                ("notes", models.TextField(blank=True)),
+                ("is_first_time", models.BooleanField(default=False)),
+                ("is_provisional", models.BooleanField(default=False)),
+                ("load_calc", models.IntegerField(default=0, verbose_name="Load")),
+            ],
+            options={
+                "verbose_name": "Assignment",
+                "verbose_name_plural": "Assignments",
+                "ordering": ("-staff", "task"),
+            },
+        ),
+        migrations.CreateModel(
+            name="HistoricalAcademicGroup",
+            fields=[
+                ("code", models.CharField(db_index=True, max_length=1)),
+                ("short_name", models.CharField(db_index=True, max_length=16)),
+                ("name", models.CharField(db_index=True, max_length=128)),
+                (
+                    "load_balance_final",
+                    models.IntegerField(
+                        default=0, help_text="Final load balance for the current year. Positive if overloaded.", verbose_name="Load balance"
+                    ),
+                ),
+                (
+                    "load_balance_historic",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Total of previous end-of-year load balances. Positive if overloaded.",
+                        verbose_name="Historic load balance",
+                    ),
+                ),
+                ("history_id", models.AutoField(primary_key=True, serialize=False)),
+                ("history_date", models.DateTimeField(db_index=True)),
+                ("history_change_reason", models.CharField(max_length=100, null=True)),
+                ("history_type", models.CharField(choices=[("+", "Created"), ("~", "Changed"), ("-", "Deleted")], max_length=1)),
+            ],
+            options={
+                "verbose_name": "historical Group",
+                "verbose_name_plural": "historical Groups",
+                "ordering": ("-history_date", "-history_id"),
+                "get_latest_by": ("history_date", "history_id"),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.CreateModel(
+            name="HistoricalAssignment",
+            fields=[
+                ("id", models.BigIntegerField(auto_created=True, blank=True, db_index=True, verbose_name="ID")),
+                ("students", models.IntegerField(blank=True, help_text="If not specified, defaults to student count on Task or Module.", null=True)),
+                ("notes", models.TextField(blank=True)),
+                ("is_first_time", models.BooleanField(default=False)),
+                ("is_provisional", models.BooleanField(default=False)),
+                ("load_calc", models.IntegerField(default=0, verbose_name="Load")),
+                ("history_id", models.AutoField(primary_key=True, serialize=False)),
+                ("history_date", models.DateTimeField(db_index=True)),
+                ("history_change_reason", models.CharField(max_length=100, null=True)),
+                ("history_type", models.CharField(choices=[("+", "Created"), ("~", "Changed"), ("-", "Deleted")], max_length=1)),
+            ],
+            options={
+                "verbose_name": "historical Assignment",
+                "verbose_name_plural": "historical Assignments",
+                "ordering": ("-history_date", "-history_id"),
+                "get_latest_by": ("history_date", "history_id"),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.CreateModel(
+            name="HistoricalInfo",
+            fields=[
+                ("name", models.CharField(db_index=True, max_length=120)),
+                ("page", models.CharField(db_index=True, max_length=120)),
+                (
+                    "text",
+                    models.TextField(
+                        help_text="This field is interpreted as <a href='https://www.markdownguide.org/cheat-sheet/'>Markdown</a>, and can be formatted.",
+                        null=True,
+                        verbose_name="Information",
+                    ),
+                ),
+                ("history_id", models.AutoField(primary_key=True, serialize=False)),
+                ("history_date", models.DateTimeField(db_index=True)),
+                ("history_change_reason", models.CharField(max_length=100, null=True)),
+                ("history_type", models.CharField(choices=[("+", "Created"), ("~", "Changed"), ("-", "Deleted")], max_length=1)),
+            ],
+            options={
+                "verbose_name": "historical info",
+                "verbose_name_plural": "historical infos",
+                "ordering": ("-history_date", "-history_id"),
+                "get_latest_by": ("history_date", "history_id"),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.CreateModel(
+            name="HistoricalLoadFunction",
+            fields=[
+                ("id", models.BigIntegerField(auto_created=True, blank=True, db_index=True, verbose_name="ID")),
+                ("name", models.CharField(db_index=True, max_length=128)),
+                (
+                    "expression",
+                    models.TextField(
+                        help_text="Where $s$ is the number of students. Evaluated using the <a class='font-monospace' href='https://github.com/danthedeckie/simpleeval'>simpleeval</a> Python module.",
+                        verbose_name="Weighting Expression",
+                    ),
+                ),
+                (
+                    "plot_minimum",
+                    models.IntegerField(
+                        blank=True,
+                        help_text="If provided, range to plot function over.",
+                        null=True,
+                        validators=[django.core.validators.MinValueValidator(1)],
+                    ),
+                ),
+                (
+                    "plot_maximum",
+                    models.IntegerField(
+                        blank=True,
+                        help_text="If provided, range to plot function over.",
+                        null=True,
+                        validators=[django.core.validators.MinValueValidator(2)],
+                    ),
+                ),
+                ("notes", models.TextField(blank=True)),
+                ("history_id", models.AutoField(primary_key=True, serialize=False)),
+                ("history_date", models.DateTimeField(db_index=True)),
+                ("history_change_reason", models.CharField(max_length=100, null=True)),
+                ("history_type", models.CharField(choices=[("+", "Created"), ("~", "Changed"), ("-", "Deleted")], max_length=1)),
+            ],
+            options={
+                "verbose_name": "historical Load Function",
+                "verbose_name_plural": "historical Load Functions",
+                "ordering": ("-history_date", "-history_id"),
+                "get_latest_by": ("history_date", "history_id"),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.CreateModel(
+            name="HistoricalStaff",
+            fields=[
+                ("account", models.CharField(db_index=True, help_text="Active Directory account e.g. <tt>js1a25</tt>", max_length=16)),
+                ("name", models.CharField(max_length=128)),
+                ("gender", models.CharField(help_text="Single-letter code", max_length=1)),
+                (
+                    "load_target",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Load hours calculated for the current year.",
+                        validators=[django.core.validators.MinValueValidator(0)],
+                        verbose_name="Load target",
+                    ),
+                ),
+                (
+                    "load_assigned",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Load hours assigned for the current year.",
+                        validators=[django.core.validators.MinValueValidator(0)],
+                        verbose_name="Load assigned",
+                    ),
+                ),
+                (
+                    "load_external",
+                    models.IntegerField(
+                        default=0, help_text="Teaching load accrued externally to this tool this year.", verbose_name="External load"
+                    ),
+                ),
+                (
+                    "hours_fixed",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Must be empty if staff are FTE fraction.",
+                        validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(2000)],
+                        verbose_name="Fixed teaching hours",
+                    ),
+                ),
+                (
+                    "fte_fraction",
+                    models.FloatField(
+                        default=0,
+                        help_text="Must be 0 if staff are fixed-hours.",
+                        validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(2)],
+                        verbose_name="FTE fraction teaching",
+                    ),
+                ),
+                (
+                    "load_balance_final",
+                    models.IntegerField(
+                        default=0, help_text="Final load balance for the current year. Positive if overloaded.", verbose_name="Load balance"
+                    ),
+                ),
+                (
+                    "load_balance_historic",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Total of previous end-of-year load balances. Positive if overloaded.",
+                        verbose_name="Historic load balance",
+                    ),
+                ),
+                ("notes", models.TextField(blank=True)),
+                ("history_id", models.AutoField(primary_key=True, serialize=False)),
+                ("history_date", models.DateTimeField(db_index=True)),
+                ("history_change_reason", models.CharField(max_length=100, null=True)),
+                ("history_type", models.CharField(choices=[("+", "Created"), ("~", "Changed"), ("-", "Deleted")], max_length=1)),
+            ],
+            options={
+                "verbose_name": "historical Staff Member",
+                "verbose_name_plural": "historical Staff Members",
+                "ordering": ("-history_date", "-history_id"),
+                "get_latest_by": ("history_date", "history_id"),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.CreateModel(
+            name="HistoricalStandardLoad",
+            fields=[
+                (
+                    "year",
+                    models.IntegerField(
+                        db_index=True,
+                        help_text="Initial year, e.g. 2000 for 2000-2001 academic year.",
+                        validators=[django.core.validators.MinValueValidator(2000)],
+                    ),
+                ),
+                (
+                    "load_lecture",
+                    models.FloatField(
+                        help_text="$L_{lec}$",
+                        validators=[django.core.validators.MinValueValidator(0.0)],
+                        verbose_name="Load hours per lecture & problems class",
+                    ),
+                ),
+                (
+                    "load_lecture_first",
+                    models.FloatField(
+                        help_text="$L_{lec}$ applied when co-ordinating a module for the first time.",
+                        validators=[django.core.validators.MinValueValidator(0.0)],
+                        verbose_name="Load hours per lecture & problems class for first-time assignment",
+                    ),
+                ),
+                (
+                    "load_coursework_set",
+                    models.FloatField(
+                        help_text="$L_{cw, \\mathrm{prep}}$",
+                        validators=[django.core.validators.MinValueValidator(0.0)],
+                        verbose_name="Load hours per item of coursework prepared",
+                    ),
+                ),
+                (
+                    "load_coursework_credit",
+                    models.FloatField(
+                        help_text="$L_{cw, \\mathrm{cats}}$",
+                        validators=[django.core.validators.MinValueValidator(0.0)],
+                        verbose_name="Load hours per coursework CATS",
+                    ),
+                ),
+                (
+                    "load_coursework_marked",
+                    models.FloatField(
+                        help_text="$L_{cw, \\mathrm{mark}}$",
+                        validators=[django.core.validators.MinValueValidator(0.0)],
+                        verbose_name="Load hours per (coursework plus coursework CATS) marked",
+                    ),
+                ),
+                (
+                    "load_exam_credit",
+                    models.FloatField(
+                        help_text="$L_{e, \\mathrm{cats}}$",
+                        validators=[django.core.validators.MinValueValidator(0.0)],
+                        verbose_name="Load hours per exam CATS",
+                    ),
+                ),
+                (
+                    "load_exam_marked",
+                    models.FloatField(
+                        help_text="$L_{e, \\mathrm{mark}}$",
+                        validators=[django.core.validators.MinValueValidator(0.0)],
+                        verbose_name="Load hours per exam marked",
+                    ),
+                ),
+                (
+                    "load_fte_misc",
+                    models.FloatField(
+                        help_text="$L_m$, basic allowance apart from explicit task loads",
+                        validators=[django.core.validators.MinValueValidator(0.0)],
+                        verbose_name="Staff misc. load per FTE fraction",
+                    ),
+                ),
+                (
+                    "target_load_per_fte",
+                    models.IntegerField(
+                        help_text="Used when calculating target load hours",
+                        validators=[django.core.validators.MinValueValidator(0)],
+                        verbose_name="Default teaching load per FTE",
+                    ),
+                ),
+                ("target_load_per_fte_calc", models.IntegerField(blank=True, null=True, verbose_name="Calculated teaching load per FTE")),
+                ("notes", models.TextField(blank=True)),
+                ("history_id", models.AutoField(primary_key=True, serialize=False)),
+                ("history_date", models.DateTimeField(db_index=True)),
+                ("history_change_reason", models.CharField(max_length=100, null=True)),
+                ("history_type", models.CharField(choices=[("+", "Created"), ("~", "Changed"), ("-", "Deleted")], max_length=1)),
+            ],
+            options={
+                "verbose_name": "historical Standard Load",
+                "verbose_name_plural": "historical Standard Loads",
+                "ordering": ("-history_date", "-history_id"),
+                "get_latest_by": ("history_date", "history_id"),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.CreateModel(
+            name="HistoricalTask",
+            fields=[
+                ("id", models.BigIntegerField(auto_created=True, blank=True, db_index=True, verbose_name="ID")),
+                (
+                    "load_calc",
+                    models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)], verbose_name="Calculated Load"),
+                ),
+                (
+                    "load_calc_first",
+                    models.IntegerField(
+                        default=0, validators=[django.core.validators.MinValueValidator(0)], verbose_name="Calculated Load (first time)"
+                    ),
+                ),
+                ("name", models.CharField(max_length=128)),
+                ("title", models.CharField(max_length=128)),
+                (
+                    "is_required",
+                    models.BooleanField(default=False, help_text="Does this task <i>have</i> to be assigned?", verbose_name="Is required"),
+                ),
+                (
+                    "is_unique",
+                    models.BooleanField(default=False, help_text="Can multiple staff perform this task, or only one?", verbose_name="Is unique"),
+                ),
+                (
+                    "load_fixed",
+                    models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)], verbose_name="Fixed load hours"),
+                ),
+                (
+                    "load_fixed_first",
+                    models.IntegerField(
+                        blank=True,
+                        default=0,
+                        help_text="Load for first-time staff is fixed load plus first-time adjustment.",
+                        null=True,
+                        validators=[django.core.validators.MinValueValidator(0)],
+                        verbose_name="First-time load adjustment",
+                    ),
+                ),
+                (
+                    "load_multiplier",
+                    models.FloatField(
+                        default=1.0,
+                        help_text="Multiplier applied to final load calculation.",
+                        validators=[django.core.validators.MinValueValidator(0.1), django.core.validators.MaxValueValidator(10.0)],
+                        verbose_name="Final load multiplier",
+                    ),
+                ),
+                (
+                    "students",
+                    models.IntegerField(
+                        blank=True,
+                        help_text="Number of students for load function and/or co-ordinator equations. If this task belongs to a Module, falls back to Unit students if empty.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "is_lead",
+                    models.BooleanField(
+                        default=False, help_text="If set, adds load as calculated using the equations for unit leads.", verbose_name="Is Unit Lead"
+                    ),
+                ),
+                (
+                    "coursework_fraction",
+                    models.FloatField(
+                        default=0.0,
+                        validators=[django.core.validators.MinValueValidator(0.0), django.core.validators.MaxValueValidator(1.0)],
+                        verbose_name="Fraction of coursework marked",
+                    ),
+                ),
+                (
+                    "exam_fraction",
+                    models.FloatField(
+                        default=0.0,
+                        validators=[django.core.validators.MinValueValidator(0.0), django.core.validators.MaxValueValidator(1.0)],
+                        verbose_name="Fraction of exams marked",
+                    ),
+                ),
+                (
+                    "is_full_time",
+                    models.BooleanField(
+                        default=False,
+                        help_text="If set, makes this task counts as being 1 FTE worth of load. Recursively defined.",
+                        verbose_name="Is full-time",
+                    ),
+                ),
+                ("description", models.TextField()),
+                ("notes", models.TextField(blank=True)),
+                ("history_id", models.AutoField(primary_key=True, serialize=False)),
+                ("history_date", models.DateTimeField(db_index=True)),
+                ("history_change_reason", models.CharField(max_length=100, null=True)),
+                ("history_type", models.CharField(choices=[("+", "Created"), ("~", "Changed"), ("-", "Deleted")], max_length=1)),
+            ],
+            options={
+                "verbose_name": "historical Task",
+                "verbose_name_plural": "historical Tasks",
+                "ordering": ("-history_date", "-history_id"),
+                "get_latest_by": ("history_date", "history_id"),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.CreateModel(
+            name="HistoricalUnit",
+            fields=[
+                ("code", models.CharField(db_index=True, max_length=16)),
+                ("name", models.CharField(db_index=True, max_length=128)),
+                ("students", models.IntegerField(blank=True, default=None, null=True, validators=[django.core.validators.MinValueValidator(0)])),
+                ("lectures", models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)], verbose_name="Lectures")),
+                (
+                    "problem_classes",
+                    models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)], verbose_name="Problem Classes"),
+                ),
+                (
+                    "coursework",
+                    models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)], verbose_name="Coursework Prepared"),
+                ),
+                (
+                    "synoptic_lectures",
+                    models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)], verbose_name="Synoptic Lectures"),
+                ),
+                ("exams", models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)], verbose_name="Exams")),
+                (
+                    "credits",
+                    models.IntegerField(blank=True, null=True, validators=[django.core.validators.MinValueValidator(0)], verbose_name="CATS"),
+                ),
+                (
+                    "exam_mark_fraction",
+                    models.FloatField(
+                        blank=True,
+                        null=True,
+                        validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(1)],
+                        verbose_name="Exam mark fraction",
+                    ),
+                ),
+                (
+                    "coursework_mark_fraction",
+                    models.FloatField(
+                        blank=True,
+                        null=True,
+                        validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(1)],
+                        verbose_name="Coursework mark fraction",
+                    ),
+                ),
+                ("has_dissertation", models.BooleanField(default=False)),
+                ("has_placement", models.BooleanField(default=False)),
+                ("description", models.TextField(blank=True)),
+                ("notes", models.TextField(blank=True)),
+                ("history_id", models.AutoField(primary_key=True, serialize=False)),
+                ("history_date", models.DateTimeField(db_index=True)),
+                ("history_change_reason", models.CharField(max_length=100, null=True)),
+                ("history_type", models.CharField(choices=[("+", "Created"), ("~", "Changed"), ("-", "Deleted")], max_length=1)),
+            ],
+            options={
+                "verbose_name": "historical Module",
+                "verbose_name_plural": "historical Modules",
+                "ordering": ("-history_date", "-history_id"),
+                "get_latest_by": ("history_date", "history_id"),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.CreateModel(
+            name="Info",
+            fields=[
+                ("name", models.CharField(max_length=120, unique=True)),
+                ("page", models.CharField(max_length=120, primary_key=True, serialize=False)),
+                (
+                    "text",
+                    models.TextField(
+                        help_text="This field is interpreted as <a href='https://www.markdownguide.org/cheat-sheet/'>Markdown</a>, and can be formatted.",
+                        null=True,
+                        verbose_name="Information",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="LoadFunction",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("name", models.CharField(max_length=128, unique=True)),
+                (
+                    "expression",
+                    models.TextField(
+                        help_text="Where $s$ is the number of students. Evaluated using the <a class='font-monospace' href='https://github.com/danthedeckie/simpleeval'>simpleeval</a> Python module.",
+                        verbose_name="Weighting Expression",
+                    ),
+                ),
+                (
+                    "plot_minimum",
+                    models.IntegerField(
+                        blank=True,
+                        help_text="If provided, range to plot function over.",
+                        null=True,
+                        validators=[django.core.validators.MinValueValidator(1)],
+                    ),
+                ),
+                (
+                    "plot_maximum",
+                    models.IntegerField(
+                        blank=True,
+                        help_text="If provided, range to plot function over.",
+                        null=True,
+                        validators=[django.core.validators.MinValueValidator(2)],
+                    ),
+                ),
+                ("notes", models.TextField(blank=True)),
+            ],
+            options={
+                "verbose_name": "Load Function",
+                "verbose_name_plural": "Load Functions",
+                "ordering": ("name",),
+            },
+        ),
+        migrations.CreateModel(
+            name="Staff",
+            fields=[
+                (
+                    "account",
+                    models.CharField(
+                        help_text="Active Directory account e.g. <tt>js1a25</tt>", max_length=16, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("name", models.CharField(max_length=128)),
+                ("gender", models.CharField(help_text="Single-letter code", max_length=1)),
+                (
+                    "load_target",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Load hours calculated for the current year.",
+                        validators=[django.core.validators.MinValueValidator(0)],
+                        verbose_name="Load target",
+                    ),
+                ),
+                (
+                    "load_assigned",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Load hours assigned for the current year.",
+                        validators=[django.core.validators.MinValueValidator(0)],
+                        verbose_name="Load assigned",
+                    ),
+                ),
+                (
+                    "load_external",
+                    models.IntegerField(
+                        default=0, help_text="Teaching load accrued externally to this tool this year.", verbose_name="External load"
+                    ),
+                ),
+                (
+                    "hours_fixed",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Must be empty if staff are FTE fraction.",
+                        validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(2000)],
+                        verbose_name="Fixed teaching hours",
+                    ),
+                ),
+                (
+                    "fte_fraction",
+                    models.FloatField(
+                        default=0,
+                        help_text="Must be 0 if staff are fixed-hours.",
+                        validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(2)],
+                        verbose_name="FTE fraction teaching",
+                    ),
+                ),
+                (
+                    "load_balance_final",
+                    models.IntegerField(
+                        default=0, help_text="Final load balance for the current year. Positive if overloaded.", verbose_name="Load balance"
+                    ),
+                ),
+                (
+                    "load_balance_historic",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Total of previous end-of-year load balances. Positive if overloaded.",
+                        verbose_name="Historic load balance",
+                    ),
+                ),
+                ("notes", models.TextField(blank=True)),
+            ],
+            options={
+                "verbose_name": "Staff Member",
+                "verbose_name_plural": "Staff Members",
+                "ordering": ["name"],
+            },
+        ),
+        migrations.CreateModel(
+            name="StandardLoad",
+            fields=[
+                (
+                    "year",
+                    models.IntegerField(
+                        help_text="Initial year, e.g. 2000 for 2000-2001 academic year.",
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                        validators=[django.core.validators.MinValueValidator(2000)],
+                    ),
+                ),
+                (
+                    "load_lecture",
+                    models.FloatField(
+                        help_text="$L_{lec}$",
+                        validators=[django.core.validators.MinValueValidator(0.0)],
+                        verbose_name="Load hours per lecture & problems class",
+                    ),
+                ),
+                (
+                    "load_lecture_first",
+                    models.FloatField(
+                        help_text="$L_{lec}$ applied when co-ordinating a module for the first time.",
+                        validators=[django.core.validators.MinValueValidator(0.0)],
+                        verbose_name="Load hours per lecture & problems class for first-time assignment",
+                    ),
+                ),
+                (
+                    "load_coursework_set",
+                    models.FloatField(
+                        help_text="$L_{cw, \\mathrm{prep}}$",
+                        validators=[django.core.validators.MinValueValidator(0.0)],
+                        verbose_name="Load hours per item of coursework prepared",
+                    ),
+                ),
+                (
+                    "load_coursework_credit",
+                    models.FloatField(
+                        help_text="$L_{cw, \\mathrm{cats}}$",
+                        validators=[django.core.validators.MinValueValidator(0.0)],
+                        verbose_name="Load hours per coursework CATS",
+                    ),
+                ),
+                (
+                    "load_coursework_marked",
+                    models.FloatField(
+                        help_text="$L_{cw, \\mathrm{mark}}$",
+                        validators=[django.core.validators.MinValueValidator(0.0)],
+                        verbose_name="Load hours per (coursework plus coursework CATS) marked",
+                    ),
+                ),
+                (
+                    "load_exam_credit",
+                    models.FloatField(
+                        help_text="$L_{e, \\mathrm{cats}}$",
+                        validators=[django.core.validators.MinValueValidator(0.0)],
+                        verbose_name="Load hours per exam CATS",
+                    ),
+                ),
+                (
+                    "load_exam_marked",
+                    models.FloatField(
+                        help_text="$L_{e, \\mathrm{mark}}$",
+                        validators=[django.core.validators.MinValueValidator(0.0)],
+                        verbose_name="Load hours per exam marked",
+                    ),
+                ),
+                (
+                    "load_fte_misc",
+                    models.FloatField(
+                        help_text="$L_m$, basic allowance apart from explicit task loads",
+                        validators=[django.core.validators.MinValueValidator(0.0)],
+                        verbose_name="Staff misc. load per FTE fraction",
+                    ),
+                ),
+                (
+                    "target_load_per_fte",
+                    models.IntegerField(
+                        help_text="Used when calculating target load hours",
+                        validators=[django.core.validators.MinValueValidator(0)],
+                        verbose_name="Default teaching load per FTE",
+                    ),
+                ),
+                ("target_load_per_fte_calc", models.IntegerField(blank=True, null=True, verbose_name="Calculated teaching load per FTE")),
+                ("notes", models.TextField(blank=True)),
+            ],
+            options={
+                "verbose_name": "Standard Load",
+                "verbose_name_plural": "Standard Loads",
+                "ordering": ["-year"],
+                "get_latest_by": "year",
+            },
+        ),
+        migrations.CreateModel(
+            name="Task",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "load_calc",
+                    models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)], verbose_name="Calculated Load"),
+                ),
+                (
+                    "load_calc_first",
+                    models.IntegerField(
+                        default=0, validators=[django.core.validators.MinValueValidator(0)], verbose_name="Calculated Load (first time)"
+                    ),
+                ),
+                ("name", models.CharField(max_length=128)),
+                ("title", models.CharField(max_length=128)),
+                (
+                    "is_required",
+                    models.BooleanField(default=False, help_text="Does this task <i>have</i> to be assigned?", verbose_name="Is required"),
+                ),
+                (
+                    "is_unique",
+                    models.BooleanField(default=False, help_text="Can multiple staff perform this task, or only one?", verbose_name="Is unique"),
+                ),
+                (
+                    "load_fixed",
+                    models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)], verbose_name="Fixed load hours"),
+                ),
+                (
+                    "load_fixed_first",
+                    models.IntegerField(
+                        blank=True,
+                        default=0,
+                        help_text="Load for first-time staff is fixed load plus first-time adjustment.",
+                        null=True,
+                        validators=[django.core.validators.MinValueValidator(0)],
+                        verbose_name="First-time load adjustment",
+                    ),
+                ),
+                (
+                    "load_multiplier",
+                    models.FloatField(
+                        default=1.0,
+                        help_text="Multiplier applied to final load calculation.",
+                        validators=[django.core.validators.MinValueValidator(0.1), django.core.validators.MaxValueValidator(10.0)],
+                        verbose_name="Final load multiplier",
+                    ),
+                ),
+                (
+                    "students",
+                    models.IntegerField(
+                        blank=True,
+                        help_text="Number of students for load function and/or co-ordinator equations. If this task belongs to a Module, falls back to Unit students if empty.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "is_lead",
+                    models.BooleanField(
+                        default=False, help_text="If set, adds load as calculated using the equations for unit leads.", verbose_name="Is Unit Lead"
+                    ),
+                ),
+                (
+                    "coursework_fraction",
+                    models.FloatField(
+                        default=0.0,
+                        validators=[django.core.validators.MinValueValidator(0.0), django.core.validators.MaxValueValidator(1.0)],
+                        verbose_name="Fraction of coursework marked",
+                    ),
+                ),
+                (
+                    "exam_fraction",
+                    models.FloatField(
+                        default=0.0,
+                        validators=[django.core.validators.MinValueValidator(0.0), django.core.validators.MaxValueValidator(1.0)],
+                        verbose_name="Fraction of exams marked",
+                    ),
+                ),
+                (
+                    "is_full_time",
+                    models.BooleanField(
+                        default=False,
+                        help_text="If set, makes this task counts as being 1 FTE worth of load. Recursively defined.",
+                        verbose_name="Is full-time",
+                    ),
+                ),
+                ("description", models.TextField()),
+                ("notes", models.TextField(blank=True)),
+            ],
+            options={
+                "verbose_name": "Task",
+                "verbose_name_plural": "Tasks",
+                "ordering": ("unit", "name"),
+            },
+        ),
+        migrations.CreateModel(
+            name="Unit",
+            fields=[
+                ("code", models.CharField(max_length=16, primary_key=True, serialize=False, unique=True)),
+                ("name", models.CharField(max_length=128, unique=True)),
+                ("students", models.IntegerField(blank=True, default=None, null=True, validators=[django.core.validators.MinValueValidator(0)])),
+                ("lectures", models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)], verbose_name="Lectures")),
+                (
+                    "problem_classes",
+                    models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)], verbose_name="Problem Classes"),
+                ),
+                (
+                    "coursework",
+                    models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)], verbose_name="Coursework Prepared"),
+                ),
+                (
+                    "synoptic_lectures",
+                    models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)], verbose_name="Synoptic Lectures"),
+                ),
+                ("exams", models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)], verbose_name="Exams")),
+                (
+                    "credits",
+                    models.IntegerField(blank=True, null=True, validators=[django.core.validators.MinValueValidator(0)], verbose_name="CATS"),
+                ),
+                (
+                    "exam_mark_fraction",
+                    models.FloatField(
+                        blank=True,
+                        null=True,
+                        validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(1)],
+                        verbose_name="Exam mark fraction",
+                    ),
+                ),
+                (
+                    "coursework_mark_fraction",
+                    models.FloatField(
+                        blank=True,
+                        null=True,
+                        validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(1)],
+                        verbose_name="Coursework mark fraction",
+                    ),
+                ),
+                ("has_dissertation", models.BooleanField(default=False)),
+                ("has_placement", models.BooleanField(default=False)),
+                ("description", models.TextField(blank=True)),
+                ("notes", models.TextField(blank=True)),
+            ],
+            options={
+                "verbose_name": "Module",
+                "verbose_name_plural": "Modules",
+                "ordering": ["name"],
+            },
+        ),
+    ]
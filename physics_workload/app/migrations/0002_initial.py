@@ -0,0 +1,283 @@
+# Generated by Django 5.2.5 on 2026-10-17 19:51
+
+import django.db.models.deletion
+import django.db.models.expressions
+import simple_history.models
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("app", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="historicalacademicgroup",
+            name="history_user",
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="+", to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name="historicalassignment",
+            name="history_user",
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="+", to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name="historicalinfo",
+            name="history_user",
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="+", to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name="historicalloadfunction",
+            name="history_user",
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="+", to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name="historicalstaff",
+            name="academic_group",
+            field=simple_history.models.HistoricForeignKey(
+                blank=True,
+                db_constraint=False,
+                null=True,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="+",
+                to="app.academicgroup",
+                verbose_name="Group",
+            ),
+        ),
+        migrations.AddField(
+            model_name="historicalstaff",
+            name="history_user",
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="+", to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name="historicalstaff",
+            name="user",
+            field=models.ForeignKey(
+                blank=True,
+                db_constraint=False,
+                null=True,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="+",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddField(
+            model_name="historicalstandardload",
+            name="history_user",
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="+", to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name="historicaltask",
+            name="academic_group",
+            field=simple_history.models.HistoricForeignKey(
+                blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name="+", to="app.academicgroup"
+            ),
+        ),
+        migrations.AddField(
+            model_name="historicaltask",
+            name="history_user",
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="+", to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name="historicalunit",
+            name="academic_group",
+            field=simple_history.models.HistoricForeignKey(
+                blank=True,
+                db_constraint=False,
+                null=True,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="+",
+                to="app.academicgroup",
+                verbose_name="Group",
+            ),
+        ),
+        migrations.AddField(
+            model_name="historicalunit",
+            name="history_user",
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="+", to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddConstraint(
+            model_name="loadfunction",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    models.Q(("plot_minimum__lt", models.F("plot_maximum")), ("plot_maximum__isnull", False)),
+                    models.Q(("plot_minimum__isnull", True), ("plot_maximum__isnull", True)),
+                    _connector="OR",
+                ),
+                name="plot_range_valid",
+                violation_error_message="Minimum range must be below maximum range if either are provided.",
+            ),
+        ),
+        migrations.AddField(
+            model_name="historicaltask",
+            name="load_function",
+            field=simple_history.models.HistoricForeignKey(
+                blank=True,
+                db_constraint=False,
+                help_text="Function by which student load for this task scales",
+                null=True,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="+",
+                to="app.loadfunction",
+            ),
+        ),
+        migrations.AddField(
+            model_name="staff",
+            name="academic_group",
+            field=simple_history.models.HistoricForeignKey(
+                blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to="app.academicgroup", verbose_name="Group"
+            ),
+        ),
+        migrations.AddField(
+            model_name="staff",
+            name="user",
+            field=models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name="historicalassignment",
+            name="staff",
+            field=simple_history.models.HistoricForeignKey(
+                blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name="+", to="app.staff"
+            ),
+        ),
+        migrations.AddField(
+            model_name="assignment",
+            name="staff",
+            field=simple_history.models.HistoricForeignKey(
+                on_delete=django.db.models.deletion.PROTECT, related_name="assignment_set", to="app.staff"
+            ),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="academic_group",
+            field=simple_history.models.HistoricForeignKey(
+                blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name="task_set", to="app.academicgroup"
+            ),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="load_function",
+            field=simple_history.models.HistoricForeignKey(
+                blank=True,
+                help_text="Function by which student load for this task scales",
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                to="app.loadfunction",
+            ),
+        ),
+        migrations.AddField(
+            model_name="historicalassignment",
+            name="task",
+            field=simple_history.models.HistoricForeignKey(
+                blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name="+", to="app.task"
+            ),
+        ),
+        migrations.AddField(
+            model_name="assignment",
+            name="task",
+            field=simple_history.models.HistoricForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="assignment_set", to="app.task"),
+        ),
+        migrations.AddField(
+            model_name="unit",
+            name="academic_group",
+            field=simple_history.models.HistoricForeignKey(
+                blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to="app.academicgroup", verbose_name="Group"
+            ),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="unit",
+            field=simple_history.models.HistoricForeignKey(
+                blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name="task_set", to="app.unit"
+            ),
+        ),
+        migrations.AddField(
+            model_name="historicaltask",
+            name="unit",
+            field=simple_history.models.HistoricForeignKey(
+                blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name="+", to="app.unit"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="staff",
+            index=models.Index(fields=["name"], name="app_staff_name_1f0f0e_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="staff",
+            index=models.Index(fields=["gender"], name="app_staff_gender_934f77_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="staff",
+            index=models.Index(fields=["academic_group"], name="app_staff_academi_c31d47_idx"),
+        ),
+        migrations.AddConstraint(
+            model_name="staff",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("fte_fraction", 0), ("hours_fixed", 0), _connector="OR"),
+                name="fixed_or_fte",
+                violation_error_message="Staff must be fixed or FTE; please leave one field zero.",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="assignment",
+            index=models.Index(fields=["staff"], name="app_assignm_staff_i_a625c4_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="assignment",
+            index=models.Index(fields=["task"], name="app_assignm_task_id_c545f6_idx"),
+        ),
+        migrations.AddConstraint(
+            model_name="assignment",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("students__isnull", True), ("students__gte", 0), _connector="OR"),
+                name="assignment_students_null",
+                violation_error_message="Cannot have less than zero students.",
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="assignment",
+            unique_together={("task", "staff")},
+        ),
+        migrations.AddConstraint(
+            model_name="unit",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    (
+                        "exam_mark_fraction__lte",
+                        django.db.models.expressions.CombinedExpression(models.Value(1), "-", models.F("coursework_mark_fraction")),
+                    ),
+                    models.Q(("exam_mark_fraction__isnull", True), ("coursework_mark_fraction__isnull", True)),
+                    _connector="OR",
+                ),
+                name="total_mark_fraction",
+                violation_error_message="Total mark fraction must be less than 1, or both mark fractions must be empty.",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="task",
+            constraint=models.UniqueConstraint(
+                fields=("unit", "title"), name="unit_task_name", violation_error_message="Units cannot have multiple tasks with the same name."
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="task",
+            constraint=models.UniqueConstraint(
+                fields=("academic_group", "title"),
+                name="unit_group_name",
+                violation_error_message="Academic groups cannot have multiple tasks with the same name.",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="task",
+            constraint=models.CheckConstraint(
+                condition=models.Q(models.Q(("unit__isnull", False), ("is_lead", True)), ("is_lead", False), _connector="OR"),
+                name="unit_lead_required",
+                violation_error_message="Cannot be co-ordinator of a Unit without a linked unit.",
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.5 on 2026-10-17 20:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("app", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RecalculationJob",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "status",
+                    models.CharField(choices=[("pending", "Pending"), ("running", "Running"), ("failed", "Failed")], default="pending", max_length=8),
+                ),
+                (
+                    "subgraph",
+                    models.JSONField(
+                        blank=True, help_text="The rows to recalculate, as from `Subgraph.to_json`. If blank, everything is recalculated.", null=True
+                    ),
+                ),
+                ("created", models.DateTimeField(auto_now_add=True)),
+                ("started", models.DateTimeField(blank=True, null=True)),
+                ("error", models.TextField(blank=True)),
+            ],
+            options={
+                "verbose_name": "Recalculation Job",
+                "verbose_name_plural": "Recalculation Jobs",
+                "ordering": ("created",),
+                "indexes": [models.Index(fields=["status", "created"], name="app_recalcu_status_100ed1_idx")],
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.5 on 2026-10-17 20:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("app", "0003_recalculationjob"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="YearSnapshot",
+            fields=[
+                ("year", models.IntegerField(help_text="The academic year, as for the standard load.", primary_key=True, serialize=False)),
+                ("date", models.DateTimeField(help_text="When the year was rolled over.")),
+                ("standard_load", models.JSONField(help_text="The standard load for the year.")),
+                ("staff", models.JSONField()),
+                ("assignments", models.JSONField()),
+                ("tasks", models.JSONField()),
+                ("units", models.JSONField()),
+                ("academic_groups", models.JSONField()),
+            ],
+            options={
+                "verbose_name": "Year Snapshot",
+                "verbose_name_plural": "Year Snapshots",
+                "ordering": ["-year"],
+                "get_latest_by": "year",
+            },
+        ),
+    ]
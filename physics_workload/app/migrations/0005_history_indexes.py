@@ -0,0 +1,74 @@
+# Generated by Django 5.2.5 on 2026-10-17 20:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("app", "0004_yearsnapshot"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="historicalacademicgroup",
+            index=models.Index(fields=["code", "history_date"], name="app_histori_code_bf381c_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="historicalassignment",
+            index=models.Index(fields=["id", "history_date"], name="app_histori_id_8f8b32_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="historicalassignment",
+            index=models.Index(fields=["task", "history_date"], name="app_histori_task_id_ea495d_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="historicalassignment",
+            index=models.Index(fields=["staff", "history_date"], name="app_histori_staff_i_4bcceb_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="historicalinfo",
+            index=models.Index(fields=["page", "history_date"], name="app_histori_page_da2ecd_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="historicalloadfunction",
+            index=models.Index(fields=["id", "history_date"], name="app_histori_id_bed6f1_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="historicalstaff",
+            index=models.Index(fields=["account", "history_date"], name="app_histori_account_a34c1b_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="historicalstaff",
+            index=models.Index(fields=["academic_group", "history_date"], name="app_histori_academi_31c72b_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="historicalstandardload",
+            index=models.Index(fields=["year", "history_date"], name="app_histori_year_34782d_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="historicaltask",
+            index=models.Index(fields=["id", "history_date"], name="app_histori_id_08a0c2_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="historicaltask",
+            index=models.Index(fields=["academic_group", "history_date"], name="app_histori_academi_5b2aba_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="historicaltask",
+            index=models.Index(fields=["load_function", "history_date"], name="app_histori_load_fu_da9082_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="historicaltask",
+            index=models.Index(fields=["unit", "history_date"], name="app_histori_unit_id_af8610_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="historicalunit",
+            index=models.Index(fields=["code", "history_date"], name="app_histori_code_f98212_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="historicalunit",
+            index=models.Index(fields=["academic_group", "history_date"], name="app_histori_academi_0317f4_idx"),
+        ),
+    ]
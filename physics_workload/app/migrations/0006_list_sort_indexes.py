@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-17 20:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("app", "0005_history_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["name"], name="app_task_name_9224c7_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["load_calc"], name="app_task_load_ca_01b65c_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="unit",
+            index=models.Index(fields=["name"], name="app_unit_name_e9560b_idx"),
+        ),
+    ]
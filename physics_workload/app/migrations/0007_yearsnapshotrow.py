@@ -0,0 +1,29 @@
+# Generated by Django 5.2.5 on 2026-10-17 21:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("app", "0006_list_sort_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="YearSnapshotRow",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("model", models.CharField(help_text="The name of the model the row is from.", max_length=32)),
+                ("row_pk", models.CharField(help_text="The primary key of the row, as text.", max_length=64)),
+                ("values", models.JSONField(help_text="The snapshotted fields of the row, by attribute name.")),
+                ("snapshot", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="row_set", to="app.yearsnapshot")),
+            ],
+            options={
+                "verbose_name": "Year Snapshot Row",
+                "verbose_name_plural": "Year Snapshot Rows",
+                "ordering": ["-snapshot__year"],
+                "indexes": [models.Index(fields=["model", "row_pk"], name="app_yearsna_model_3ab3a8_idx")],
+            },
+        ),
+    ]
@@ -1,9 +1,12 @@
 # -*- encoding: utf-8 -*-
 from app.models.academic_group import AcademicGroup
 from app.models.assignment import Assignment
+from app.models.data_version import bump_data_version, get_data_state, get_data_version
 from app.models.info import Info
 from app.models.load_function import LoadFunction
+from app.models.recalculation_job import RecalculationJob
 from app.models.staff import Staff
 from app.models.standard_load import StandardLoad
 from app.models.task import Task
 from app.models.unit import Unit
+from app.models.year_snapshot import YearSnapshot
@@ -17,6 +17,8 @@ class AcademicGroup(ModelCommon):
     which is more about user permissions.
     """
 
+    DYNAMIC_FIELDS = ["load_balance_historic", "load_balance_final"]
+
     icon = "users"
     url_root = "group"
 
@@ -65,26 +67,12 @@ class AcademicGroup(ModelCommon):
         :param user: The user.
         :return: True if the user is allowed to view the group.
         """
+        from app.auth import AccessResolver
+
         if super().has_access(user):
             return True
 
-        elif not user.is_anonymous:
-            return user.staff.academic_group == self
-
-        return False
-
-    def update_load(self) -> bool:
-        """
-        Updates the load balance for the group
-
-        :return: True if the load has changed.
-        """
-        aggregates: Dict[str, int] = self.staff_set.aggregate(Sum("load_target"), Sum("load_assigned"))
-        load_target: int = aggregates["load_target__sum"] if aggregates["load_target__sum"] else 0
-        load_assigned: int = aggregates["load_assigned__sum"] if aggregates["load_assigned__sum"] else 0
-
-        self.load_balance_final = load_assigned - load_target
-        self.save()
+        return self.pk in AccessResolver.for_user(user).academic_groups
 
     def get_load_balance(self) -> int:
         """
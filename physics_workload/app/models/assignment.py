@@ -15,6 +15,8 @@ class Assignment(ModelCommon):
     Pairs a Staff member up with the task they're performing.
     """
 
+    DYNAMIC_FIELDS = ["load_calc"]
+
     icon = "clipboard"
     url_root = "assignment"
 
@@ -78,23 +80,6 @@ class Assignment(ModelCommon):
         """
         return self.task.get_absolute_url()
 
-    def update_load(self) -> bool:
-        """
-        Updates the load for this assignment.
-        :return: True if the load has changed.
-        """
-        load: int = self.task.calculate_load(
-            students=self.students,
-            is_first_time=self.is_first_time,
-        )
-        if self.load_calc != load:
-            self.load_calc = load
-            self.save()
-            return True
-
-        else:
-            return False
-
 
 # @receiver(post_delete, sender=Assignment)
 # def apply_load(
@@ -1,19 +1,147 @@
 from abc import abstractmethod
+from contextlib import contextmanager
+from logging import Logger, getLogger
+from threading import local
+from typing import Any, Dict, Iterable, Iterator, List, Set, Type
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser, AnonymousUser
-from django.db.models import Model
+from django.db.models import DEFERRED, Index, Model
 from django.template.loader import render_to_string
 from simple_history.models import HistoricalRecords
 
+logger: Logger = getLogger(__name__)
+
+# The rows saved while history is suspended, for each model, in this thread.
+_suspended: local = local()
+
+
+@contextmanager
+def suspend_history(change_reason: str) -> Iterator[None]:
+    """
+    Suspends history while a bulk operation saves rows, then writes one historical record for each row it changed.
+
+    The records are only written if the operation succeeds. Nested suspensions are folded into the outermost one.
+
+    :param change_reason: The reason to give the historical records.
+    """
+    if getattr(_suspended, "pending", None) is not None:
+        yield
+        return
+
+    pending: Dict[Type[Model], Set[Any]] = {}
+    _suspended.pending = pending
+    try:
+        yield
+    finally:
+        _suspended.pending = None
+
+    for model, pks in pending.items():
+        rows: List[Model] = list(model.objects.filter(pk__in=pks))
+        model.history.bulk_history_create(rows, update=True, default_change_reason=change_reason)
+        logger.debug(f"Wrote {len(rows)} historical {model.__name__} records after suspending history.")
+
+
+def defer_history(model: Type[Model], pks: Iterable[Any]) -> bool:
+    """
+    Defers the historical records of saved rows until history is resumed, if it's suspended.
+
+    :param model: The model of the rows.
+    :param pks: The primary keys of the rows.
+    :return: True if history is suspended, so the records have been deferred.
+    """
+    if (pending := getattr(_suspended, "pending", None)) is None:
+        return False
+
+    pending.setdefault(model, set()).update(pks)
+    return True
+
+
+class IndexedHistoricalRecords(HistoricalRecords):
+    """
+    Historical records, indexed for finding the records of a row, or of rows related to another, by date.
+
+    Each historical table gets a composite index on the primary key and date,
+    which finding the latest record of each row before a date (e.g. `as_of`) looks up for every row;
+    and one on each foreign key and date, for finding the records of e.g. a staff member's assignments.
+    `as_of` is a single query that uses both. It's used to take snapshots of years rolled over before snapshots were kept;
+    the history pages read each year from its `YearSnapshot` instead.
+
+    Saves that only change a model's `DYNAMIC_FIELDS`, which are derived from other rows, don't write a record,
+    and nor do saves while history is suspended (see `suspend_history`).
+    Whether anything else changed is worked out from the values the row was loaded with (see `ModelCommon.from_db`),
+    so it doesn't cost another query.
+    """
+
+    def get_meta_options(self, model: Type[Model]) -> Dict[str, Any]:
+        """
+        :param model: The model the historical records are of.
+        :return: The options for the historical model's `Meta`, with the indexes added.
+        """
+        meta_fields: Dict[str, Any] = super().get_meta_options(model)
+        fields: List[str] = [model._meta.pk.attname] + [field.name for field in model._meta.fields if field.many_to_one]
+        meta_fields["indexes"] = tuple(meta_fields.get("indexes", ())) + tuple(Index(fields=[field, "history_date"]) for field in fields)
+        return meta_fields
+
+    def post_save(self, instance: Model, created: bool, using: str | None = None, **kwargs):
+        """
+        Writes a historical record of a saved row, unless nothing but its dynamic fields changed, or history is suspended.
+
+        :param instance: The saved row.
+        :param created: Whether the row is new.
+        :param using: The database saved to.
+        """
+        update_fields: Iterable[str] | None = kwargs.get("update_fields")
+        updated: bool = not created and not kwargs.get("raw", False) and getattr(settings, "SIMPLE_HISTORY_ENABLED", True)
+        unchanged: bool = updated and self.is_unchanged(instance, update_fields)
+        self.set_loaded_values(instance, update_fields)
+        if updated and (unchanged or defer_history(type(instance), [instance.pk])):
+            return
+
+        super().post_save(instance, created, using=using, **kwargs)
+
+    def is_unchanged(self, instance: Model, update_fields: Iterable[str] | None) -> bool:
+        """
+        :param instance: The saved row.
+        :param update_fields: The fields saved, or None if the whole row was.
+        :return: True if nothing but the row's dynamic fields has changed since it was loaded or last saved.
+        """
+        dynamic_fields: Set[str] = set(getattr(instance, "DYNAMIC_FIELDS", []))
+        if update_fields is not None:
+            return set(update_fields) <= dynamic_fields
+
+        # A row that wasn't loaded from the database, or was loaded without some fields, might have changed in any way.
+        loaded_values: Dict[str, Any] = getattr(instance, "_loaded_values", {})
+        fields: List[str] = [field.attname for field in self.fields_included(instance) if field.name not in dynamic_fields]
+        return all(field in loaded_values and loaded_values[field] == getattr(instance, field) for field in fields)
+
+    @staticmethod
+    def set_loaded_values(instance: Model, update_fields: Iterable[str] | None):
+        """
+        Records the values just saved as the ones the row was loaded with, so the next save is compared to them.
+
+        :param instance: The saved row.
+        :param update_fields: The fields saved, or None if the whole row was.
+        """
+        fields: List[str] = [field.attname for field in instance._meta.concrete_fields if field.attname not in instance.get_deferred_fields()]
+        if update_fields is not None:
+            fields = [field.attname for field in instance._meta.concrete_fields if field.name in update_fields or field.attname in update_fields]
+
+        instance.__dict__.setdefault("_loaded_values", {}).update({field: getattr(instance, field) for field in fields})
+
 
 class ModelCommon(Model):
     """
     Contains the framework for a DB model to have an icon and title associated with it
 
     Classes implement `icon` (a font-awesome icon name) and `url_root` (the Django URL resolver root for that model).
+
+    :attribute DYNAMIC_FIELDS: Fields calculated from other rows, rather than entered, which aren't worth a historical record by themselves.
     """
 
-    history = HistoricalRecords(inherit=True)
+    DYNAMIC_FIELDS: List[str] = []
+
+    history = IndexedHistoricalRecords(inherit=True)
 
     class Meta:
         abstract = True
@@ -34,6 +162,20 @@ class ModelCommon(Model):
         """
         raise NotImplementedError()
 
+    @classmethod
+    def from_db(cls, db: str | None, field_names: List[str], values: List[Any]) -> "ModelCommon":
+        """
+        Loads a row, keeping the values it was loaded with so saves can tell what's changed (see `IndexedHistoricalRecords`).
+
+        :param db: The database loaded from.
+        :param field_names: The attribute names of the fields loaded.
+        :param values: The values of the fields, or `DEFERRED` for those not loaded.
+        :return: The row.
+        """
+        instance: ModelCommon = super().from_db(db, field_names, values)
+        instance._loaded_values = {name: value for name, value in zip(field_names, values) if value is not DEFERRED}
+        return instance
+
     def get_absolute_url(self) -> str:
         """
         :return: The URL for the detail view of this particular instance of the model
@@ -0,0 +1,101 @@
+"""
+A version for the data in the database as a whole, that changes whenever any of it does.
+
+Anything cached that's worked out from the data, like a rendered table, is keyed by the version,
+so it's never served after the data changes; the stale entries just expire.
+The version's kept in the cache too, so every process sees the same one.
+Alongside it is whether the loads are stale (edits are waiting to be recalculated), which every page checks,
+so it's kept up to date as recalculations are queued and run rather than looked up in the database each time.
+"""
+
+from logging import Logger, getLogger
+from typing import Any, Dict, Type
+from uuid import uuid4
+
+from django.apps import apps
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from app.models.common import ModelCommon
+from app.models.year_snapshot import YearSnapshot
+
+logger: Logger = getLogger(__name__)
+
+# Holds the version along with whether the loads are stale.
+DATA_VERSION_KEY: str = "data_version_state"
+
+
+def get_data_state() -> Dict[str, Any]:
+    """
+    Gets the current data version and whether the loads are stale, starting a new version if there isn't one (e.g. it's been evicted).
+
+    Versions are random rather than counted, so a fresh one can never match anything cached under an old one.
+
+    :return: The `version`, and whether the loads are `stale`.
+    """
+    if state := cache.get(DATA_VERSION_KEY):
+        return state
+
+    # If another process starts one at the same time, use theirs.
+    cache.add(DATA_VERSION_KEY, {"version": uuid4().hex, "stale": apps.get_model("app", "RecalculationJob").objects.exists()}, timeout=None)
+    return cache.get(DATA_VERSION_KEY)
+
+
+def get_data_version() -> str:
+    """
+    :return: The current data version.
+    """
+    return get_data_state()["version"]
+
+
+def get_loads_stale() -> bool:
+    """
+    :return: True if there are edits that haven't been included in the loads yet.
+    """
+    return get_data_state()["stale"]
+
+
+def set_loads_stale(stale: bool):
+    """
+    Flags whether there are edits that haven't been included in the loads yet, keeping the data version.
+
+    :param stale: Whether the loads are stale.
+    """
+    cache.set(DATA_VERSION_KEY, get_data_state() | {"stale": stale}, timeout=None)
+
+
+def start_data_version():
+    """
+    Starts a new data version straight away, keeping whether the loads are stale.
+    """
+    cache.set(DATA_VERSION_KEY, get_data_state() | {"version": uuid4().hex}, timeout=None)
+    logger.debug("Started a new data version.")
+
+
+def bump_data_version():
+    """
+    Starts a new data version once the current transaction (if any) commits.
+
+    A transaction that saves many rows only starts one new version.
+    """
+    connection = transaction.get_connection()
+    if connection.in_atomic_block and any(function is start_data_version for _, function, _ in connection.run_on_commit):
+        return
+
+    transaction.on_commit(start_data_version)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def bump_data_version_on_change(sender: Type[Model], instance: Model, **kwargs):
+    """
+    Starts a new data version whenever a row is saved or deleted.
+
+    :param sender: The model of the row.
+    :param instance: The row.
+    """
+    if isinstance(instance, (ModelCommon, YearSnapshot)):
+        bump_data_version()
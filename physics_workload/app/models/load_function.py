@@ -1,11 +1,15 @@
-from typing import Dict
+from typing import Dict, Iterable, Type
 
 from django.contrib.auth.models import AbstractUser, AnonymousUser
 from django.core.validators import MinValueValidator
 from django.db.models import CharField, CheckConstraint, F, IntegerField, Q, TextField
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils.html import format_html
-from simpleeval import simple_eval
+from numpy import float64
+from numpy.typing import NDArray
 
+from app.expression import CompiledExpression, get_compiled_expression, invalidate_compiled_expression
 from app.models.common import ModelCommon
 
 
@@ -76,10 +80,44 @@ class LoadFunction(ModelCommon):
             names["e"] = unit.exams
 
         if len(names.keys()):
-            return simple_eval(self.expression, names=names)
+            return self.get_compiled_expression().evaluate(names)
         else:
             return 0
 
+    def evaluate_batch(
+        self,
+        students: Iterable[int | None],
+        lectures: Iterable[int | None] | None = None,
+        exams: Iterable[int | None] | None = None,
+    ) -> NDArray[float64]:
+        """
+        Runs the equation for many numbers of students (and lectures and exams) at once.
+
+        :param students: The number of students for each evaluation.
+        :param lectures: The number of lectures for each evaluation, if for a unit.
+        :param exams: The number of exams for each evaluation, if for a unit.
+        :return: The output of the equation for each.
+        """
+        return self.get_compiled_expression().evaluate_batch(students, lectures, exams)
+
+    def get_compiled_expression(self) -> CompiledExpression:
+        """
+        :return: The expression, parsed and checked, cached until the load function is next saved.
+        """
+        return get_compiled_expression(self.pk, self.expression)
+
     def has_access(self, user: AbstractUser | AnonymousUser) -> bool:
         """You can always see the load functions"""
         return True
+
+
+@receiver(post_save, sender=LoadFunction)
+@receiver(post_delete, sender=LoadFunction)
+def clear_compiled_expression(sender: Type[LoadFunction], instance: LoadFunction, **kwargs):
+    """
+    :param sender:
+    :param instance: The saved or deleted instance.
+    :param kwargs:
+    :return:
+    """
+    invalidate_compiled_expression(instance.pk)
@@ -0,0 +1,152 @@
+from datetime import timedelta
+from logging import Logger, getLogger
+from typing import TYPE_CHECKING, List
+
+from django.db import transaction
+from django.db.models import CharField, DateTimeField, Index, JSONField, Model, TextChoices, TextField
+from django.utils.timezone import now
+
+from app.models.data_version import get_loads_stale, set_loads_stale
+
+if TYPE_CHECKING:
+    from app.calculation.graph import Subgraph
+
+logger: Logger = getLogger(__name__)
+
+
+class RecalculationJob(Model):
+    """
+    A pending recalculation of loads, queued by an edit and run by the background worker.
+
+    Edits made while a job is still pending are merged into it, so a burst of edits only needs one recalculation.
+    Successful jobs are removed once run, so any jobs left mean the loads shown are out of date.
+    Failed jobs are kept, with the error, and retried along with the next job to run.
+    Whether there are any jobs is flagged in the cache as they're queued and run (see `set_loads_stale`), so checking is cheap.
+    """
+
+    class Status(TextChoices):
+        PENDING = "pending", "Pending"
+        RUNNING = "running", "Running"
+        FAILED = "failed", "Failed"
+
+    # A running job that hasn't finished after this long is assumed to have been abandoned, e.g. by a restart.
+    TIMEOUT: timedelta = timedelta(minutes=5)
+
+    status = CharField(max_length=8, choices=Status.choices, default=Status.PENDING)
+    subgraph = JSONField(
+        null=True,
+        blank=True,
+        help_text="The rows to recalculate, as from `Subgraph.to_json`. If blank, everything is recalculated.",
+    )
+    created = DateTimeField(auto_now_add=True)
+    started = DateTimeField(null=True, blank=True)
+    error = TextField(blank=True)
+
+    class Meta:
+        ordering = ("created",)
+        verbose_name = "Recalculation Job"
+        verbose_name_plural = "Recalculation Jobs"
+        indexes = [
+            Index(fields=["status", "created"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"Recalculation {self.pk} ({self.status})"
+
+    def get_subgraph(self) -> "Subgraph | None":
+        """
+        :return: The rows to recalculate, or None for everything.
+        """
+        from app.calculation.graph import Subgraph
+
+        return Subgraph.from_json(self.subgraph) if self.subgraph is not None else None
+
+    @classmethod
+    def queue(cls, subgraph: "Subgraph | None") -> "RecalculationJob":
+        """
+        Queues a recalculation, merging it into the pending job if there is one.
+
+        :param subgraph: The rows to recalculate, or None for everything.
+        :return: The pending job.
+        """
+        set_loads_stale(True)
+        with transaction.atomic():
+            job: RecalculationJob | None = cls.objects.select_for_update().filter(status=cls.Status.PENDING).first()
+            if not job:
+                return cls.objects.create(subgraph=subgraph.to_json() if subgraph is not None else None)
+
+            if job.subgraph is not None:
+                merged: Subgraph | None = job.get_subgraph() | subgraph if subgraph is not None else None
+                job.subgraph = merged.to_json() if merged is not None else None
+                job.save(update_fields=["subgraph"])
+
+        return job
+
+    @classmethod
+    def claim(cls) -> "RecalculationJob | None":
+        """
+        Claims the oldest job waiting to run, including any running job that looks to have been abandoned.
+
+        Claiming is a conditional update, so if several workers try to claim the same job only one succeeds.
+        The job's read again once claimed, as edits may have been merged into it since it was first read.
+
+        :return: The claimed job, or None if there's nothing to do.
+        """
+        abandoned = now() - cls.TIMEOUT
+        for job in cls.objects.filter(status=cls.Status.PENDING) | cls.objects.filter(status=cls.Status.RUNNING, started__lt=abandoned):
+            started = now()
+            if cls.objects.filter(pk=job.pk, status=job.status, started=job.started).update(status=cls.Status.RUNNING, started=started):
+                job.refresh_from_db()
+                job.retry_failed()
+                return job
+
+        return None
+
+    def retry_failed(self):
+        """
+        Adds the rows of any failed jobs to this one, so they're recalculated along with it.
+        """
+        self.retrying: List[int] = []
+        for job in RecalculationJob.objects.filter(status=self.Status.FAILED):
+            logger.info(f"{self} is retrying {job}.")
+            self.retrying.append(job.pk)
+            if self.subgraph is not None:
+                subgraph: Subgraph | None = job.get_subgraph()
+                self.subgraph = (self.get_subgraph() | subgraph).to_json() if subgraph is not None else None
+
+        if self.retrying:
+            self.save(update_fields=["subgraph"])
+
+    @classmethod
+    def is_stale(cls) -> bool:
+        """
+        :return: True if there are edits that haven't been included in the loads yet, including any that failed.
+        """
+        return get_loads_stale()
+
+    @classmethod
+    def update_stale(cls):
+        """
+        Flags whether the loads are stale from the jobs in the database, in case another process flagged it at the same time.
+        """
+        set_loads_stale(cls.objects.exists())
+
+    def finish(self):
+        """
+        Removes the job once it's run successfully, along with any failed jobs it retried.
+        """
+        RecalculationJob.objects.filter(pk__in=getattr(self, "retrying", [])).delete()
+        self.delete()
+        RecalculationJob.update_stale()
+
+    def fail(self, error: Exception):
+        """
+        Marks the job as failed, so the error can be seen; it's retried along with the next job.
+
+        :param error: The error that caused it to fail.
+        """
+        logger.error(f"{self} failed: {error}")
+        self.status = self.Status.FAILED
+        self.error = f"{type(error).__name__}: {error}"
+        self.save(update_fields=["status", "error"])
+        set_loads_stale(True)
@@ -11,7 +11,6 @@ from django.db.models import (
     IntegerField,
     OneToOneField,
     Q,
-    Sum,
     TextField,
 )
 from django.db.models.deletion import PROTECT, SET_NULL
@@ -138,10 +137,12 @@ class Staff(ModelCommon):
         :param user: The user in question.
         :return: True if the user has access, or the user is this staff member.
         """
+        from app.auth import AccessResolver
+
         if super().has_access(user):
             return True
         else:
-            return user == self.user
+            return self.pk in AccessResolver.for_user(user).staff
 
     def __str__(self):
         """
@@ -168,49 +169,6 @@ class Staff(ModelCommon):
         """
         return self.load_assigned - self.load_target
 
-    def update_load_assigned(self):
-        """
-        Updates own assigned load by summing the load of the assignments.
-
-        :return: True if the total load has changed, false if not.
-        """
-        from app.models.standard_load import StandardLoad
-
-        load_assigned: int = StandardLoad.objects.latest().load_fte_misc * self.fte_fraction
-        if assignment_total := self.assignment_set.aggregate(Sum("load_calc"))["load_calc__sum"]:
-            load_assigned += assignment_total
-
-        if self.load_assigned != -load_assigned:
-            self.load_assigned = load_assigned
-            self.save()
-            return True
-
-        else:
-            return False
-
-    def update_load_target(self):
-        """
-        Updates the target load from the standard load settings.
-
-        :return: True if the load target has changed, false if not.
-        """
-        from app.models import StandardLoad
-
-        if self.hours_fixed:
-            load_target = self.hours_fixed
-        elif self.fte_fraction:
-            load_target = self.fte_fraction * StandardLoad.objects.latest().target_load_per_fte_calc
-        else:
-            # This is someone who doesn't have set teaching hours, ignore
-            return False
-
-        if self.load_target != load_target:
-            self.load_target = load_target
-            self.save()
-            return True
-        else:
-            return False
-
 
 @receiver(post_save, sender=CustomUser)
 def update_staff_link(sender, instance, created, **kwargs):
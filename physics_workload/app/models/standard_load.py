@@ -1,15 +1,11 @@
 from logging import Logger, getLogger
-from typing import Dict
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser, AnonymousUser
 from django.core.validators import MinValueValidator
-from django.db.models import FloatField, IntegerField, Sum, TextField
+from django.db.models import FloatField, IntegerField, TextField
 
-from app.models.assignment import Assignment
 from app.models.common import ModelCommon
-from app.models.staff import Staff
-from app.models.task import Task
 
 logger: Logger = getLogger(__name__)
 
@@ -19,6 +15,8 @@ class StandardLoad(ModelCommon):
     Standard loads for an academic year
     """
 
+    DYNAMIC_FIELDS = ["target_load_per_fte_calc"]
+
     icon = "weight-hanging"
     url_root = "standard_load"
 
@@ -153,79 +151,3 @@ class StandardLoad(ModelCommon):
         :return: True, always
         """
         return True
-
-    def update_target_load_per_fte(self):
-        """
-
-        :return:
-        """
-        # C = FTE fraction (raw) - staff.fte_fraction
-        # D = Fixed hours (raw) - staff.hours_fixed
-        # E = Equivalent FTE - either actual FTE [C], or fixed hours [D] / 'average teaching per staff' [J61]
-        # F = Sum of workload for each staff member (sum of staff.assignment_set.load_calc)
-        # G = Duplicate of [F], for a subset. Deprecated?
-        # H = For FTE staff, standard_load.misc_load * FTE fraction [C]
-        # I = Total load (including misc fraction [H] and all assignments [F])
-        # J = What the calculated 'average' load is, scaled to that employee's FTE Fraction [E]
-        # J58 = The sum of all workloads for FTE=1.0 staff, divided by the number of FTE=1.0 staff
-        # J60 = The 'average' of 'average load scaled per FTE' (old algorithm)
-        # J61 = The sum of all workloads inc. misc [I] / the sum of all FTE fractions [E]
-        # H_{teaching} = \frac{\sum H_{assigned} + \sum F_{contract} * H_{misc}}{\sum F_{contract} + \frac{\sum H_{fixed}}{H_{teaching}}}
-        # H_{teaching} \sum F_{contract} + \sum H_{fixed} = \sum H_{assigned} + \sum F_{contract} * H_{misc}
-        # H_{teaching} = \frac{\sum H_{assigned} + \sum F_{contract} * H_{misc} - \sum H_{fixed}}{\sum F_{contract}}
-
-        target_old: int = self.target_load_per_fte_calc
-
-        staff_aggregation: Dict[str, int] = Staff.objects.aggregate(Sum("fte_fraction"), Sum("hours_fixed"))
-        total_fixed_hours: int = staff_aggregation.get("hours_fixed__sum", 0)
-        total_fte_fraction: int = staff_aggregation.get("fte_fraction__sum", 0)
-        assignment_aggregation: Dict[str, int] = Assignment.objects.aggregate(Sum("load_calc"))
-        total_assigned_hours: int = assignment_aggregation.get("load_calc__sum", 0)
-
-        if total_fte_fraction and total_assigned_hours:
-            self.target_load_per_fte_calc = int(self.load_fte_misc + (total_assigned_hours - total_fixed_hours) / total_fte_fraction)
-        else:
-            self.target_load_per_fte_calc = int(self.target_load_per_fte)
-
-        logger.info(f"Recalculated load target per FTE from {target_old} to {self.target_load_per_fte_calc}.")
-        self.save()
-
-    def update_calculated_loads(
-        self,
-        previous_standard_load: "StandardLoad" = None,
-    ) -> bool:
-        """
-
-        :param previous_standard_load: The previous version of the standard loads.
-        :return: True if other models were updated, False otherwise.
-        """
-        logger.debug("Updating calculated loads...")
-
-        if previous_standard_load:
-            # Has an update actually changed the misc load? That would require a reevaluation of teaching workload.
-            recalculate_target_load: bool = self.load_fte_misc == previous_standard_load.load_fte_misc
-        else:
-            # A staff member has been created/task has been deleted/whatever
-            recalculate_target_load: bool = True
-
-        for task in Task.objects.all():
-            # Step over all tasks, and see if the changes to this form have changed the total load
-            logger.debug(f"Updating task {task}...")
-            if task.update_load():
-                logger.debug("Updating task assignments...")
-
-                for assignment in task.assignment_set.all():
-                    logger.debug(f"Updating {assignment}...")
-                    if assignment.update_load():
-                        logger.debug(f"updating {assignment} staff...")
-                        recalculate_target_load = True
-                        assignment.staff.update_load_assigned()
-
-        if not previous_standard_load or recalculate_target_load:
-            logger.debug("Updating standard load year with new assigned total")
-            self.update_target_load_per_fte()
-
-            for staff in Staff.objects.all():
-                staff.update_load_target()
-
-        return recalculate_target_load
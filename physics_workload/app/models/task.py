@@ -1,10 +1,10 @@
 # -*- encoding: utf-8 -*-
 from logging import Logger, getLogger
-from typing import Type
+from typing import TYPE_CHECKING, Type
 
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db.models import PROTECT, BooleanField, CharField, CheckConstraint, FloatField, IntegerField, Q, TextField, UniqueConstraint
+from django.db.models import PROTECT, BooleanField, CharField, CheckConstraint, FloatField, Index, IntegerField, Q, TextField, UniqueConstraint
 from django.db.models.signals import pre_save
 from django.dispatch import receiver
 from django.utils.html import format_html
@@ -15,6 +15,9 @@ from app.models.common import ModelCommon
 from app.models.load_function import LoadFunction
 from app.models.unit import Unit
 
+if TYPE_CHECKING:
+    from app.calculation.context import CalculationContext
+
 # Set up logging for this file
 logger: Logger = getLogger(__name__)
 
@@ -24,6 +27,8 @@ class Task(ModelCommon):
     This is the model for tasks
     """
 
+    DYNAMIC_FIELDS = ["load_calc", "load_calc_first", "name"]
+
     icon = "clipboard"
     url_root = "task"
 
@@ -163,6 +168,10 @@ class Task(ModelCommon):
         )
         verbose_name = "Task"
         verbose_name_plural = "Tasks"
+        indexes = [
+            Index(fields=["name"]),
+            Index(fields=["load_calc"]),
+        ]
         constraints = [
             UniqueConstraint(
                 fields=["unit", "title"], name="unit_task_name", violation_error_message="Units cannot have multiple tasks with the same name."
@@ -189,25 +198,47 @@ class Task(ModelCommon):
         """
         :return: The name of the task, with unit code if possible
         """
-        if self.unit:
-            return f"{self.unit.code} - {self.title}"
-        elif self.academic_group:
-            return f"{self.academic_group.short_name} - {self.title}"
+        return Task.format_name(
+            self.title,
+            self.unit.code if self.unit else None,
+            self.academic_group.short_name if self.academic_group else None,
+        )
+
+    @staticmethod
+    def format_name(title: str, unit_code: str | None, academic_group_short_name: str | None) -> str:
+        """
+        :param title: The title of the task.
+        :param unit_code: The code of the unit the task belongs to, if any.
+        :param academic_group_short_name: The short name of the group the task belongs to, if any.
+        :return: The name of the task, with unit code if possible
+        """
+        if unit_code:
+            return f"{unit_code} - {title}"
+        elif academic_group_short_name:
+            return f"{academic_group_short_name} - {title}"
         else:
-            return f"{self.title}"
+            return f"{title}"
 
     def get_name_with_load(self) -> str:
         """
         :return: The name of the task, with unit code if possible, and load hours
         """
-        text: str = self.get_name()
+        return Task.format_name_with_load(self.get_name(), self.load_calc, self.load_calc_first)
 
-        if self.load_calc != self.load_calc_first:
-            text += f" [{self.load_calc:.0f} / {self.load_calc_first:.0f}]"
-        else:
-            text += f" [{self.load_calc:.0f}]"
+    @staticmethod
+    def format_name_with_load(name: str, load_calc: float, load_calc_first: float) -> str:
+        """
+        Appends the load hours to a task name. Split out so bulk updates can name tasks without loading them.
 
-        return text
+        :param name: The name of the task, as from `get_name()`.
+        :param load_calc: The calculated load.
+        :param load_calc_first: The calculated load for first-time assignments.
+        :return: The name with the load hours appended.
+        """
+        if load_calc != load_calc_first:
+            return f"{name} [{load_calc:.0f} / {load_calc_first:.0f}]"
+        else:
+            return f"{name} [{load_calc:.0f}]"
 
     def get_instance_header(self, text: str | None = None) -> str:
         """
@@ -229,10 +260,10 @@ class Task(ModelCommon):
             return super().get_absolute_url()
 
     def has_any_provisional(self) -> bool:
-        return any(self.assignment_set.values_list("is_provisional", flat=True))
+        return any(assignment.is_provisional for assignment in self.assignment_set.all())
 
     def has_any_first_time(self) -> bool:
-        return any(self.assignment_set.values_list("is_first_time", flat=True))
+        return any(assignment.is_first_time for assignment in self.assignment_set.all())
 
     def has_access(self, user: AbstractUser) -> bool:
         """
@@ -240,77 +271,28 @@ class Task(ModelCommon):
         :param user: The user
         :return: True if the user is assigned to this task
         """
-        if super().has_access(user):
-            return True
-        elif user.is_anonymous:
-            return False
-        else:
-            return user.staff in self.assignment_set.values_list("staff", flat=True)
-
-    def update_load(self, cascade=True, save=False) -> True:
-        """
-        Updates the load for this task, and any associated assignments.
-
-        :param cascade: If true, update the load for this task and sub-assignments.
-        :return: True if the load has changed, false if not.
-        """
-        logger.debug(f"{self}: Updating load...")
-
-        if self.is_full_time:
-            # This is not great
-            # If a task is 'full time', then it takes as long as the 'target load per FTE'
-            # This is, of course, leads to recursion.
-
-            load_calc = self.calculate_load(students=None)
-            load_calc_first = load_calc
-
-        else:
-            # If this is a marginally more sane task
-
-            students: int = self.students
-            if not self.students and self.unit:
-                students = self.unit.students
-
-            load_calc = self.calculate_load(
-                students=students,
-                is_first_time=False,
-            )
-            load_calc_first = self.calculate_load(
-                students=students,
-                is_first_time=True,
-            )
-
-        if self.load_calc != load_calc or self.load_calc_first != load_calc_first:
-            # If this has changed any of the values, then update the assignments and return that it has
-
-            self.load_calc_first = load_calc_first
-            self.load_calc = load_calc
-            self.save()
-
-            if cascade:
-                for assignment in self.assignment_set.all():
-                    assignment.update_load()
+        from app.auth import AccessResolver
 
+        if super().has_access(user):
             return True
 
-        else:
-            # The calculated load hasn't changed, so we don't need to cascade that up
-            return False
+        return self.pk in AccessResolver.for_user(user).tasks
 
-    def calculate_load(self, students: int | None, is_first_time: bool = False) -> float:
+    def calculate_load(self, students: int | None, is_first_time: bool = False, context: "CalculationContext | None" = None) -> float:
         """
+        :param students: The number of students to calculate the load for.
+        :param is_first_time: Whether to calculate the load for a first-time assignment.
+        :param context: The standard load to calculate against, defaults to the latest.
         :return:
         """
-        if self.is_full_time:
-            # ==== IF THIS IS A FULL-TIME TASK ====
-            from app.models.standard_load import StandardLoad
+        if context is None and (self.is_full_time or self.is_lead):
+            from app.calculation.context import CalculationContext
 
-            standard_load: StandardLoad = StandardLoad.objects.latest()
-            if standard_load.target_load_per_fte_calc:
-                load_calc = standard_load.target_load_per_fte_calc
-            else:
-                load_calc = standard_load.target_load_per_fte
+            context = CalculationContext.for_year()
 
+        if self.is_full_time:
+            # ==== IF THIS IS A FULL-TIME TASK ====
+            load_calc = context.target_load_per_fte
             load_calc_first = load_calc
 
         elif self.is_lead:
@@ -318,7 +300,7 @@ class Task(ModelCommon):
             # SPREADSHEET LOGIC
             from app.models.standard_load import StandardLoad
 
-            standard_load: StandardLoad = StandardLoad.objects.latest()
+            standard_load: StandardLoad = context.standard_load
 
             unit: Unit = self.unit
 
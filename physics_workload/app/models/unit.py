@@ -1,7 +1,7 @@
 # -*- encoding: utf-8 -*-
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db.models import BooleanField, CharField, CheckConstraint, F, FloatField, IntegerField, Q, TextField
+from django.db.models import BooleanField, CharField, CheckConstraint, F, FloatField, Index, IntegerField, Q, TextField
 from django.db.models.deletion import PROTECT
 from simple_history.models import HistoricForeignKey
 
@@ -88,6 +88,9 @@ class Unit(ModelCommon):
         ordering = ["name"]
         verbose_name = "Module"
         verbose_name_plural = "Modules"
+        indexes = [
+            Index(fields=["name"]),
+        ]
         constraints = [
             CheckConstraint(
                 check=Q(exam_mark_fraction__lte=1 - F("coursework_mark_fraction"))
@@ -125,42 +128,9 @@ class Unit(ModelCommon):
         :param user: The user
         :return: True if the user is assigned to a task in this module
         """
+        from app.auth import AccessResolver
+
         if super().has_access(user):
             return True
-        elif not user.is_anonymous:
-            for task in self.task_set.all():
-                if user.staff in task.assignment_set.values_list("staff", flat=True):
-                    return True
-
-        return False
-
-    def update_load(self) -> bool:
-        """
-        :return: True if the load of any of the tasks needed updating.
-        """
-        recalculate_loads: bool = False
-
-        for task in self.task_set.all():
-            # We don't use this but let's ignore the warning for now
-            task_old_load_calc: int = task.load_calc  # noqa: F841
-            task_old_load_calc_first: int = task.load_calc_first  # noqa: F841
-
-            task_load_has_changed: bool = task.update_load()
-
-            if task_load_has_changed:
-                # If it actually has an effect, then flag that fact and update the task
-                recalculate_loads = True
-
-                for assignment in task.assignment_set.all():
-                    if assignment.update_load():
-                        # If this has actually changed the assignment loads too, then update them and the staff
-                        assignment.staff.update_load_assigned()
-
-        if recalculate_loads:
-            # If we need to update the standard load, then do so
-            from app.models.standard_load import StandardLoad
-
-            standard_load: StandardLoad = StandardLoad.objects.latest()
-            standard_load.update_target_load_per_fte()
 
-        return recalculate_loads
+        return self.pk in AccessResolver.for_user(user).units
@@ -0,0 +1,277 @@
+from datetime import datetime
+from logging import Logger, getLogger
+from typing import Any, Dict, List, Tuple, Type
+
+from django.db.models import CASCADE, CharField, DateTimeField, ForeignKey, Index, IntegerField, JSONField, Model, QuerySet
+
+from app.models.academic_group import AcademicGroup
+from app.models.assignment import Assignment
+from app.models.staff import Staff
+from app.models.standard_load import StandardLoad
+from app.models.task import Task
+from app.models.unit import Unit
+
+logger: Logger = getLogger(__name__)
+
+
+class YearSnapshot(Model):
+    """
+    The loads of the whole department at the end of an academic year, taken when it's rolled over.
+
+    Each model's rows are stored as columns (one list of values per field), so a whole year is read in one lookup,
+    rather than reconstructing it from the history of every change ever made.
+    Each row is also stored on its own as a `YearSnapshotRow`, so the history of one row is read without the whole of every year.
+    Snapshots can't be changed once they've been taken.
+
+    :attribute FIELDS: The field each model's rows are stored in.
+    :attribute COLUMNS: The fields stored for each model, by attribute name.
+    """
+
+    FIELDS: Dict[Type[Model], str] = {
+        Staff: "staff",
+        Assignment: "assignments",
+        Task: "tasks",
+        Unit: "units",
+        AcademicGroup: "academic_groups",
+    }
+
+    COLUMNS: Dict[Type[Model], List[str]] = {
+        Staff: [
+            "account",
+            "name",
+            "academic_group_id",
+            "fte_fraction",
+            "hours_fixed",
+            "load_target",
+            "load_assigned",
+            "load_external",
+            "load_balance_final",
+            "load_balance_historic",
+        ],
+        Assignment: ["id", "task_id", "staff_id", "students", "is_first_time", "is_provisional", "load_calc"],
+        Task: ["id", "name", "title", "unit_id", "academic_group_id", "is_required", "is_full_time", "load_calc", "load_calc_first"],
+        Unit: [
+            "code",
+            "name",
+            "academic_group_id",
+            "students",
+            "lectures",
+            "problem_classes",
+            "coursework",
+            "synoptic_lectures",
+            "exams",
+            "credits",
+            "exam_mark_fraction",
+            "coursework_mark_fraction",
+            "has_dissertation",
+            "has_placement",
+        ],
+        AcademicGroup: ["code", "name", "short_name", "load_balance_final", "load_balance_historic"],
+    }
+
+    year = IntegerField(primary_key=True, help_text="The academic year, as for the standard load.")
+    date = DateTimeField(help_text="When the year was rolled over.")
+    standard_load = JSONField(help_text="The standard load for the year.")
+    staff = JSONField()
+    assignments = JSONField()
+    tasks = JSONField()
+    units = JSONField()
+    academic_groups = JSONField()
+
+    class Meta:
+        ordering = ["-year"]
+        get_latest_by = "year"
+        verbose_name = "Year Snapshot"
+        verbose_name_plural = "Year Snapshots"
+
+    def __str__(self) -> str:
+        # The same as the standard load for the year.
+        return str(StandardLoad(year=self.year))
+
+    def get_absolute_url(self) -> str:
+        """
+        :return: The part of the URL for this year, relative to a history page.
+        """
+        return f"{self.year}/"
+
+    def save(self, *args, **kwargs):
+        """
+        Saves a new snapshot.
+
+        :raises ValueError: If the snapshot has already been saved, as they can't be changed.
+        """
+        if not self._state.adding:
+            raise ValueError(f"The snapshot of {self} has already been taken, and can't be changed.")
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def take(cls, standard_load: StandardLoad, date: datetime) -> "YearSnapshot":
+        """
+        Takes a snapshot of the department as it is in the database.
+
+        :param standard_load: The standard load for the year that's ending.
+        :param date: When the year was rolled over.
+        :return: The new snapshot.
+        """
+        return cls._take(standard_load, date, {model: model.objects.all() for model in cls.COLUMNS})
+
+    @classmethod
+    def take_from_history(cls, standard_load_historic: Model) -> "YearSnapshot":
+        """
+        Takes a snapshot of a past year from the historical records as of when it was rolled over,
+        for years rolled over before snapshots were kept.
+        Each model's rows are read in one `as_of` query, which looks up the latest record of each row before the date
+        in the historical table's index on primary key and date (see `IndexedHistoricalRecords`).
+
+        :param standard_load_historic: The historical record of the standard load, written when the year was rolled over.
+        :return: The new snapshot.
+        """
+        date: datetime = standard_load_historic.history_date
+        return cls._take(standard_load_historic, date, {model: model.history.as_of(date) for model in cls.COLUMNS})
+
+    @classmethod
+    def _take(cls, standard_load: Model, date: datetime, querysets: Dict[Type[Model], QuerySet]) -> "YearSnapshot":
+        """
+        :param standard_load: The standard load for the year, or its historical record.
+        :param date: When the year was rolled over.
+        :param querysets: The rows to snapshot, for each model.
+        :return: The new snapshot.
+        """
+        snapshot: YearSnapshot = cls(
+            year=standard_load.year,
+            date=date,
+            standard_load={field.attname: getattr(standard_load, field.attname) for field in StandardLoad._meta.concrete_fields},
+        )
+        snapshot_rows: List[YearSnapshotRow] = []
+        for model, columns in cls.COLUMNS.items():
+            rows: List[Tuple] = list(querysets[model].order_by(model._meta.pk.attname).values_list(*columns))
+            setattr(snapshot, cls.FIELDS[model], {column: [row[index] for row in rows] for index, column in enumerate(columns)})
+            index_pk: int = columns.index(model._meta.pk.attname)
+            snapshot_rows += [
+                YearSnapshotRow(snapshot=snapshot, model=model._meta.model_name, row_pk=str(row[index_pk]), values=dict(zip(columns, row)))
+                for row in rows
+            ]
+
+        snapshot.save()
+        YearSnapshotRow.objects.bulk_create(snapshot_rows)
+        logger.info(f"Took snapshot of {snapshot}.")
+        return snapshot
+
+    @classmethod
+    def get_history(cls, model: Type[Model], pk: Any) -> List[Model]:
+        """
+        Gets a row as it was at the end of each past year, newest first.
+
+        Each instance has the `snapshot` it came from set on it.
+
+        :param model: The model of the row.
+        :param pk: The primary key of the row.
+        :return: The row in each year it existed, as unsaved instances.
+        """
+        snapshot_rows: QuerySet = YearSnapshotRow.objects.filter(model=model._meta.model_name, row_pk=str(pk))
+        instances: List[Model] = []
+        for snapshot_row in snapshot_rows.select_related("snapshot").only("values", "snapshot__year", "snapshot__date"):
+            instance: Model = model(**snapshot_row.values)
+            instance.snapshot = snapshot_row.snapshot
+            instances.append(instance)
+
+        return instances
+
+    def get_standard_load(self) -> StandardLoad:
+        """
+        :return: The standard load for the year, as an unsaved instance.
+        """
+        return StandardLoad(**self.standard_load)
+
+    def get_instances(self, model: Type[Model]) -> Dict[Any, Model]:
+        """
+        Gets the rows of a model as they were, as unsaved instances.
+
+        The instances only have the fields in the snapshot set, and are cached on the snapshot.
+
+        :param model: The model to get the rows of.
+        :return: The instances, by primary key.
+        """
+        cache: Dict[Type[Model], Dict[Any, Model]] = self.__dict__.setdefault("_instances", {})
+        if model not in cache:
+            columns: Dict[str, List[Any]] = getattr(self, self.FIELDS[model])
+            names: List[str] = list(columns)
+            instances: List[Model] = [model(**dict(zip(names, values))) for values in zip(*columns.values())]
+            cache[model] = {instance.pk: instance for instance in instances}
+
+        return cache[model]
+
+    def get_instance(self, model: Type[Model], pk: Any) -> Model | None:
+        """
+        :param model: The model to get the row of.
+        :param pk: The primary key of the row.
+        :return: The row as it was, as an unsaved instance, or None if it didn't exist.
+        """
+        if instances := self.__dict__.get("_instances", {}).get(model):
+            return instances.get(pk)
+
+        # Rather than build every row, just find the one.
+        columns: Dict[str, List[Any]] = getattr(self, self.FIELDS[model])
+        try:
+            index: int = columns[model._meta.pk.attname].index(pk)
+        except ValueError:
+            return None
+        return model(**{name: values[index] for name, values in columns.items()})
+
+    def get_tasks(self) -> Dict[Any, Task]:
+        """
+        Gets the tasks as they were, with their units and groups as they were too.
+
+        :return: The tasks, by primary key.
+        """
+        units: Dict[Any, Unit] = self.get_instances(Unit)
+        academic_groups: Dict[Any, AcademicGroup] = self.get_instances(AcademicGroup)
+
+        tasks: Dict[Any, Task] = self.get_instances(Task)
+        for task in tasks.values():
+            if task.unit_id is not None:
+                task.unit = units[task.unit_id]
+            if task.academic_group_id is not None:
+                task.academic_group = academic_groups[task.academic_group_id]
+
+        return tasks
+
+    def get_assignments(self, **filters: Any) -> List[Assignment]:
+        """
+        Gets the assignments as they were, with their staff and tasks as they were too.
+
+        :param filters: Values of the assignment fields to match, by attribute name, e.g. `staff_id`.
+        :return: The matching assignments.
+        """
+        staff: Dict[Any, Staff] = self.get_instances(Staff)
+        tasks: Dict[Any, Task] = self.get_tasks()
+
+        assignments: List[Assignment] = []
+        for assignment in self.get_instances(Assignment).values():
+            if all(getattr(assignment, name) == value for name, value in filters.items()):
+                assignment.staff = staff[assignment.staff_id]
+                assignment.task = tasks[assignment.task_id]
+                assignments.append(assignment)
+
+        return assignments
+
+
+class YearSnapshotRow(Model):
+    """
+    One row of a model, as it was in a year snapshot.
+
+    These are written along with the snapshot, and can't be changed either.
+    """
+
+    snapshot = ForeignKey(YearSnapshot, on_delete=CASCADE, related_name="row_set")
+    model = CharField(max_length=32, help_text="The name of the model the row is from.")
+    row_pk = CharField(max_length=64, help_text="The primary key of the row, as text.")
+    values = JSONField(help_text="The snapshotted fields of the row, by attribute name.")
+
+    class Meta:
+        ordering = ["-snapshot__year"]
+        verbose_name = "Year Snapshot Row"
+        verbose_name_plural = "Year Snapshot Rows"
+        indexes = [
+            Index(fields=["model", "row_pk"]),
+        ]
@@ -2,15 +2,17 @@
 Handles the views for the Academic Groups
 """
 
-from django.db.models import Count
+from django.db.models import Count, Prefetch
 from iommi import LAST, Column, Field, Form, Header, Page, Table, html
 
+from app.calculation.balances import get_academic_group_balance_total
 from app.forms.academic_group import AcademicGroupDetailForm
 from app.forms.info import InfoForm
 from app.forms.task import TaskForm
-from app.models import AcademicGroup, Info, Unit
+from app.models import AcademicGroup, Info, Task, Unit
 from app.pages.components.suffixes import SuffixCreate, SuffixDelete, SuffixEdit
 from app.style import get_balance_classes
+from app.tables.cached import CachedTable
 from app.tables.staff import StaffTable
 from app.tables.task import TaskTable
 
@@ -73,8 +75,12 @@ class AcademicGroupDetail(Page):
             cell__template="app/academic_group/task_set.html",
             after="students",
         ),
-        rows=lambda params, **_: Unit.objects.filter(academic_group=params.academic_group).annotate(
-            assignment_open=Count("task_set__is_required") - Count("task_set__assignment_set"),
+        rows=lambda params, **_: (
+            Unit.objects.filter(academic_group=params.academic_group)
+            .annotate(
+                assignment_open=Count("task_set__is_required") - Count("task_set__assignment_set"),
+            )
+            .prefetch_related(Prefetch("task_set", queryset=TaskTable.prefetch_assignments(Task.objects.all())))
         ),
         page_size=20,
         h_tag__tag="h2",
@@ -149,19 +155,25 @@ class AcademicGroupList(Page):
         instance=lambda **_: Info.objects.get(page="academic_group"),
     )
 
-    list = Table(
+    list = CachedTable(
         h_tag=None,
         auto=dict(
             model=AcademicGroup,
             include=["name", "load_balance_final"],
         ),
-        rows=AcademicGroup.objects.all(),
+        rows=AcademicGroup.objects.annotate(
+            staff_count=Count("staff", distinct=True),
+            unit_count=Count("unit", distinct=True),
+            load_balance=get_academic_group_balance_total(),
+        ),
         columns=dict(
             staff=Column(
-                cell__value=lambda row, **_: row.staff_set.count(),
+                attr="staff_count",
+                sortable=True,
             ),
             units=Column(
-                cell__value=lambda row, **_: row.unit_set.count(),
+                attr="unit_count",
+                sortable=True,
             ),
             name__cell__url=lambda row, request, **_: row.get_absolute_url_authenticated(request.user),
             load_balance=Column(
@@ -169,7 +181,9 @@ class AcademicGroupList(Page):
                 after="units",
                 group="Load Balance",
                 display_name="Current",
-                cell=dict(value=lambda row, **_: row.get_load_balance(), attrs__class=lambda value, **_: get_balance_classes(value)),
+                attr="load_balance",
+                sortable=True,
+                cell__attrs__class=lambda value, **_: get_balance_classes(value),
             ),
             load_balance_historic=dict(
                 include=lambda request, **_: request.user.is_staff,
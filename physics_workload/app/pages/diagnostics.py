@@ -0,0 +1,45 @@
+"""
+Handles the views for diagnosing slow recalculations.
+"""
+
+from iommi import Column, Header, Page, Table
+
+from app.calculation.profiling import get_recent_profiles
+from app.models import RecalculationJob
+
+
+class DiagnosticsPage(Page):
+    """
+    Shows the recent recalculations, and where their time went,
+    plus any recalculations waiting to run or that have failed.
+    """
+
+    header = Header("Diagnostics")
+
+    profiles = Table(
+        title="Recent Recalculations",
+        rows=lambda **_: get_recent_profiles(),
+        sortable=False,
+        empty_message="No recalculations have run recently.",
+        columns=dict(
+            started=Column(cell__format=lambda value, **_: value.strftime("%Y-%m-%d %H:%M:%S")),
+            label=Column(display_name="Recalculated"),
+            seconds=Column(display_name="Time (s)", cell__format=lambda value, **_: f"{value:.3f}"),
+            queries=Column(),
+            rows_written=Column(display_name="Rows Written"),
+            cycles=Column(),
+            converged=Column.boolean(),
+            phases=Column(
+                cell__format=lambda value, **_: "; ".join(f"{phase.name}: {phase.seconds:.3f}s, {phase.queries} queries" for phase in value),
+            ),
+        ),
+    )
+    jobs = Table(
+        title="Queued Recalculations",
+        auto=dict(
+            model=RecalculationJob,
+            include=["status", "created", "started", "error"],
+        ),
+        rows=lambda **_: RecalculationJob.objects.all(),
+        empty_message="No recalculations are waiting to run.",
+    )
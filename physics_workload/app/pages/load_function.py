@@ -2,19 +2,19 @@
 Handles the views for the Load Functions Groups
 """
 
-from typing import List
+from typing import Dict, List
 
 from dash_bootstrap_templates import load_figure_template
 from django.template import Template
-from iommi import Header, Page, Table, html
-from plotly.graph_objs import Figure, Layout, Scatter
-from plotly.graph_objs.layout import XAxis, YAxis
-from plotly.offline import plot
+from iommi import Header, Page, html
 
+from app.assets import chart_js
+from app.charts import chart, get_load_function_series
 from app.forms.info import InfoForm
 from app.forms.load_function import LoadFunctionForm
 from app.models import Info, LoadFunction
 from app.pages.components.suffixes import SuffixCreate, SuffixDelete, SuffixEdit
+from app.tables.cached import CachedTable
 
 load_figure_template("bootstrap_dark")
 
@@ -82,37 +82,25 @@ class LoadFunctionDetail(Page):
         ),
         editable=False,
     )
-    plotly = Template("{{ page.extra_evaluated.plotly | safe }}")
+    plot = chart(
+        "load_function",
+        x_title="Students",
+        y_title="Load hours",
+        include=lambda params, **_: bool(params.load_function.plot_minimum),
+    )
 
     class Meta:
+        assets = chart_js
+
         @staticmethod
-        def extra_evaluated__plotly(params, **_) -> str:
+        def endpoints__chart__func(params, **_) -> Dict[str, List]:
             """
-            Creates a graph of the student load function.
+            Serves the load hours across the plot range of the load function, for the chart.
 
             :param params: The page parameters, including the load function it's for.
-            :return: A div containing the rendered plot (or an empty string if no plot is needed).
+            :return: The series for the chart.
             """
-            load_function: LoadFunction = params.load_function
-            if not load_function.plot_minimum:
-                # Nothing to show!
-                return ""
-
-            student_range: List[float] = list(range(load_function.plot_minimum, load_function.plot_maximum + 1))
-            figure: Figure = Figure(
-                data=[
-                    Scatter(
-                        x=student_range,
-                        y=[load_function.evaluate(x) for x in student_range],
-                    ),
-                ],
-                layout=Layout(
-                    template="bootstrap_dark",
-                    xaxis=XAxis(title="Students"),
-                    yaxis=YAxis(title="Load hours"),
-                ),
-            )
-            return plot(figure, output_type="div")
+            return get_load_function_series(params.load_function)
 
 
 class LoadFunctionList(Page):
@@ -124,7 +112,7 @@ class LoadFunctionList(Page):
     info = InfoForm(
         instance=lambda **_: Info.objects.get(page="function"),
     )
-    list = Table(
+    list = CachedTable(
         h_tag=None,
         auto__model=LoadFunction,
         auto__exclude=["notes"],
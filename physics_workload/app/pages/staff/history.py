@@ -1,18 +1,28 @@
-from typing import Any, Dict, List
+from typing import Dict, List
 
-from django.template import Template
-from django.utils import timezone
-from iommi import Column, Header, Page, Table, html
-from plotly.graph_objs import Bar, Figure, Layout, Scatter
-from plotly.graph_objs.layout import XAxis, YAxis
-from plotly.offline import plot
+from django.http import Http404
+from iommi import Column, Header, Page, Table
 
+from app.assets import chart_js
+from app.charts import balance_chart, get_balance_series
 from app.forms.staff import StaffForm
-from app.models import Assignment, Staff
+from app.models import Assignment, Staff, YearSnapshot
 from app.pages.components.suffixes import SuffixHistory
 from app.style import get_balance_classes, get_balance_classes_form
 
 
+def get_staff_historic(staff: Staff, year_snapshot: YearSnapshot) -> Staff:
+    """
+    :param staff: The staff member.
+    :param year_snapshot: The year to get them as of.
+    :raises Http404: If they weren't here that year.
+    :return: The staff member as they were at the end of the year.
+    """
+    if staff_historic := year_snapshot.get_instance(Staff, staff.pk):
+        return staff_historic
+    raise Http404(f"{staff} has no history for {year_snapshot}.")
+
+
 class StaffHistoryDetail(Page):
     """
     View showing the detail of a staff member at a point in time.
@@ -20,19 +30,19 @@ class StaffHistoryDetail(Page):
 
     header = Header(
         lambda staff, **_: staff.get_instance_header(),
-        children__suffix=SuffixHistory(text=lambda staff_history, **_: f" / {staff_history.history_date.date()} "),
+        children__suffix=SuffixHistory(text=lambda year_snapshot, **_: f" / {year_snapshot} "),
     )
     form = StaffForm(
         h_tag=None,
         auto=dict(
-            instance=lambda staff, **_: staff,
+            instance=lambda staff, year_snapshot, **_: get_staff_historic(staff, year_snapshot),
             exclude=[
                 "user",
             ],
         ),
         fields=dict(
-            fte_fraction__include=lambda staff_history, **_: staff_history.fte_fraction,
-            hours_fixed__include=lambda staff_history, **_: staff_history.hours_fixed,
+            fte_fraction__include=lambda staff, year_snapshot, **_: get_staff_historic(staff, year_snapshot).fte_fraction,
+            hours_fixed__include=lambda staff, year_snapshot, **_: get_staff_historic(staff, year_snapshot).hours_fixed,
             notes__include=lambda request, **_: request.user.is_staff,
             load_target__group="row2",
             load_assigned__group="row2",
@@ -40,13 +50,16 @@ class StaffHistoryDetail(Page):
             load_balance_final=dict(
                 group="row3",
                 after="load_external",
-                non_editable_input__attrs__class=lambda staff_history, **_: get_balance_classes_form(staff_history.load_balance_final),
+                non_editable_input__attrs__class=lambda staff, year_snapshot, **_: get_balance_classes_form(
+                    get_staff_historic(staff, year_snapshot).load_balance_final
+                ),
             ),
             load_balance_historic=dict(
                 group="row3",
                 after="load_balance_final",
-                initial=lambda staff_history, **_: staff_history.load_balance_historic,
-                non_editable_input__attrs__class=lambda staff, **_: get_balance_classes_form(staff.load_balance_historic),
+                non_editable_input__attrs__class=lambda staff, year_snapshot, **_: get_balance_classes_form(
+                    get_staff_historic(staff, year_snapshot).load_balance_historic
+                ),
             ),
         ),
         editable=False,
@@ -66,7 +79,7 @@ class StaffHistoryDetail(Page):
             ),
             load_calc__after="task",
         ),
-        rows=lambda staff, staff_history, **_: Assignment.history.as_of(staff_history.history_date).filter(staff=staff),
+        rows=lambda staff, year_snapshot, **_: year_snapshot.get_assignments(staff_id=staff.pk),
     )
 
 
@@ -80,26 +93,21 @@ class StaffHistoryList(Page):
         children__suffix=SuffixHistory(),
     )
 
-    plot = html.div(
-        attrs__class={"mt-4": True}, children=dict(header=Header("Load Balance"), graph=Template("{{page.extra_evaluated.plot | safe }}"))
-    )
+    plot = balance_chart()
 
     list = Table(
         auto__model=Staff,
         h_tag=None,
         auto__include=["load_balance_final", "load_balance_historic"],
         columns=dict(
-            history_date=Column(
+            year=Column(
                 cell=dict(
-                    url=lambda params, row, **_: f"{row.history_id}/",
-                    value=lambda params, row, **_: row.history_date.date(),
+                    url=lambda row, **_: row.snapshot.get_absolute_url(),
+                    value=lambda row, **_: row.snapshot,
                 ),
             ),
-            history_id=Column(
-                render_column=False,
-            ),
             load_balance_final=dict(
-                after="history_date",
+                after="year",
                 group="Load Balance",
                 display_name="Final",
                 cell=dict(attrs__class=lambda row, **_: get_balance_classes(row.load_balance_final)),
@@ -113,51 +121,18 @@ class StaffHistoryList(Page):
                 ),
             ),
         ),
-        rows=lambda staff, **_: staff.history.all(),
+        rows=lambda staff, **_: YearSnapshot.get_history(Staff, staff.pk),
     )
 
     class Meta:
+        assets = chart_js
+
         @staticmethod
-        def extra_evaluated__plot(params: Dict[str, Any], staff: Staff, **_) -> str:
+        def endpoints__chart__func(staff: Staff, **_) -> Dict[str, List]:
             """
-            Creates a graph of the staff balance over time.
+            Serves the load balance of the staff member each year, for the chart.
 
-            :param params: The Iommi view params.
             :param staff: The Staff instance, provided via URL decoding.
-            :return: The HTML code of the graph.
+            :return: The series for the chart.
             """
-            dates: List[str] = [f"{str(timezone.now().year - 1)[-2:]}/{str(timezone.now().year)[-2:]}"]
-            balance_yearly: List[int] = [staff.get_load_balance()]
-            balance_cumulative: List[int] = [staff.get_load_balance() + staff.load_balance_historic]
-
-            for staff_historic in staff.history.all():
-                dates.append(f"{str(staff_historic.history_date.year - 1)[-2:]}/{str(staff_historic.history_date.year)[-2:]}")
-                balance_yearly.append(staff_historic.load_balance_final)
-                balance_cumulative.append(staff_historic.load_balance_final + staff_historic.load_balance_historic)
-
-            dates.reverse()
-            balance_yearly.reverse()
-            balance_cumulative.reverse()
-
-            figure: Figure = Figure(
-                data=[
-                    Bar(
-                        x=dates,
-                        y=balance_yearly,
-                        # width=3e9,  # ...in milliseconds?
-                        name="Yearly",
-                    ),
-                    Scatter(
-                        x=dates,
-                        y=balance_cumulative,
-                        name="Cumulative",
-                    ),
-                ],
-                layout=Layout(
-                    template="bootstrap_dark",
-                    xaxis=XAxis(title="Date", fixedrange=True),
-                    yaxis=YAxis(title="Load balance (hours)", fixedrange=True),
-                    margin=dict(l=0, r=0, b=0, t=0, pad=0),
-                ),
-            )
-            return plot(figure, output_type="div", config=dict(displayModeBar=False))
+            return get_balance_series(staff)
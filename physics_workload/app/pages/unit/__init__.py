@@ -26,7 +26,7 @@ class UnitDetail(Page):
         ),
         h_tag=Header,
         query__include=False,
-        rows=lambda unit, **_: Task.objects.filter(unit=unit).all(),
+        rows=lambda unit, **_: TaskTable.annotate_query_set(Task.objects.filter(unit=unit)),
     )
     form = UnitForm(
         title="Details",
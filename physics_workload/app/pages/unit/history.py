@@ -1,7 +1,7 @@
 from iommi import Column, Header, Page, Table
 
 from app.forms.unit import UnitForm
-from app.models import Assignment, Task, Unit
+from app.models import Unit, YearSnapshot
 from app.pages.components.suffixes import SuffixHistory
 from app.tables.task import TaskTable
 
@@ -13,7 +13,7 @@ class UnitHistoryDetail(Page):
 
     header = Header(
         lambda unit, **_: unit.get_instance_header(),
-        children__suffix=SuffixHistory(text=lambda staff_history, **_: f" / {staff_history.history_date.date()} "),
+        children__suffix=SuffixHistory(text=lambda year_snapshot, **_: f" / {year_snapshot} "),
     )
     tasks = TaskTable(
         h_tag=Header,
@@ -22,12 +22,12 @@ class UnitHistoryDetail(Page):
             assignment_set=Column(
                 cell=dict(
                     template="app/unit/assignment_set.html",
-                    value=lambda row, unit, unit_history, **_: Assignment.history.as_of(unit_history.history_date).filter(task=row).all(),
+                    value=lambda row, year_snapshot, **_: year_snapshot.get_assignments(task_id=row.pk),
                 )
             ),
         ),
         query__include=False,
-        rows=lambda unit, unit_history, **_: TaskTable.annotate_query_set(Task.history.as_of(unit_history.history_date).filter(unit=unit)),
+        rows=lambda unit, year_snapshot, **_: [task for task in year_snapshot.get_tasks().values() if task.unit_id == unit.pk],
     )
     form = UnitForm(
         title="Details",
@@ -61,15 +61,12 @@ class UnitHistoryList(Page):
         h_tag=None,
         auto__include=["students"],
         columns=dict(
-            history_date=Column(
+            year=Column(
                 cell=dict(
-                    url=lambda params, row, **_: f"{row.history_id}/",
-                    value=lambda params, row, **_: row.history_date.date(),
+                    url=lambda row, **_: row.snapshot.get_absolute_url(),
+                    value=lambda row, **_: row.snapshot,
                 ),
             ),
-            history_id=Column(
-                render_column=False,
-            ),
         ),
-        rows=lambda params, **_: params.unit.history.all(),
+        rows=lambda unit, **_: YearSnapshot.get_history(Unit, unit.pk),
     )
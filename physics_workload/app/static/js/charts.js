@@ -0,0 +1,38 @@
+// Draws the charts on a page from the series their page serves as JSON; see `app/charts.py`.
+const chartTraces = {
+    balance: (series) => [
+        {type: 'bar', x: series.dates, y: series.yearly, name: 'Yearly'},
+        {type: 'scatter', x: series.dates, y: series.cumulative, name: 'Cumulative'},
+    ],
+    load_function: (series) => [
+        {type: 'scatter', x: series.students, y: series.hours},
+    ],
+};
+
+function drawCharts() {
+    document.querySelectorAll('[data-chart]').forEach(function (element) {
+        fetch(element.dataset.chartUrl, {credentials: 'same-origin'})
+            .then(function (response) {
+                if (!response.ok) {
+                    throw new Error(`${response.status} ${response.statusText}`);
+                }
+                return response.json();
+            })
+            .then(function (series) {
+                Plotly.newPlot(
+                    element,
+                    chartTraces[element.dataset.chart](series),
+                    JSON.parse(element.dataset.chartLayout),
+                    Object.assign({responsive: true}, JSON.parse(element.dataset.chartConfig)),
+                );
+            })
+            .catch(function (error) {
+                console.error(`Couldn't draw chart from ${element.dataset.chartUrl}:`, error);
+                const message = document.createElement('p');
+                message.className = 'text-danger';
+                message.textContent = "The chart couldn't be loaded; try reloading the page.";
+                element.replaceChildren(message);
+            });
+    });
+}
+document.addEventListener('DOMContentLoaded', drawCharts);
@@ -2,9 +2,10 @@ from logging import Logger, getLogger
 
 from iommi import EditColumn, EditTable, Table
 
+from app.calculation import Subgraph, queue_recalculation
 from app.models import Assignment, Staff, Task
 from app.style import base_style, floating_fields_select2_inline_style
-from app.utility import update_all_loads
+from app.tables.paginator import KeysetPaginator
 
 logger: Logger = getLogger(__name__)
 
@@ -14,6 +15,7 @@ class AssignmentTable(Table):
 
     class Meta:
         auto__model = Assignment
+        parts__page__call_target = KeysetPaginator
         columns = dict(
             is_provisional__attrs__class={"text-right": False, "text-center": True},
             is_first_time__attrs__class={"text-right": False, "text-center": True},
@@ -56,7 +58,8 @@ class AssignmentStaffTable(Table):
                 ),
             ),
         )
-        rows = lambda staff, **_: Assignment.objects.filter(staff=staff)
+        rows = lambda staff, **_: Assignment.objects.filter(staff=staff).select_related("task")
+        parts__page__call_target = KeysetPaginator
         iommi_style = floating_fields_select2_inline_style
 
 
@@ -118,11 +121,13 @@ class AssignmentStaffEditTable(EditTable):
         @staticmethod
         def extra__post_save(staff: Staff, **_):
             """
-            :param staff:
+            Rows may have been deleted, so all of the staff member's assignments are recalculated.
+
+            :param staff: The staff member whose assignments were edited.
             :param _:
             :return:
             """
-            update_all_loads()
+            queue_recalculation(Subgraph(assignments=set(staff.assignment_set.values_list("pk", flat=True)), staff={staff.pk}, target=True))
 
 
 class AssignmentTaskTable(EditTable):
@@ -213,8 +218,10 @@ class AssignmentTaskEditTable(EditTable):
         @staticmethod
         def extra__post_save(task: Task, **_):
             """
-            :param task:
+            Rows may have been deleted or moved between staff, and it's not known who from, so all staff are checked.
+
+            :param task: The task whose assignments were edited.
             :param _:
             :return:
             """
-            update_all_loads()
+            queue_recalculation(Subgraph(tasks={task.pk}, staff_all=True, target=True))
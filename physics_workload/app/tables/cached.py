@@ -0,0 +1,44 @@
+from hashlib import md5
+from logging import Logger, getLogger
+
+from django.core.cache import cache
+from django.http import HttpRequest
+from django.utils.safestring import SafeString, mark_safe
+from iommi import Table
+
+from app.auth import get_role
+from app.models import get_data_version
+from app.tables.paginator import KeysetPaginator
+
+logger: Logger = getLogger(__name__)
+
+
+class CachedTable(Table):
+    """
+    Table that caches its rendered HTML until the data changes.
+    The HTML is cached for each URL (so each set of filters, sort and page of rows), page size, and user role, against the data version.
+    Repeat views skip fetching and rendering the rows. Any write to the data starts a new version.
+    Pages are fetched by seeking from the rows either side, rather than by counting rows; see `KeysetPaginator`.
+    """
+
+    class Meta:
+        parts__page__call_target = KeysetPaginator
+
+    def get_cache_key(self) -> str:
+        """
+        :return: The key the table's HTML is cached under.
+        """
+        request: HttpRequest = self.get_request()
+        page_size: str = str(self.paginator.page_size) if self.paginator else ""
+        parts: str = "|".join([get_data_version(), get_role(request.user), request.get_full_path(), self.iommi_path, page_size])
+        return f"table:{md5(parts.encode(), usedforsecurity=False).hexdigest()}"
+
+    def __html__(self, **kwargs) -> SafeString:
+        key: str = self.get_cache_key()
+        if (html := cache.get(key)) is not None:
+            return mark_safe(html)
+
+        html: SafeString = super().__html__(**kwargs)
+        cache.set(key, str(html))
+        logger.debug(f"Cached table {self.iommi_path} for {self.get_request().get_full_path()}.")
+        return html
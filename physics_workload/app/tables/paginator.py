@@ -0,0 +1,373 @@
+"""
+Keyset pagination for tables, so a page deep into a long table costs as much to fetch as the first.
+
+Rather than counting past the rows before it with `OFFSET`, each page is found from the sort keys of the row
+either side of it; 'the next 50 rows after this one', which the database answers from the index on the keys.
+The catch is that there are no page numbers, just first, previous, next and last.
+"""
+
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as Base64Error
+from functools import reduce
+from logging import Logger, getLogger
+from operator import or_
+from typing import Any, Dict, List, Tuple
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Model, OrderBy, Q, QuerySet, Subquery
+from django.http import HttpRequest
+from iommi._web_compat import render_template
+from iommi.attrs import evaluate_attrs
+from iommi.evaluate import evaluate_strict
+from iommi.table import Paginator, Table
+
+logger: Logger = getLogger(__name__)
+
+# The page sizes users can pick between.
+PAGE_SIZES: Tuple[int, ...] = (20, 50, 100, 200)
+
+# Where each user's choice of page size for each table is remembered.
+PAGE_SIZES_SESSION_KEY: str = "page_sizes"
+
+# A sort key; the path of the field or annotation sorted on, and whether it's sorted descending.
+SortKey = Tuple[str, bool]
+
+
+def get_page_sizes(request: HttpRequest) -> Dict[str, int]:
+    """
+    :param request: The request from the user.
+    :return: The page sizes the user has picked, for each table they've picked one for.
+    """
+    return request.session.get(PAGE_SIZES_SESSION_KEY, {}) if hasattr(request, "session") else {}
+
+
+def get_sort_keys(rows: QuerySet) -> List[SortKey] | None:
+    """
+    Gets the keys the rows are sorted on, ending with the primary key, so every row has a distinct set of keys.
+
+    Sorting on a relation sorts on the related model's own ordering, as Django does.
+
+    :param rows: The sorted rows.
+    :return: The sort keys, or None if the rows are sorted in a way that can't be seeked through, e.g. on an expression.
+    """
+    ordering: List[Any] = list(rows.query.order_by) or (list(rows.model._meta.ordering) if rows.query.default_ordering else [])
+
+    sort_keys: List[SortKey] = []
+    for key in ordering:
+        if not isinstance(key, str) or key == "?":
+            return None
+
+        if (expanded := expand_sort_key(rows, key.lstrip("-"), key.startswith("-"))) is None:
+            return None
+
+        sort_keys += expanded
+
+    # Anything after the primary key can't change the order, as no two rows share it.
+    paths: List[str] = [path for path, _ in sort_keys]
+    if "pk" in paths:
+        return sort_keys[: paths.index("pk") + 1]
+
+    return sort_keys + [("pk", False)]
+
+
+def expand_sort_key(rows: QuerySet, path: str, descending: bool) -> List[SortKey] | None:
+    """
+    :param rows: The sorted rows.
+    :param path: The path of the field sorted on, from the model of the rows.
+    :param descending: Whether the field is sorted descending.
+    :return: The sort keys for the field, or None if it can't be seeked through.
+    """
+    if path == "pk" or path in rows.query.annotations:
+        return [(path, descending)]
+
+    model: type[Model] = rows.model
+    parts: List[str] = path.split("__")
+    for index, part in enumerate(parts):
+        try:
+            field = model._meta.get_field(part)
+        except FieldDoesNotExist:
+            return None
+
+        if not field.is_relation:
+            return [(path, descending)] if index == len(parts) - 1 else None
+
+        elif not field.concrete or field.many_to_many or field.one_to_many:
+            # Sorting on a reverse relation duplicates the rows, so they can't be seeked through.
+            return None
+
+        elif index < len(parts) - 1:
+            model = field.related_model
+
+        elif ordering := field.related_model._meta.ordering:
+            expanded: List[SortKey] = []
+            for related_key in ordering:
+                if not isinstance(related_key, str):
+                    return None
+                elif (related := expand_sort_key(rows, f"{path}__{related_key.lstrip('-')}", descending != related_key.startswith("-"))) is None:
+                    return None
+                expanded += related
+            return expanded
+
+        else:
+            return [("__".join(parts[:-1] + [field.attname]), descending)]
+
+    return None
+
+
+def get_sort_values(row: Model, sort_keys: List[SortKey]) -> List[Any]:
+    """
+    :param row: The row.
+    :param sort_keys: The keys the rows are sorted on.
+    :return: The value of each of the row's sort keys.
+    """
+    values: List[Any] = []
+    for path, _ in sort_keys:
+        value: Any = row
+        for part in path.split("__"):
+            if value is None:
+                break
+            value = getattr(value, part)
+        values.append(value)
+
+    return values
+
+
+def order_by_sort_keys(rows: QuerySet, sort_keys: List[SortKey]) -> QuerySet:
+    """
+    Sorts the rows, with empty values first; i.e. treating them as smaller than everything, on every database.
+
+    :param rows: The rows to sort.
+    :param sort_keys: The keys to sort on.
+    :return: The sorted rows.
+    """
+    orderings: List[OrderBy] = [F(path).desc(nulls_last=True) if descending else F(path).asc(nulls_first=True) for path, descending in sort_keys]
+    return rows.order_by(*orderings)
+
+
+def seek(sort_keys: List[SortKey], values: List[Any]) -> Q | None:
+    """
+    Gets the condition for the rows that come after a row, in the order of the sort keys.
+
+    Written out as 'after on the first key, or the same on the first key and after on the second...',
+    treating empty values as smaller than everything to match `order_by_sort_keys`.
+
+    :param sort_keys: The keys the rows are sorted on.
+    :param values: The value of each of the row's sort keys.
+    :return: The condition, or None if no row can come after it.
+    """
+    conditions: List[Q] = []
+    same: Q = Q()
+    for (path, descending), value in zip(sort_keys, values):
+        if not descending:
+            after: Q | None = Q(**{f"{path}__isnull": False}) if value is None else Q(**{f"{path}__gt": value})
+        else:
+            after: Q | None = None if value is None else Q(**{f"{path}__lt": value}) | Q(**{f"{path}__isnull": True})
+
+        if after is not None:
+            conditions.append(same & after)
+        same &= Q(**{f"{path}__isnull": True}) if value is None else Q(**{path: value})
+
+    return reduce(or_, conditions) if conditions else None
+
+
+def reverse_sort_keys(sort_keys: List[SortKey]) -> List[SortKey]:
+    """
+    :param sort_keys: The keys the rows are sorted on.
+    :return: The keys sorting the rows in the opposite order.
+    """
+    return [(path, not descending) for path, descending in sort_keys]
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """
+    :param values: The value of each of a row's sort keys.
+    :return: The values, encoded for a URL.
+    """
+    return urlsafe_b64encode(json.dumps(values, cls=DjangoJSONEncoder).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_keys: List[SortKey]) -> List[Any] | None:
+    """
+    :param cursor: The values of each of a row's sort keys, encoded for a URL.
+    :param sort_keys: The keys the rows are sorted on.
+    :return: The values, or None if they aren't valid for the keys, e.g. if the sort has changed since.
+    """
+    try:
+        values: Any = json.loads(urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (Base64Error, ValueError):
+        return None
+
+    return values if isinstance(values, list) and len(values) == len(sort_keys) else None
+
+
+class KeysetPaginator(Paginator):
+    """
+    Paginator that seeks to each page from the row either side of it, rather than counting past the rows before it.
+
+    The page parameter is `after.<cursor>` or `before.<cursor>`, where the cursor holds the sort keys of the row,
+    or `last` for the last page. The rows are only fetched when the table's rendered, so a cached table doesn't fetch them.
+    Each user's choice of page size is remembered for each table.
+
+    Tables of rows that aren't a queryset, or that are sorted on something that can't be seeked through,
+    fall back to numbered pages.
+    """
+
+    class Meta:
+        template = "app/paginator.html"
+        attrs__class = {"d-flex": True, "justify-content-between": True}
+
+    def on_refine_done(self):
+        self.sort_keys: List[SortKey] | None = None
+        self.all_rows: QuerySet | None = None
+        self.direction: str | None = None
+        super().on_refine_done()
+
+    def get_page_size(self, request: HttpRequest, table: Table) -> int | None:
+        """
+        Gets the page size the user's picked for the table, remembering it if they've just picked it.
+
+        It's remembered for the kind of table, so it's the same for the same table on any page.
+
+        :param request: The request for the page.
+        :param table: The table.
+        :return: The page size, or the table's own if the user hasn't picked one.
+        """
+        page_sizes: Dict[str, int] = get_page_sizes(request)
+        key: str = f"{type(table).__name__}:{self.iommi_path}"
+
+        page_size: str = request.GET.get(f"{self.iommi_path}_size", "")
+        if page_size.isdigit() and int(page_size) in PAGE_SIZES:
+            if page_sizes.get(key) != int(page_size) and hasattr(request, "session"):
+                request.session[PAGE_SIZES_SESSION_KEY] = {**page_sizes, key: int(page_size)}
+            return int(page_size)
+
+        return page_sizes.get(key, table.page_size)
+
+    def on_bind(self) -> None:
+        request: HttpRequest | None = self.get_request()
+        table: Table = self.iommi_evaluate_parameters()["table"]
+        rows: Any = table.sorted_and_filtered_rows
+
+        page_size: int | None = self.get_page_size(request, table) if request else table.page_size
+        if not isinstance(rows, QuerySet) or page_size is None or (sort_keys := get_sort_keys(rows)) is None:
+            return super().on_bind()
+
+        self.page_size = page_size
+        self.sort_keys = sort_keys
+        self.all_rows = order_by_sort_keys(rows, sort_keys)
+
+        evaluate_parameters: Dict[str, Any] = {**self.iommi_evaluate_parameters(), "page_size": self.page_size, "rows": rows}
+        self.attrs = evaluate_attrs(self, **evaluate_parameters)
+        for part in (self.container, self.active_item, self.item, self.link, self.active_link):
+            part.attrs = evaluate_attrs(part, **evaluate_parameters)
+            part.tag = evaluate_strict(part.tag, **evaluate_parameters)
+
+        # Pages only ever run forwards from a row, backwards from a row, or backwards from the end.
+        page: str = request.GET.get(self.iommi_path, "") if request else ""
+        direction, _, cursor = page.partition(".")
+        values: List[Any] | None = decode_cursor(cursor, sort_keys) if direction in ("after", "before") else None
+
+        if direction in ("after", "before") and values is not None:
+            self.direction = direction
+            keys: List[SortKey] = sort_keys if direction == "after" else reverse_sort_keys(sort_keys)
+            if (condition := seek(keys, values)) is not None:
+                rows = rows.filter(condition)
+            else:
+                rows = rows.none()
+
+        elif direction == "last":
+            self.direction = direction
+
+        if self.direction in ("before", "last"):
+            # Take the page from the end, but still show it in order; the subquery keeps the rows unfetched.
+            backwards: QuerySet = order_by_sort_keys(rows, reverse_sort_keys(sort_keys))
+            self.rows = self.all_rows.filter(pk__in=Subquery(backwards.values("pk")[: self.page_size]))
+        else:
+            self.rows = order_by_sort_keys(rows, sort_keys)[: self.page_size]
+
+        self.page = 1
+        self.number_of_pages = None
+        self.context = self.iommi_evaluate_parameters().copy()
+
+    @property
+    def count(self) -> int | None:
+        """
+        The number of rows. Counting every row is what seeking avoids, so it's just the number on the page.
+
+        The table only checks the count to see if there are any rows to show, in `iommi/table/table_tag.html`
+        (`{% elif not table.paginator.count and table.empty_message != None %}`), before rendering them.
+        So it's worked out when it's first asked for, by fetching the page's rows, which the table then renders;
+        a cached table never asks, so never fetches them.
+
+        :return: The number of rows on the page, or as counted by `Paginator` for numbered pages.
+        """
+        if self.sort_keys is None:
+            return self._count
+
+        return len(self.rows)
+
+    @count.setter
+    def count(self, count: Any):
+        """
+        :param count: The number of rows, or how to count them, as set up and then worked out by `Paginator` for numbered pages.
+        """
+        self._count = count
+
+    def has_rows_after(self, row: Model, sort_keys: List[SortKey]) -> bool:
+        """
+        :param row: The row.
+        :param sort_keys: The keys the rows are sorted on.
+        :return: Whether there are any rows after the row, in the order of the keys.
+        """
+        condition: Q | None = seek(sort_keys, get_sort_values(row, sort_keys))
+        return condition is not None and self.all_rows.filter(condition).exists()
+
+    def get_url(self, page: str | None = None, page_size: int | None = None) -> str:
+        """
+        :param page: The page to link to, or None for the first.
+        :param page_size: The page size to link to, or None for the current one.
+        :return: The link to the page, keeping the rest of the parameters (e.g. the sort and filters) as they are.
+        """
+        params = self.get_request().GET.copy()
+        params.pop(self.iommi_path, None)
+        if page is not None:
+            params[self.iommi_path] = page
+        if page_size is not None:
+            params[f"{self.iommi_path}_size"] = page_size
+
+        return f"?{params.urlencode()}"
+
+    def is_paginated(self) -> bool:
+        if self.sort_keys is None:
+            return super().is_paginated()
+
+        return self.direction is not None or len(self.rows) == self.page_size
+
+    def __html__(self):
+        if self.sort_keys is None:
+            return super().__html__()
+
+        # The table's already fetched the rows to render them, so this doesn't fetch them again.
+        rows: List[Model] = list(self.rows)
+        has_previous: bool = self.direction == "after" or (
+            self.direction in ("before", "last") and len(rows) == self.page_size and self.has_rows_after(rows[0], reverse_sort_keys(self.sort_keys))
+        )
+        has_next: bool = self.direction == "before" or (
+            self.direction in (None, "after") and len(rows) == self.page_size and self.has_rows_after(rows[-1], self.sort_keys)
+        )
+        # Still offer the page sizes if the rows fit on one page, as it could be because the user picked a big one.
+        if not (has_previous or has_next or len(rows) > PAGE_SIZES[0] or self.show_always):
+            return ""
+
+        self.context.update(
+            dict(
+                first_url=self.get_url() if has_previous else None,
+                previous_url=self.get_url(f"before.{encode_cursor(get_sort_values(rows[0], self.sort_keys))}") if has_previous and rows else None,
+                next_url=self.get_url(f"after.{encode_cursor(get_sort_values(rows[-1], self.sort_keys))}") if has_next and rows else None,
+                last_url=self.get_url("last") if has_next else None,
+                page_sizes=[(page_size, self.get_url(page_size=page_size), page_size == self.page_size) for page_size in PAGE_SIZES],
+            )
+        )
+        return render_template(request=self.get_request(), template=self.template, context=self.context)
@@ -1,16 +1,17 @@
 from logging import Logger, getLogger
 
-from django.db.models import F, Q, QuerySet
-from iommi import Action, Column, Field, Table
+from django.db.models import F, Prefetch, Q, QuerySet
+from iommi import Action, Column, Field
 
 from app.auth import has_staff_access
 from app.models import AcademicGroup, Assignment, Staff
 from app.style import floating_fields_style, get_balance_classes
+from app.tables.cached import CachedTable
 
 logger: Logger = getLogger(__name__)
 
 
-class StaffTable(Table):
+class StaffTable(CachedTable):
     """
     Table displaying details of staff.
 
@@ -56,7 +57,7 @@ class StaffTable(Table):
             ),
             assignment_set=dict(
                 include=lambda user, **_: user.is_staff,
-                cell__value=lambda row, **_: Assignment.objects.filter(staff=row),
+                cell__value=lambda row, **_: row.assignment_set.all(),
                 cell__template="app/staff/assignment_set.html",
             ),
             load_balance_historic=dict(
@@ -125,8 +126,13 @@ class StaffTable(Table):
     @staticmethod
     def annotate_rows(rows: QuerySet) -> QuerySet:
         """
-        Adds the load balance to the table rows, derived from the load columns.
+        Adds the load balance to the table rows, derived from the load columns,
+        and fetches their groups and assignments (with the names of their tasks) up front, rather than a row at a time.
         :param rows: The query to annotate.
         :return: The annotated query, with a 'load_balance' column.
         """
-        return rows.annotate(load_balance=F("load_assigned") - F("load_target"))
+        return (
+            rows.annotate(load_balance=F("load_assigned") - F("load_target"))
+            .select_related("academic_group")
+            .prefetch_related(Prefetch("assignment_set", queryset=Assignment.objects.select_related("task__unit", "task__academic_group")))
+        )
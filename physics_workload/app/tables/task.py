@@ -1,11 +1,12 @@
-from django.db.models import Case, Count, F, Q, QuerySet, When
-from iommi import Column, Field, Table
+from django.db.models import Case, Count, F, Prefetch, Q, QuerySet, When
+from iommi import Column, Field
 
 from app.models import AcademicGroup, Assignment, Task, Unit
 from app.style import floating_fields_style
+from app.tables.cached import CachedTable
 
 
-class TaskTable(Table):
+class TaskTable(CachedTable):
     class Meta:
         auto = dict(
             model=Task,
@@ -53,12 +54,12 @@ class TaskTable(Table):
             group="Load",
             display_name="First time",
             after="load_calc",
-            cell__value=lambda row, **_: row.load_calc_first if row.load_calc_first != row.load_calc else None,
+            attr="load_calc_first_only",
         )
         columns__assignment_set = dict(
             cell=dict(
                 template="app/task/assignment_set.html",
-                value=lambda row, **_: Assignment.objects.filter(task=row).all(),
+                value=lambda row, **_: row.assignment_set.all(),
             ),
             display_name="Assignment(s)",
             after="load_calc_first",
@@ -99,14 +100,36 @@ class TaskTable(Table):
         else:
             return None
 
+    @staticmethod
+    def prefetch_assignments(query_set: QuerySet[Task]) -> QuerySet[Task]:
+        """
+        Fetches the assignments (with their staff) of the tasks up front, rather than a task at a time.
+
+        The queryset has to be given explicitly, as the default one for a `HistoricForeignKey` only matches the first task.
+        :param query_set: QuerySet to add the assignments to.
+        :return: QuerySet with the assignments fetched alongside.
+        """
+        return query_set.prefetch_related(Prefetch("assignment_set", queryset=Assignment.objects.select_related("staff")))
+
+    @staticmethod
+    def prefetch_query_set(query_set: QuerySet[Task]) -> QuerySet[Task]:
+        """
+        Fetches the owners and assignments of the tasks up front, rather than a row at a time.
+        :param query_set: QuerySet to add the related rows to.
+        :return: QuerySet with the related rows fetched alongside.
+        """
+        return TaskTable.prefetch_assignments(query_set.select_related("unit", "academic_group"))
+
     @staticmethod
     def annotate_query_set(query_set: QuerySet[Task]) -> QuerySet[Task]:
         """
         Annotates the passed QuerySet with any additional data needed for columns,
         convenience method to keep consistent between uses.
         :param query_set: QuerySet to annotate.
-        :return: Annotated QuerySet, with the number of assignments yet needed added as `assignment_open`
+        :return: Annotated QuerySet, with the number of assignments yet needed added as `assignment_required`,
+            the name of the owner as `owner`, and the first-time load as `load_calc_first_only` if it differs from the normal load.
         """
+        query_set = TaskTable.prefetch_query_set(query_set)
         return query_set.annotate(
             assignment_required=Case(
                 When(is_required=True, then=1),
@@ -125,4 +148,8 @@ class TaskTable(Table):
                 ),
                 default=None,
             ),
-        ).order_by("owner")
+            load_calc_first_only=Case(
+                When(load_calc_first=F("load_calc"), then=None),
+                default=F("load_calc_first"),
+            ),
+        ).order_by("owner", *Task._meta.ordering)
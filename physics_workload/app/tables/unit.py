@@ -1,11 +1,13 @@
-from django.db.models import Count, Q, QuerySet
-from iommi import Action, Column, Field, Table
+from django.db.models import Count, Prefetch, Q, QuerySet
+from iommi import Action, Column, Field
 
 from app.models import Task, Unit
 from app.style import floating_fields_style
+from app.tables.cached import CachedTable
+from app.tables.task import TaskTable
 
 
-class UnitTable(Table):
+class UnitTable(CachedTable):
     class Meta:
         auto = dict(model=Unit, include=["code", "name", "task_set", "students"])
         columns = dict(
@@ -31,7 +33,7 @@ class UnitTable(Table):
                 display_name="Tasks",
                 cell=dict(
                     template="app/unit/task_set.html",
-                    value=lambda request, row, **_: Task.objects.filter(unit=row) if row.has_access(request.user) else None,
+                    value=lambda request, row, **_: row.task_set.all() if row.has_access(request.user) else None,
                 ),
                 after="students",
                 sort_key="assignment_required",
@@ -74,7 +76,13 @@ class UnitTable(Table):
 
     @staticmethod
     def annotate_query_set(query_set: QuerySet[Unit]) -> QuerySet[Unit]:
+        """
+        Annotates the units with the state of their assignments, and fetches their tasks and assignments up front,
+        rather than a row at a time.
+        :param query_set: QuerySet to annotate.
+        :return: Annotated QuerySet.
+        """
         return query_set.annotate(
             assignment_required=Count("task_set__is_required", filter=Q(task_set__is_required=True)) - Count("task_set__assignment_set"),
             assignment_provisional=Count("task_set__assignment_set__is_provisional"),
-        )
+        ).prefetch_related(Prefetch("task_set", queryset=TaskTable.prefetch_assignments(Task.objects.all())))
@@ -3,6 +3,7 @@ from iommi.experimental.main_menu import MainMenu
 
 from app.pages.basic import AboutPage, PrivacyPage
 from app.urls.academic_group import academic_group_submenu
+from app.urls.diagnostics import diagnostics_submenu
 from app.urls.info import info_submenu
 from app.urls.load_function import load_function_submenu
 from app.urls.staff import staff_submenu
@@ -20,6 +21,7 @@ main_menu = MainMenu(
         function=load_function_submenu,
         load=standard_load_submenu,
         info=info_submenu,
+        diagnostics=diagnostics_submenu,
     ),
 )
 
@@ -0,0 +1,14 @@
+"""
+Handles the URLs for the diagnostics page.
+"""
+
+from iommi.experimental.main_menu import M
+
+from app.pages.diagnostics import DiagnosticsPage
+
+# Included in the main menu
+diagnostics_submenu: M = M(
+    icon="gauge",
+    include=lambda request, **_: request.user.is_staff,
+    view=DiagnosticsPage,
+)
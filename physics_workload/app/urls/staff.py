@@ -5,6 +5,7 @@ from iommi.path import register_path_decoding
 
 from app.auth import has_access_decoder
 from app.models.staff import Staff
+from app.models.year_snapshot import YearSnapshot
 from app.pages.staff import StaffCreate, StaffDelete, StaffDetail, StaffEdit, StaffList
 from app.pages.staff.history import StaffHistoryDetail, StaffHistoryList
 
@@ -14,7 +15,7 @@ register_path_decoding(
     staff=has_access_decoder(Staff, "You may only view your own Staff details."),
 )
 register_path_decoding(
-    staff_history=lambda string, **_: Staff.history.get(history_id=int(string)),
+    year_snapshot=YearSnapshot,
 )
 
 staff_submenu: M = M(
@@ -50,9 +51,9 @@ staff_submenu: M = M(
                     view=StaffHistoryList,
                     items=dict(
                         detail=M(
-                            display_name=lambda staff_history, **_: staff_history.history_date.date(),
-                            params={"staff_history"},
-                            path="<staff_history>/",
+                            display_name=lambda year_snapshot, **_: f"{year_snapshot}",
+                            params={"year_snapshot"},
+                            path="<year_snapshot>/",
                             view=StaffHistoryDetail,
                         )
                     ),
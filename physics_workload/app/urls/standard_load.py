@@ -5,6 +5,7 @@ Handles the URLs for the Standard Load
 from iommi.experimental.main_menu import M
 from iommi.path import register_path_decoding
 
+from app.calculation.context import CalculationContext
 from app.models.standard_load import StandardLoad
 from app.pages.standard_load import StandardLoadDetail, StandardLoadEdit, StandardLoadList, StandardLoadNewYear
 
@@ -28,13 +29,17 @@ standard_load_submenu: M = M(
             items=dict(
                 edit=M(
                     icon="pencil",
-                    include=lambda request, standard_load, **_: request.user.is_staff and (StandardLoad.objects.latest() == standard_load),
+                    include=lambda request, standard_load, **_: (
+                        request.user.is_staff and (CalculationContext.for_request(request).standard_load == standard_load)
+                    ),
                     view=StandardLoadEdit,
                 ),
                 create=M(
                     display_name="New Year",
                     icon="plus",
-                    include=lambda request, standard_load, **_: request.user.is_staff and (StandardLoad.objects.latest() == standard_load),
+                    include=lambda request, standard_load, **_: (
+                        request.user.is_staff and (CalculationContext.for_request(request).standard_load == standard_load)
+                    ),
                     view=StandardLoadNewYear,
                 ),
             ),
@@ -5,6 +5,7 @@ from iommi.path import register_path_decoding
 from app.auth import has_access_decoder
 from app.models.task import Task
 from app.models.unit import Unit
+from app.models.year_snapshot import YearSnapshot
 from app.pages.task import TaskDelete, TaskDetail, TaskEdit
 from app.pages.unit import UnitCreate, UnitDelete, UnitDetail, UnitEdit, UnitList
 from app.pages.unit.history import UnitHistoryDetail, UnitHistoryList
@@ -15,7 +16,7 @@ register_path_decoding(
     unit=has_access_decoder(Unit, "You must be assigned to a Unit to view it"),
 )
 register_path_decoding(
-    unit_history=lambda string, **_: Unit.history.get(history_id=int(string)),
+    year_snapshot=YearSnapshot,
 )
 
 # Added to the main menu
@@ -52,9 +53,9 @@ unit_submenu: M = M(
                     view=UnitHistoryList,
                     items=dict(
                         detail=M(
-                            display_name=lambda unit_history, **_: unit_history.history_date.date(),
-                            params={"unit_history"},
-                            path="<unit_history>/",
+                            display_name=lambda year_snapshot, **_: f"{year_snapshot}",
+                            params={"year_snapshot"},
+                            path="<year_snapshot>/",
                             view=UnitHistoryDetail,
                         )
                     ),
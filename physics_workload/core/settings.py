@@ -74,6 +74,7 @@ MIDDLEWARE: List[str] = [
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
+    "app.middlewares.ConditionalPageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "iommi.sql_trace.Middleware",
     "iommi.profiling.Middleware",
@@ -96,6 +97,7 @@ TEMPLATES: List[Dict[str, Any]] = [
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
+                "app.context_processors.recalculation_status",
             ],
         },
     },
@@ -106,10 +108,76 @@ WSGI_APPLICATION: str = "core.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/3.0/ref/settings/#databases
 
-DATABASES: Dict[str, Dict] = {
+# The database is SQLite by default, or PostgreSQL if `DATABASE_ENGINE` is `postgresql`, which can take concurrent writers.
+DATABASE_ENGINE: str = config("DATABASE_ENGINE", default="sqlite")
+
+# SQLite is tuned so the site can be read while it's being written to, e.g. while loads are recalculated:
+# - The write-ahead log lets readers carry on from the last commit while a write is in progress,
+#   and with it, syncing to disk only at checkpoints is still safe against corruption.
+# - Transactions take the write lock as they start, so two writers queue for the busy timeout
+#   rather than one failing with "database is locked" when it tries to upgrade from reading.
+# - Memory-mapping and a bigger page cache (in KiB, as it's negative) cut the reads from disk.
+SQLITE_JOURNAL_MODE: str = config("SQLITE_JOURNAL_MODE", default="WAL")
+SQLITE_SYNCHRONOUS: str = config("SQLITE_SYNCHRONOUS", default="NORMAL")
+SQLITE_TIMEOUT: float = config("SQLITE_TIMEOUT", default=20, cast=float)
+SQLITE_MMAP_SIZE: int = config("SQLITE_MMAP_SIZE", default=256 * 1024 * 1024, cast=int)
+SQLITE_CACHE_SIZE: int = config("SQLITE_CACHE_SIZE", default=-64 * 1024, cast=int)
+SQLITE_TRANSACTION_MODE: str = config("SQLITE_TRANSACTION_MODE", default="IMMEDIATE")
+
+DATABASE_SQLITE: Dict[str, Any] = {
+    "ENGINE": "django.db.backends.sqlite3",
+    "NAME": DATA_DIR / "data" / "db.sqlite3",
+    "OPTIONS": {
+        "init_command": (
+            f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE};"
+            f"PRAGMA synchronous={SQLITE_SYNCHRONOUS};"
+            f"PRAGMA mmap_size={SQLITE_MMAP_SIZE};"
+            f"PRAGMA cache_size={SQLITE_CACHE_SIZE};"
+        ),
+        "timeout": SQLITE_TIMEOUT,
+        "transaction_mode": SQLITE_TRANSACTION_MODE,
+    },
+}
+
+# PostgreSQL connections are kept open between requests for `POSTGRES_CONN_MAX_AGE` seconds, checked before they're reused.
+# Alternatively, if `POSTGRES_POOL` is set, each process keeps a pool of connections instead.
+POSTGRES_CONN_MAX_AGE: int = config("POSTGRES_CONN_MAX_AGE", default=600, cast=int)
+POSTGRES_POOL: bool = config("POSTGRES_POOL", default=False, cast=bool)
+
+DATABASE_POSTGRESQL: Dict[str, Any] = {
+    "ENGINE": "django.db.backends.postgresql",
+    "NAME": config("POSTGRES_DB", default="physics_workload"),
+    "USER": config("POSTGRES_USER", default="physics_workload"),
+    "PASSWORD": config("POSTGRES_PASSWORD", default=""),
+    "HOST": config("POSTGRES_HOST", default="localhost"),
+    "PORT": config("POSTGRES_PORT", default=5432, cast=int),
+    "CONN_MAX_AGE": 0 if POSTGRES_POOL else POSTGRES_CONN_MAX_AGE,
+    "CONN_HEALTH_CHECKS": True,
+    "OPTIONS": {
+        "pool": POSTGRES_POOL,
+    },
+}
+
+if DATABASE_ENGINE == "postgresql":
+    # The SQLite database is kept alongside, to copy the data across from; see `make postgresql`.
+    DATABASES: Dict[str, Dict] = {"default": DATABASE_POSTGRESQL, "sqlite": DATABASE_SQLITE}
+elif DATABASE_ENGINE == "sqlite":
+    DATABASES: Dict[str, Dict] = {"default": DATABASE_SQLITE}
+else:
+    raise ValueError(f"DATABASE_ENGINE must be 'sqlite' or 'postgresql', not '{DATABASE_ENGINE}'.")
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Kept on disk next to the database, so it's shared by every process, including management commands.
+# Rendered tables are cached against the version of the data, so are never stale; old entries are just culled.
+CACHES: Dict[str, Dict] = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": DATA_DIR / "data" / "db.sqlite3",
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": DATA_DIR / "data" / "cache",
+        "TIMEOUT": 60 * 60 * 24,
+        "OPTIONS": {
+            "MAX_ENTRIES": 2000,
+        },
     }
 }
 
@@ -185,6 +253,22 @@ STATIC_URL: str = "/static/"
 
 # Extra places for collectstatic to find static files.
 STATICFILES_DIRS: Tuple[Path] = (BASE_DIR / "app" / "static",)
+STATICFILES_FINDERS: List[str] = [
+    "django.contrib.staticfiles.finders.FileSystemFinder",
+    "django.contrib.staticfiles.finders.AppDirectoriesFinder",
+    "app.finders.PlotlyFinder",
+]
+
+# Collected files are compressed ahead of time, so the server can send the compressed copies as they are.
+# They aren't renamed with their hashes, as that needs `collectstatic` run before the site can be viewed at all.
+STORAGES: Dict[str, Dict[str, str]] = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "whitenoise.storage.CompressedStaticFilesStorage",
+    },
+}
 
 ################################################################################
 # DJANGO CORE - DATABASE
@@ -339,3 +423,13 @@ ICON_HISTORY: str = "clock-rotate-left"
 ICON_EDIT: str = "pencil"
 ICON_DELETE: str = "trash"
 ICON_CREATE: str = "plus"
+
+# Edits queue a recalculation of the loads for a background worker, rather than waiting for it.
+# The worker waits `RECALCULATION_DELAY` seconds after an edit, so a burst of edits is recalculated together,
+# and polls every `RECALCULATION_POLL_INTERVAL` seconds for recalculations queued by other processes.
+RECALCULATION_IN_BACKGROUND: bool = config("RECALCULATION_IN_BACKGROUND", default=True, cast=bool)
+RECALCULATION_DELAY: float = 0.25
+RECALCULATION_POLL_INTERVAL: float = 1.0
+
+# The number of recent recalculation profiles kept in the cache for the diagnostics page.
+RECALCULATION_PROFILE_HISTORY: int = 100
@@ -1,4 +1,5 @@
 uv run manage.py collectstatic --noinput
 uv run manage.py makemigrations
 uv run manage.py migrate --noinput
+uv run manage.py take_year_snapshots
 uv run uwsgi --ini uwsgi.ini
@@ -0,0 +1,10 @@
+"""
+Benchmarks for the load pipeline, run against a seeded synthetic department.
+
+Run from the `physics_workload` directory, e.g.:
+
+    python -m tests.benchmarks --size medium --output benchmark.json
+
+The department is built in a throwaway test database, so the real one is never touched.
+Results are written as JSON, so runs can be compared between commits.
+"""
@@ -0,0 +1,106 @@
+"""
+Builds a synthetic department in a test database, benchmarks the load pipeline against it, and writes out the results.
+"""
+
+import os
+import sys
+from argparse import ArgumentParser, Namespace
+from dataclasses import asdict, replace
+from datetime import datetime, timezone
+from json import dump
+from pathlib import Path
+from platform import python_version
+from shutil import rmtree
+from subprocess import CalledProcessError, check_output
+from tempfile import mkdtemp
+from typing import Any, Dict, List
+
+# The project root, so the apps can be imported.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+
+import django  # noqa: E402
+
+
+def get_commit() -> str | None:
+    """
+    :return: The commit being benchmarked, if this is a git checkout.
+    """
+    try:
+        return check_output(["git", "rev-parse", "HEAD"], cwd=Path(__file__).parent, text=True).strip()
+    except (CalledProcessError, OSError):
+        return None
+
+
+def main():
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--size", default="small", help="The preset size of department: tiny, small, medium or large.")
+    parser.add_argument("--staff", type=int, help="Overrides the number of staff.")
+    parser.add_argument("--units", type=int, help="Overrides the number of units.")
+    parser.add_argument("--tasks", type=int, help="Overrides the number of tasks not tied to a unit.")
+    parser.add_argument("--assignments-per-task", type=int, help="Overrides the maximum number of staff assigned to each task.")
+    parser.add_argument("--load-functions", type=int, help="Overrides the number of extra load functions.")
+    parser.add_argument("--full-time-tasks", type=int, help="Overrides the number of full-time tasks.")
+    parser.add_argument("--history-years", type=int, help="Overrides the number of past years of history.")
+    parser.add_argument("--seed", type=int, default=1, help="The seed for the synthetic department.")
+    parser.add_argument("--repeat", type=int, default=3, help="The number of times to run each benchmark.")
+    parser.add_argument("--output", type=Path, help="The file to write the results to, as JSON.")
+    arguments: Namespace = parser.parse_args()
+
+    django.setup()
+    from django.conf import settings
+    from django.db import connection
+    from django.test.utils import override_settings, setup_test_environment
+    from tests.benchmarks.department import SIZES, DepartmentSize, build_department
+    from tests.benchmarks.scenarios import Measurement, run_benchmarks
+
+    from app.models import AcademicGroup, Assignment, LoadFunction, Staff, Task, Unit
+
+    size: DepartmentSize = SIZES[arguments.size]
+    overrides: Dict[str, int] = {name: getattr(arguments, name) for name in asdict(size) if getattr(arguments, name) is not None}
+    size = replace(size, **overrides)
+
+    # The history is only turned on for the rollover, as it is when the site is running.
+    settings.SIMPLE_HISTORY_ENABLED = False
+    setup_test_environment()
+    # SQLite test databases are normally in memory, but the site's is a file, which other connections can read while it's written.
+    directory: Path | None = None
+    if connection.vendor == "sqlite":
+        directory = Path(mkdtemp())
+        connection.settings_dict["TEST"]["NAME"] = str(directory / "benchmark.sqlite3")
+    database: str = connection.creation.create_test_db(verbosity=0)
+    # The cache is kept in memory, so the site's own cache isn't read or written.
+    caches: Dict[str, Any] = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "benchmarks"}}
+    try:
+        with override_settings(CACHES=caches):
+            build_department(size, arguments.seed)
+            counts: Dict[str, int] = {model.__name__: model.objects.count() for model in (Staff, Unit, Task, Assignment, LoadFunction, AcademicGroup)}
+            print(f"Built a department of {', '.join(f'{count} {name}' for name, count in counts.items())}.")
+
+            measurements: List[Measurement] = run_benchmarks(arguments.repeat, arguments.seed)
+    finally:
+        connection.creation.destroy_test_db(database, verbosity=0)
+        if directory:
+            rmtree(directory)
+
+    for measurement in measurements:
+        print(measurement)
+
+    if arguments.output:
+        results: Dict[str, Any] = {
+            "commit": get_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": python_version(),
+            "django": django.get_version(),
+            "database": settings.DATABASES["default"]["ENGINE"],
+            "seed": arguments.seed,
+            "size": asdict(size),
+            "counts": counts,
+            "results": [measurement.to_json() for measurement in measurements],
+        }
+        with open(arguments.output, "w") as file:
+            dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Builds a synthetic department of a given size, from a seed so that every run gets the same one.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from random import Random
+from typing import Dict, List
+
+from django.core.management import call_command
+from django.db import transaction
+from django.utils.timezone import make_aware
+
+from app.calculation.rollover import SNAPSHOT_MODELS, snapshot
+from app.models import AcademicGroup, Assignment, LoadFunction, Staff, StandardLoad, Task, Unit, YearSnapshot
+
+
+@dataclass(frozen=True)
+class DepartmentSize:
+    """
+    The size of a synthetic department.
+
+    :attribute staff: The number of staff.
+    :attribute units: The number of units, each of which has a unit lead and a marking task.
+    :attribute tasks: The number of tasks not tied to a unit.
+    :attribute assignments_per_task: The maximum number of staff assigned to each task.
+    :attribute load_functions: The number of load functions, on top of the standard ones.
+    :attribute full_time_tasks: The number of full-time tasks, e.g. secondments.
+    :attribute history_years: The number of past years of history.
+    """
+
+    staff: int
+    units: int
+    tasks: int
+    assignments_per_task: int = 4
+    load_functions: int = 5
+    full_time_tasks: int = 3
+    history_years: int = 3
+
+
+SIZES: Dict[str, DepartmentSize] = {
+    "tiny": DepartmentSize(staff=10, units=5, tasks=10, load_functions=1, full_time_tasks=1, history_years=1),
+    "small": DepartmentSize(staff=50, units=25, tasks=75),
+    "medium": DepartmentSize(staff=150, units=80, tasks=250),
+    "large": DepartmentSize(staff=500, units=250, tasks=1000, history_years=10),
+}
+
+# Templates for extra load functions, which between them use every variable and the syntax the standard ones do.
+EXPRESSIONS: List[str] = [
+    "{a} * s",
+    "{a} + {b} * s",
+    "{a} * s ** 0.5",
+    "{a} * s + {b} * l",
+    "{a} * s + {b} * e if s > 10 else {a}",
+    "int({a} * s / {b})",
+]
+
+
+def build_department(size: DepartmentSize, seed: int = 1):
+    """
+    Fills an empty database with a synthetic department: the standard fixtures, then staff, units,
+    tasks and assignments drawn at random, and past years of history.
+
+    The loads are left uncalculated.
+
+    :param size: The size of the department.
+    :param seed: The seed for the random choices.
+    """
+    rng: Random = Random(seed)
+    call_command("loaddata", "site", "info", "standard_load", "academic_group", "load_function", verbosity=0)
+
+    with transaction.atomic():
+        groups: List[AcademicGroup] = list(AcademicGroup.objects.all())
+        for index in range(size.load_functions):
+            LoadFunction.objects.create(
+                name=f"Synthetic function {index}",
+                expression=rng.choice(EXPRESSIONS).format(a=rng.randint(1, 5), b=rng.randint(2, 10)),
+            )
+        load_functions: List[LoadFunction] = list(LoadFunction.objects.all())
+        # Only tasks for units have lectures and exams.
+        load_functions_student: List[LoadFunction] = [function for function in load_functions if function.get_compiled_expression().names == {"s"}]
+
+        staff: List[Staff] = []
+        for index in range(size.staff):
+            is_fixed: bool = rng.random() < 0.15
+            staff.append(
+                Staff(
+                    account=f"staff{index:05d}",
+                    name=f"Staff Member {index}",
+                    gender=rng.choice("MF"),
+                    academic_group=rng.choice(groups + [None]),
+                    fte_fraction=0 if is_fixed else rng.choice([0.5, 0.8, 1.0, 1.0]),
+                    hours_fixed=rng.randint(50, 300) if is_fixed else 0,
+                )
+            )
+        staff = Staff.objects.bulk_create(staff)
+
+        units: List[Unit] = []
+        for index in range(size.units):
+            coursework_mark_fraction: float = rng.choice([0.0, 0.2, 0.5, 1.0])
+            units.append(
+                Unit(
+                    code=f"PHYS{index:05d}",
+                    name=f"Synthetic Unit {index}",
+                    academic_group=rng.choice(groups),
+                    students=rng.randint(5, 250),
+                    lectures=rng.randint(0, 36),
+                    problem_classes=rng.randint(0, 12),
+                    coursework=rng.randint(0, 5),
+                    synoptic_lectures=rng.randint(0, 3),
+                    exams=rng.randint(0, 2),
+                    credits=rng.choice([15, 30]),
+                    coursework_mark_fraction=coursework_mark_fraction,
+                    exam_mark_fraction=round(1 - coursework_mark_fraction, 2),
+                )
+            )
+        units = Unit.objects.bulk_create(units)
+
+        tasks: List[Task] = []
+        for unit in units:
+            tasks.append(
+                Task(
+                    title="Unit Lead",
+                    unit=unit,
+                    is_lead=True,
+                    is_unique=True,
+                    load_fixed=rng.randint(0, 20),
+                    load_fixed_first=rng.randint(0, 20),
+                    coursework_fraction=rng.choice([0, 0.5, 1]),
+                    exam_fraction=rng.choice([0, 0.5, 1]),
+                    description="Co-ordinates the unit.",
+                )
+            )
+            tasks.append(
+                Task(
+                    title="Marker",
+                    unit=unit,
+                    load_function=rng.choice(load_functions),
+                    load_fixed=rng.randint(0, 5),
+                    load_fixed_first=rng.randint(0, 5),
+                    load_multiplier=rng.choice([1.0, 1.5, 0.7]),
+                    description="Marks the unit.",
+                )
+            )
+        for index in range(size.tasks):
+            tasks.append(
+                Task(
+                    title=f"Synthetic Task {index}",
+                    academic_group=rng.choice(groups + [None]),
+                    load_function=rng.choice(load_functions_student + [None]),
+                    students=rng.choice([None, 3, 10, 25]),
+                    load_fixed=rng.randint(0, 100),
+                    load_fixed_first=rng.randint(0, 10),
+                    load_multiplier=rng.choice([1.0, 1.1, 0.5]),
+                    description="A synthetic task.",
+                )
+            )
+        for index in range(size.full_time_tasks):
+            tasks.append(
+                Task(
+                    title=f"Full-Time Task {index}",
+                    is_full_time=True,
+                    is_unique=True,
+                    load_multiplier=rng.choice([0.5, 1.0]),
+                    description="A synthetic full-time task.",
+                )
+            )
+        for task in tasks:
+            task.name = task.title
+        tasks = Task.objects.bulk_create(tasks)
+
+        assignments: List[Assignment] = []
+        for task in tasks:
+            count: int = 1 if task.is_lead or task.is_full_time else rng.randint(0, size.assignments_per_task)
+            for member in rng.sample(staff, min(count, len(staff))):
+                assignments.append(
+                    Assignment(
+                        task=task,
+                        staff=member,
+                        is_first_time=rng.random() < 0.2,
+                        # Functions for unit tasks can use the lectures and exams, so need the students too.
+                        students=rng.choice([2, 6, 12] if task.unit_id else [None, 2, 6, 12]) if task.load_function_id else None,
+                    )
+                )
+        Assignment.objects.bulk_create(assignments)
+
+        build_history(size.history_years, rng)
+
+
+def build_history(years: int, rng: Random):
+    """
+    Snapshots every model for each of a number of past years, as if they'd been rolled over.
+
+    :param years: The number of past years.
+    :param rng: The source of random balances for each year.
+    """
+    year: int = StandardLoad.objects.latest().year
+    for past_year in range(year - years, year):
+        staff: List[Staff] = list(Staff.objects.all())
+        for member in staff:
+            member.load_balance_final = rng.randint(-200, 200)
+        Staff.objects.bulk_update(staff, ["load_balance_final"])
+
+        academic_groups: List[AcademicGroup] = list(AcademicGroup.objects.all())
+        for academic_group in academic_groups:
+            academic_group.load_balance_final = rng.randint(-1000, 1000)
+        AcademicGroup.objects.bulk_update(academic_groups, ["load_balance_final"])
+
+        history_date: datetime = make_aware(datetime(past_year, 8, 31))
+        for model in SNAPSHOT_MODELS:
+            snapshot(model, history_date, "Synthetic history", progress=lambda *_: None)
+
+        standard_load: StandardLoad = StandardLoad.objects.latest()
+        standard_load.year = past_year
+        YearSnapshot.take(standard_load, history_date)
+
+    Staff.objects.update(load_balance_final=0)
+    AcademicGroup.objects.update(load_balance_final=0)
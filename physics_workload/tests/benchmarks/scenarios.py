@@ -0,0 +1,252 @@
+"""
+The operations to benchmark, and how they're timed.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from random import Random
+from statistics import mean, median
+from threading import Event, Thread
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List
+
+from django.db import connection, transaction
+from django.forms.models import model_to_dict
+from django.test import Client, override_settings
+
+from app.calculation import Subgraph, recalculate_all_loads, recalculate_loads
+from app.models import Assignment, Staff, StandardLoad, Task, Unit
+from app.models.data_version import start_data_version
+from users.models import CustomUser
+
+
+@dataclass
+class Measurement:
+    """
+    The timings of repeated runs of an operation.
+
+    :attribute name: The operation.
+    :attribute seconds: The wall-clock time of each run.
+    :attribute queries: The number of database queries in each run.
+    """
+
+    name: str
+    seconds: List[float] = field(default_factory=list)
+    queries: List[int] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        return f"{self.name:<26} {min(self.seconds):8.3f}s min {median(self.seconds):8.3f}s median {max(self.queries):6d} queries"
+
+    def to_json(self) -> Dict[str, Any]:
+        """
+        :return: The measurement, with summary statistics, in a form that can be dumped to JSON.
+        """
+        return {
+            "name": self.name,
+            "repeat": len(self.seconds),
+            "seconds": self.seconds,
+            "seconds_min": min(self.seconds),
+            "seconds_median": median(self.seconds),
+            "seconds_mean": mean(self.seconds),
+            "queries": self.queries,
+        }
+
+
+def measure(name: str, operation: Callable[[], Any], repeat: int, setup: Callable[[], Any] | None = None) -> Measurement:
+    """
+    Times an operation, counting the queries it runs.
+
+    :param name: The name of the operation.
+    :param operation: The operation to time.
+    :param repeat: The number of times to run it.
+    :param setup: Run before each run of the operation, without being timed.
+    :return: The timings of each run.
+    """
+    measurement: Measurement = Measurement(name=name)
+    for _ in range(repeat):
+        if setup:
+            setup()
+
+        queries: List[int] = [0]
+
+        def count_query(execute: Callable, sql: str, params: Any, many: bool, context: Dict, queries: List[int] = queries) -> Any:
+            queries[0] += 1
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count_query):
+            started: float = perf_counter()
+            operation()
+            measurement.seconds.append(perf_counter() - started)
+        measurement.queries.append(queries[0])
+
+    return measurement
+
+
+@contextmanager
+def recalculating_in_background() -> Iterator[None]:
+    """
+    Recalculates every load from scratch in another thread, all in one transaction, as a long write would.
+    The loads are cleared first, so every row is written back.
+
+    Waits until the write has started, and for it to finish afterwards.
+    """
+    writing: Event = Event()
+    errors: List[Exception] = []
+
+    def recalculate():
+        try:
+            with transaction.atomic():
+                Task.objects.update(load_calc=0, load_calc_first=0)
+                Assignment.objects.update(load_calc=0)
+                Staff.objects.update(load_assigned=0)
+                writing.set()
+                recalculate_all_loads()
+        except Exception as error:
+            errors.append(error)
+        finally:
+            writing.set()
+            connection.close()
+
+    thread: Thread = Thread(target=recalculate)
+    thread.start()
+    writing.wait()
+    try:
+        yield
+    finally:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+
+def measure_during_recalculation(name: str, operation: Callable[[], Any], repeat: int) -> Measurement:
+    """
+    Times an operation while the loads are being recalculated by another connection.
+
+    :param name: The name of the operation.
+    :param operation: The operation to time.
+    :param repeat: The number of times to run it, each during its own recalculation.
+    :return: The timings of each run.
+    """
+    measurement: Measurement = Measurement(name=name)
+    for _ in range(repeat):
+        with recalculating_in_background():
+            run: Measurement = measure(name, operation, 1)
+        measurement.seconds += run.seconds
+        measurement.queries += run.queries
+
+    return measurement
+
+
+def get_client() -> Client:
+    """
+    :return: A test client, logged in as a member of staff so every column and action is shown.
+    """
+    user, _ = CustomUser.objects.get_or_create(username="benchmark", defaults=dict(is_staff=True, is_superuser=True))
+    client: Client = Client()
+    client.force_login(user)
+    return client
+
+
+def measure_render(name: str, client: Client, url: str, repeat: int) -> List[Measurement]:
+    """
+    Times rendering a page from scratch, as after an edit, then again with the tables cached.
+
+    :param name: The name of the page.
+    :param client: The client to request the page with.
+    :param url: The page to render.
+    :param repeat: The number of times to render it each way.
+    :return: The timings of the cold renders, then the warm ones.
+    """
+    return [
+        measure(f"render_{name}", render(client, url), repeat, setup=start_data_version),
+        # Rendered once first, so even the first timed run finds the tables cached.
+        measure(f"render_{name}_warm", render(client, url), repeat, setup=render(client, url)),
+    ]
+
+
+def render(client: Client, url: str) -> Callable[[], None]:
+    """
+    :param client: The client to request the page with.
+    :param url: The page to render.
+    :return: An operation that renders the page, checking it succeeds.
+    """
+
+    def operation():
+        response = client.get(url)
+        assert response.status_code == 200, f"Rendering {url} failed with status {response.status_code}."
+
+    return operation
+
+
+def read_loads() -> Callable[[], None]:
+    """
+    :return: An operation that reads every assignment, with its staff and task.
+    """
+
+    def operation():
+        list(Assignment.objects.select_related("staff", "task"))
+
+    return operation
+
+
+def edit_assignment(rng: Random) -> Callable[[], None]:
+    """
+    :param rng: The source of the assignments to edit.
+    :return: An operation that edits a random assignment, then recalculates the loads that depend on it.
+    """
+    pks: List[int] = list(Assignment.objects.values_list("pk", flat=True))
+
+    def operation():
+        assignment: Assignment = Assignment.objects.get(pk=rng.choice(pks))
+        assignment.is_first_time = not assignment.is_first_time
+        assignment.save()
+        recalculate_loads(Subgraph.for_instance(assignment))
+
+    return operation
+
+
+def roll_over(client: Client) -> Callable[[], None]:
+    """
+    :param client: The client to submit the new year with.
+    :return: An operation that submits the current standard load as a new year, as a member of staff would.
+    """
+
+    def operation():
+        standard_load: StandardLoad = StandardLoad.objects.latest()
+        data: Dict[str, Any] = {name: value for name, value in model_to_dict(standard_load).items() if value is not None}
+        data["-submit"] = ""
+        response = client.post(f"{standard_load.get_absolute_url()}create/", data)
+        assert response.status_code == 302, f"Rolling over failed with status {response.status_code}."
+
+    return operation
+
+
+@override_settings(RECALCULATION_IN_BACKGROUND=False)
+def run_benchmarks(repeat: int, seed: int = 1) -> List[Measurement]:
+    """
+    Runs every benchmark against the department in the database.
+
+    Recalculations run straight away rather than in the background, so they're what's timed.
+    The rollover runs last, as it changes the year.
+
+    :param repeat: The number of times to run each operation.
+    :param seed: The seed for the choice of edits.
+    :return: The timings of each operation.
+    """
+    client: Client = get_client()
+
+    # The first recalculation fills in every load, so isn't representative.
+    recalculate_all_loads()
+
+    return [
+        measure("full_recalculation", recalculate_all_loads, repeat),
+        measure("single_edit", edit_assignment(Random(seed)), repeat),
+        *measure_render("staff_list", client, Staff.get_model_url(), repeat),
+        *measure_render("task_list", client, Task.get_model_url(), repeat),
+        *measure_render("task_list_last", client, f"{Task.get_model_url()}?page=last", repeat),
+        *measure_render("unit_list", client, Unit.get_model_url(), repeat),
+        measure_during_recalculation("read_during_recalculation", read_loads(), repeat),
+        measure_during_recalculation("edit_during_recalculation", edit_assignment(Random(seed)), repeat),
+        measure("rollover", roll_over(client), repeat),
+    ]
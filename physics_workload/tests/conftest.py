@@ -0,0 +1,24 @@
+"""
+Fixtures shared by the tests.
+"""
+
+import pytest
+from django.conf import LazySettings
+from tests.benchmarks.department import SIZES, build_department
+
+
+@pytest.fixture(autouse=True)
+def test_settings(settings: LazySettings):
+    """
+    Keeps the cache in memory, so tests don't share the site's, and recalculates loads as they're edited.
+    """
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    settings.RECALCULATION_IN_BACKGROUND = False
+
+
+@pytest.fixture
+def department(db):
+    """
+    A small synthetic department, with the loads left uncalculated.
+    """
+    build_department(SIZES["tiny"], seed=1)
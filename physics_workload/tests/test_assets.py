@@ -0,0 +1,12 @@
+from hashlib import md5
+from pathlib import Path
+
+from app.assets import static_versioned
+
+
+def test_static_versioned():
+    """
+    Checks a static file's URL is versioned by its contents, so it changes when the file does.
+    """
+    contents: bytes = (Path(__file__).parents[1] / "app" / "static" / "js" / "charts.js").read_bytes()
+    assert static_versioned("js/charts.js") == f"/static/js/charts.js?v={md5(contents, usedforsecurity=False).hexdigest()[:12]}"
@@ -0,0 +1,72 @@
+from typing import Dict, List
+
+from django.db import connection
+from django.db.models import Sum
+from django.test.utils import CaptureQueriesContext
+
+from app.calculation.balances import get_academic_group_balance_total, update_academic_group_balances, update_staff_balances
+from app.models import AcademicGroup, Staff
+
+
+def set_loads():
+    """
+    Gives each staff member a different assigned and target load, so their balances differ.
+    """
+    staff: List[Staff] = list(Staff.objects.order_by("pk"))
+    for index, member in enumerate(staff):
+        member.load_assigned = 100 * index
+        member.load_target = 300 + 7 * index
+    Staff.objects.bulk_update(staff, ["load_assigned", "load_target"])
+
+
+def get_academic_group_balance(academic_group: AcademicGroup) -> int:
+    """
+    The balance of a group, worked out a group at a time as it used to be.
+
+    :param academic_group: The academic group.
+    :return: The total assigned load of its staff, less their total target load.
+    """
+    aggregates: Dict[str, int] = academic_group.staff_set.aggregate(Sum("load_assigned"), Sum("load_target"))
+    return (aggregates["load_assigned__sum"] or 0) - (aggregates["load_target__sum"] or 0)
+
+
+def test_balances_match_per_row(department):
+    """
+    Checks the balances updated across every row at once are the same as working them out a row at a time,
+    including for a group with no staff, and take one query each.
+    """
+    AcademicGroup.objects.create(code="Z", short_name="Empty", name="Empty Group", load_balance_final=100)
+    set_loads()
+    Staff.objects.update(load_balance_final=12345)
+    AcademicGroup.objects.update(load_balance_final=12345)
+
+    with CaptureQueriesContext(connection) as context:
+        updated: Dict[str, int] = {"staff": update_staff_balances(), "academic_groups": update_academic_group_balances()}
+    assert len(context.captured_queries) == 2
+    assert updated == {"staff": Staff.objects.count(), "academic_groups": AcademicGroup.objects.count()}
+
+    staff: Dict[str, int] = {member.pk: member.load_assigned - member.load_target for member in Staff.objects.all()}
+    assert len(set(staff.values())) > 1
+    assert dict(Staff.objects.values_list("pk", "load_balance_final")) == staff
+
+    academic_groups: Dict[str, int] = {
+        academic_group.pk: get_academic_group_balance(academic_group) for academic_group in AcademicGroup.objects.all()
+    }
+    assert academic_groups["Z"] == 0
+    assert len(set(academic_groups.values())) > 2
+    assert dict(AcademicGroup.objects.values_list("pk", "load_balance_final")) == academic_groups
+    assert dict(AcademicGroup.objects.annotate(total=get_academic_group_balance_total()).values_list("pk", "total")) == academic_groups
+
+
+def test_balances_of_some_rows(department):
+    """
+    Checks only the rows given have their balances updated.
+    """
+    set_loads()
+    Staff.objects.update(load_balance_final=12345)
+    member: Staff = Staff.objects.first()
+    assert update_staff_balances(Staff.objects.filter(pk=member.pk)) == 1
+
+    member.refresh_from_db()
+    assert member.load_balance_final == member.load_assigned - member.load_target
+    assert Staff.objects.exclude(pk=member.pk).exclude(load_balance_final=12345).count() == 0
@@ -0,0 +1,36 @@
+import sys
+from json import load
+from pathlib import Path
+from subprocess import run
+
+
+def test_benchmarks(tmp_path: Path):
+    """
+    Runs the benchmarks against the smallest department, to check they still work.
+    """
+    output: Path = tmp_path / "benchmark.json"
+    run(
+        [sys.executable, "-m", "tests.benchmarks", "--size", "tiny", "--repeat", "1", "--output", str(output)],
+        cwd=Path(__file__).parents[1],
+        check=True,
+    )
+
+    with open(output) as file:
+        results = load(file)
+
+    assert [result["name"] for result in results["results"]] == [
+        "full_recalculation",
+        "single_edit",
+        "render_staff_list",
+        "render_staff_list_warm",
+        "render_task_list",
+        "render_task_list_warm",
+        "render_task_list_last",
+        "render_task_list_last_warm",
+        "render_unit_list",
+        "render_unit_list_warm",
+        "read_during_recalculation",
+        "edit_during_recalculation",
+        "rollover",
+    ]
+    assert results["counts"]["Staff"] == results["size"]["staff"]
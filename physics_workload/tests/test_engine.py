@@ -0,0 +1,93 @@
+from typing import Dict, List
+
+from app.calculation import CalculationContext, recalculate_all_loads
+from app.models import AcademicGroup, Assignment, Staff, StandardLoad, Task
+
+
+def calculate_loads_per_instance() -> Dict[str, Dict]:
+    """
+    The loads as the per-instance calculation worked them out: each task and assignment from `Task.calculate_load`,
+    repeating the whole department until the full-time tasks stop changing the target load per FTE.
+
+    :return: The loads of each model, by primary key.
+    """
+    standard_load: StandardLoad = StandardLoad.objects.latest()
+    tasks: List[Task] = list(Task.objects.select_related("unit", "load_function"))
+    assignments: List[Assignment] = list(Assignment.objects.select_related("task__unit", "task__load_function"))
+    staff: List[Staff] = list(Staff.objects.all())
+
+    target: int = standard_load.target_load_per_fte_calc or standard_load.target_load_per_fte
+    total_fte_fraction: float = sum(member.fte_fraction for member in staff)
+    total_hours_fixed: int = sum(member.hours_fixed for member in staff)
+    while True:
+        context: CalculationContext = CalculationContext(standard_load=standard_load, target_load_per_fte=target)
+        assignment_loads: Dict[int, int] = {
+            assignment.pk: int(assignment.task.calculate_load(assignment.students, assignment.is_first_time, context)) for assignment in assignments
+        }
+
+        total_assigned_hours: int = sum(assignment_loads.values())
+        if total_fte_fraction and total_assigned_hours:
+            target_new: int = int(standard_load.load_fte_misc + (total_assigned_hours - total_hours_fixed) / total_fte_fraction)
+        else:
+            target_new = int(standard_load.target_load_per_fte)
+
+        if target_new == target:
+            break
+        target = target_new
+
+    task_loads: Dict[int, tuple] = {}
+    for task in tasks:
+        students: int | None = None if task.is_full_time else task.students or (task.unit.students if task.unit else None)
+        task_loads[task.pk] = (
+            int(task.calculate_load(students, is_first_time=False, context=context)),
+            int(task.calculate_load(students, is_first_time=True, context=context)),
+        )
+
+    assignment_totals: Dict[str, int] = {member.pk: 0 for member in staff}
+    for assignment in assignments:
+        assignment_totals[assignment.staff_id] += assignment_loads[assignment.pk]
+
+    staff_loads: Dict[str, tuple] = {}
+    academic_group_loads: Dict[str, int] = {pk: 0 for pk in AcademicGroup.objects.values_list("pk", flat=True)}
+    for member in staff:
+        load_assigned: int = int(standard_load.load_fte_misc * member.fte_fraction + assignment_totals[member.pk])
+        if member.hours_fixed:
+            load_target: int = member.hours_fixed
+        elif member.fte_fraction:
+            load_target = int(member.fte_fraction * target)
+        else:
+            load_target = member.load_target
+        staff_loads[member.pk] = (load_assigned, load_target)
+        if member.academic_group_id:
+            academic_group_loads[member.academic_group_id] += load_assigned - load_target
+
+    return {
+        "target_load_per_fte": target,
+        Task.__name__: task_loads,
+        Assignment.__name__: assignment_loads,
+        Staff.__name__: staff_loads,
+        AcademicGroup.__name__: academic_group_loads,
+    }
+
+
+def test_engine_matches_per_instance_calculation(department):
+    """
+    Recalculates a department all at once, and checks every load against the per-instance calculation.
+    """
+    # Someone with neither an FTE fraction nor fixed hours keeps the target they have.
+    Staff.objects.create(account="visitor", name="Visiting Fellow", gender="F", fte_fraction=0, hours_fixed=0, load_target=42)
+    expected: Dict[str, Dict] = calculate_loads_per_instance()
+
+    result = recalculate_all_loads()
+
+    assert result.converged
+    assert result.target_load_per_fte == expected["target_load_per_fte"]
+    assert StandardLoad.objects.latest().target_load_per_fte_calc == expected["target_load_per_fte"]
+    assert {pk: tuple(loads) for pk, *loads in Task.objects.values_list("pk", "load_calc", "load_calc_first")} == expected[Task.__name__]
+    assert dict(Assignment.objects.values_list("pk", "load_calc")) == expected[Assignment.__name__]
+    assert {pk: tuple(loads) for pk, *loads in Staff.objects.values_list("pk", "load_assigned", "load_target")} == expected[Staff.__name__]
+    assert dict(AcademicGroup.objects.values_list("pk", "load_balance_final")) == expected[AcademicGroup.__name__]
+
+    # Recalculating again changes nothing.
+    result = recalculate_all_loads()
+    assert (result.tasks_updated, result.assignments_updated, result.staff_updated, result.academic_groups_updated) == (0, 0, 0, 0)
@@ -0,0 +1,110 @@
+from json import load
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy
+import pytest
+from simpleeval import NameNotDefined, NumberTooHigh, simple_eval
+from tests.benchmarks.department import EXPRESSIONS
+
+from app.expression import CompiledExpression
+
+STUDENTS: List[int | None] = [None, 0, 1, 2, 3, 5, 6, 7, 10, 11, 12, 25, 59, 60, 61, 100, 250]
+
+
+def get_fixture_expressions() -> List[str]:
+    """
+    :return: The expressions of the load functions the site starts with.
+    """
+    with open(Path(__file__).parents[1] / "app" / "fixtures" / "load_function.json") as file:
+        return [load_function["fields"]["expression"] for load_function in load(file)]
+
+
+def evaluate_each(expression: str, students: List[int | None], lectures: List[int | None], exams: List[int | None]) -> List[float]:
+    """
+    Evaluates an expression one set of variables at a time, as `LoadFunction.evaluate` used to.
+
+    :return: The value for each set of variables.
+    """
+    values: List[float] = []
+    for count_students, count_lectures, count_exams in zip(students, lectures, exams):
+        # As in `LoadFunction.evaluate`, no students is the same as the variable not being given.
+        row: Tuple = (("s", count_students or None), ("l", count_lectures), ("e", count_exams))
+        names: Dict[str, int] = {name: value for name, value in row if value is not None}
+        values.append(simple_eval(expression, names=names) if names else 0)
+    return values
+
+
+@pytest.mark.parametrize(
+    "expression",
+    get_fixture_expressions() + [template.format(a=3, b=7) for template in EXPRESSIONS],
+)
+def test_matches_simple_eval(expression: str):
+    """
+    Checks the load functions give the same values evaluated in one go as one at a time.
+    """
+    compiled: CompiledExpression = CompiledExpression(expression)
+    if compiled.names <= {"s"}:
+        nothing: List[None] = [None] * len(STUDENTS)
+        assert compiled.evaluate_batch(STUDENTS).tolist() == pytest.approx(evaluate_each(expression, STUDENTS, nothing, nothing))
+
+    # For units, the lectures and exams are always there, so the students need to be too.
+    students: List[int] = [value for value in STUDENTS if value]
+    lectures: List[int] = [index % 30 for index in range(len(students))]
+    exams: List[int] = [index % 3 for index in range(len(students))]
+    assert compiled.evaluate_batch(students, lectures, exams).tolist() == pytest.approx(evaluate_each(expression, students, lectures, exams))
+
+
+def test_division_by_zero():
+    """
+    Checks dividing by zero raises the same error as `simpleeval`, rather than giving infinity.
+    """
+    compiled: CompiledExpression = CompiledExpression("10 / (s - 5)")
+    assert compiled.evaluate_batch([4, 6, 15]).tolist() == evaluate_each("10 / (s - 5)", [4, 6, 15], [None] * 3, [None] * 3)
+
+    with pytest.raises(ZeroDivisionError):
+        simple_eval("10 / (s - 5)", names={"s": 5})
+    with pytest.raises(ZeroDivisionError):
+        compiled.evaluate_batch([4, 5, 6])
+
+    # Only the branch taken counts.
+    assert CompiledExpression("10 / (s - 5) if s != 5 else 0").evaluate_batch([4, 5, 6]).tolist() == [-10, 0, 10]
+
+
+def test_undefined_names():
+    """
+    Checks a variable with no value raises the same error as `simpleeval`, and no variables at all gives no load.
+    """
+    compiled: CompiledExpression = CompiledExpression("s * l")
+    with pytest.raises(NameNotDefined):
+        simple_eval("s * l", names={"s": 3})
+    with pytest.raises(NameNotDefined):
+        compiled.evaluate_batch([3, 4], lectures=[2, None])
+
+    assert compiled.evaluate_batch([None, 0]).tolist() == [0, 0]
+
+
+def test_power_limit():
+    """
+    Checks powers too large for `simpleeval` raise the same error, rather than being worked out.
+    """
+    compiled: CompiledExpression = CompiledExpression("2 ** s")
+    assert compiled.evaluate_batch([3, 10]).tolist() == [8, 1024]
+
+    with pytest.raises(NumberTooHigh):
+        simple_eval("2 ** s", names={"s": 5000000})
+    with pytest.raises(NumberTooHigh):
+        compiled.evaluate_batch([3, 5000000])
+
+
+def test_non_finite_falls_back():
+    """
+    Checks rows that overflow as floating point are evaluated one at a time, as `simpleeval` has exact integers.
+    """
+    expression: str = "s ** 200 / s ** 199"
+    compiled: CompiledExpression = CompiledExpression(expression)
+    assert compiled.vectorizable
+    with numpy.errstate(over="ignore"):
+        assert not numpy.isfinite(numpy.float64(100) ** 200 / numpy.float64(100) ** 199)
+
+    assert compiled.evaluate_batch([2, 100]).tolist() == evaluate_each(expression, [2, 100], [None] * 2, [None] * 2) == [2, 100]
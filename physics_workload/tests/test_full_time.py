@@ -0,0 +1,127 @@
+import numpy
+import pytest
+from numpy.typing import NDArray
+
+from app.calculation import full_time
+from app.calculation.full_time import FullTimeSolution, solve_target_load_per_fte
+
+
+def iterate_target_load_per_fte(
+    load_fte_misc: float,
+    target_load_per_fte: int,
+    total_fte_fraction: float,
+    total_hours_fixed: float,
+    total_assigned_hours: int,
+    multipliers: NDArray[numpy.float64],
+    target_start: int,
+) -> int:
+    """
+    The old way of settling the target: recalculate it with the full-time tasks at the last target, until it stops changing.
+
+    :return: The settled target.
+    """
+    target: int = target_start
+    while True:
+        total: int = total_assigned_hours + int(numpy.trunc(target * multipliers).sum())
+        if total_fte_fraction and total:
+            target_new: int = int(load_fte_misc + (total - total_hours_fixed) / total_fte_fraction)
+        else:
+            target_new = int(target_load_per_fte)
+
+        if target_new == target:
+            return target
+        target = target_new
+
+
+def test_matches_iteration():
+    """
+    Checks the solution is one the old iteration would settle on, and the same one where there's only one.
+
+    Truncating the full-time loads to whole hours can leave neighbouring targets that are each consistent,
+    in which case the iteration settles on whichever it reaches first from where it starts.
+    """
+    rng: numpy.random.Generator = numpy.random.default_rng(1)
+    for _ in range(500):
+        total_fte_fraction: float = float(rng.uniform(5, 100))
+        multipliers: NDArray[numpy.float64] = rng.choice([0.5, 0.7, 1.0, 1.5], size=rng.integers(0, 6))
+        if multipliers.sum() >= total_fte_fraction:
+            continue
+
+        arguments = (float(rng.uniform(0, 300)), 550, total_fte_fraction, float(rng.integers(0, 2000)), int(rng.integers(0, 50000)), multipliers)
+        solution: FullTimeSolution = solve_target_load_per_fte(*arguments)
+        target: int = solution.target_load_per_fte
+
+        assert solution.converged
+        assert iterate_target_load_per_fte(*arguments, target_start=target) == target
+        assert numpy.array_equal(solution.loads, numpy.trunc(target * multipliers))
+
+        # Iterating up from nothing and down from far above finds the lowest and highest consistent targets.
+        target_lowest: int = iterate_target_load_per_fte(*arguments, target_start=0)
+        target_highest: int = iterate_target_load_per_fte(*arguments, target_start=10**6)
+        assert target_lowest <= target <= target_highest
+        if target_lowest == target_highest:
+            assert target == target_lowest
+
+
+def test_cycles_maximum(monkeypatch: pytest.MonkeyPatch):
+    """
+    Checks the refinement gives up after the maximum number of cycles, returning the last target tried.
+    """
+    arguments = dict(load_fte_misc=100, target_load_per_fte=550, total_fte_fraction=5, total_hours_fixed=0, total_assigned_hours=1000)
+    # The closed form gives 375, but truncating the full-time loads brings it down to 374.
+    solution: FullTimeSolution = solve_target_load_per_fte(**arguments, multipliers=numpy.array([0.5, 0.5]))
+    assert (solution.target_load_per_fte, solution.cycles, solution.converged) == (374, 2, True)
+
+    monkeypatch.setattr(full_time, "CYCLES_MAXIMUM", 1)
+    solution = solve_target_load_per_fte(**arguments, multipliers=numpy.array([0.5, 0.5]))
+    assert (solution.target_load_per_fte, solution.cycles, solution.converged) == (375, 1, False)
+
+
+def test_full_time_tasks_outweigh_staff():
+    """
+    Checks that if the full-time tasks are worth as many FTE as the staff, the target is left as it was.
+    """
+    solution: FullTimeSolution = solve_target_load_per_fte(
+        load_fte_misc=100,
+        target_load_per_fte=550,
+        total_fte_fraction=2,
+        total_hours_fixed=0,
+        total_assigned_hours=1000,
+        multipliers=numpy.array([1.0, 1.0]),
+        target_initial=600,
+    )
+    assert (solution.target_load_per_fte, solution.cycles, solution.converged) == (600, 0, False)
+    assert solution.loads.tolist() == [600, 600]
+
+
+def test_zero_fte():
+    """
+    Checks that with no FTE staff to share the load between, the target is the default.
+    """
+    solution: FullTimeSolution = solve_target_load_per_fte(
+        load_fte_misc=100,
+        target_load_per_fte=550,
+        total_fte_fraction=0,
+        total_hours_fixed=500,
+        total_assigned_hours=1000,
+        multipliers=numpy.array([0.5]),
+        target_initial=600,
+    )
+    assert (solution.target_load_per_fte, solution.converged) == (550, True)
+    assert solution.loads.tolist() == [275]
+
+
+def test_zero_load():
+    """
+    Checks that with nothing assigned, the target is the default.
+    """
+    solution: FullTimeSolution = solve_target_load_per_fte(
+        load_fte_misc=100,
+        target_load_per_fte=550,
+        total_fte_fraction=10,
+        total_hours_fixed=0,
+        total_assigned_hours=0,
+        multipliers=numpy.array([]),
+    )
+    assert (solution.target_load_per_fte, solution.converged) == (550, True)
+    assert solution.loads.tolist() == []
@@ -0,0 +1,172 @@
+from typing import Callable, Dict, List
+
+import pytest
+
+from app.calculation import (
+    CalculationContext,
+    Department,
+    RecalculationResult,
+    Subgraph,
+    get_recent_profiles,
+    recalculate_all_loads,
+    recalculate_loads,
+)
+from app.models import AcademicGroup, Assignment, Info, Staff, StandardLoad, Task, Unit
+
+
+def get_loads(department: Department) -> Dict[str, Dict]:
+    """
+    :param department: A calculated department.
+    :return: The loads of each model it loaded, by primary key.
+    """
+    return {
+        Task.__name__: dict(zip(department.task_pk, zip(department.task_load_calc.tolist(), department.task_load_calc_first.tolist()))),
+        Assignment.__name__: dict(zip(department.assignment_pk, department.assignment_load_calc.tolist())),
+        Staff.__name__: dict(zip(department.staff_pk, zip(department.staff_load_assigned.tolist(), department.staff_load_target.tolist()))),
+        AcademicGroup.__name__: dict(zip(department.academic_group_pk, department.academic_group_load_balance_final.tolist())),
+    }
+
+
+def get_saved_loads() -> Dict[str, Dict]:
+    """
+    :return: The saved loads of each model, by primary key.
+    """
+    return {
+        Task.__name__: {pk: tuple(loads) for pk, *loads in Task.objects.values_list("pk", "load_calc", "load_calc_first")},
+        Assignment.__name__: dict(Assignment.objects.values_list("pk", "load_calc")),
+        Staff.__name__: {pk: tuple(loads) for pk, *loads in Staff.objects.values_list("pk", "load_assigned", "load_target")},
+        AcademicGroup.__name__: dict(AcademicGroup.objects.values_list("pk", "load_balance_final")),
+    }
+
+
+def assert_subgraph_matches_full_calculation(subgraph: Subgraph):
+    """
+    Checks calculating just a subgraph gives the same loads for the rows in it as calculating everything.
+
+    If the target load per FTE moves, the staff outside the subgraph are out of date, and so are the group balances.
+    """
+    context: CalculationContext = CalculationContext.for_year()
+    department_full: Department = Department(context)
+    department_full.calculate()
+    loads_full: Dict[str, Dict] = get_loads(department_full)
+
+    department: Department = Department(context, subgraph)
+    result: RecalculationResult = department.calculate()
+    assert len(department.task_pk) < len(department_full.task_pk)
+    assert result.target_load_per_fte == department_full.target_load_per_fte
+
+    models: List[str] = [Task.__name__, Assignment.__name__, Staff.__name__]
+    if result.target_load_per_fte == context.standard_load.target_load_per_fte_calc:
+        models.append(AcademicGroup.__name__)
+
+    for model, loads in get_loads(department).items():
+        if model in models:
+            assert loads == {pk: loads_full[model][pk] for pk in loads}
+
+
+def edit_task() -> Subgraph:
+    task: Task = Task.objects.filter(is_lead=False, is_full_time=False, assignment_set__isnull=False).first()
+    task.load_fixed += 17
+    task.save()
+    return Subgraph.for_instance(task)
+
+
+def edit_unit() -> Subgraph:
+    unit: Unit = Unit.objects.filter(task_set__assignment_set__isnull=False).first()
+    unit.students += 40
+    unit.save()
+    return Subgraph.for_instance(unit)
+
+
+def edit_assignment() -> Subgraph:
+    assignment: Assignment = Assignment.objects.filter(task__is_full_time=False).first()
+    assignment.is_first_time = not assignment.is_first_time
+    assignment.save()
+    return Subgraph.for_instance(assignment)
+
+
+def move_assignment() -> Subgraph:
+    # Moving an assignment affects the staff member it's moved from, as well as the one it's moved to.
+    assignment: Assignment = Assignment.objects.filter(task__is_full_time=False).first()
+    assignment.staff = Staff.objects.exclude(pk=assignment.staff_id).exclude(academic_group=assignment.staff.academic_group).first()
+    subgraph: Subgraph = Subgraph.for_instance(assignment)
+    assignment.save()
+    return subgraph | Subgraph.for_instance(assignment)
+
+
+def delete_assignment() -> Subgraph:
+    assignment: Assignment = Assignment.objects.filter(task__is_full_time=False).last()
+    subgraph: Subgraph = Subgraph.for_instance(assignment, deleted=True)
+    assignment.delete()
+    return subgraph
+
+
+def edit_staff() -> Subgraph:
+    staff: Staff = Staff.objects.filter(fte_fraction__gt=0, assignment_set__isnull=False).first()
+    staff.fte_fraction = 0.3
+    staff.save()
+    return Subgraph.for_instance(staff)
+
+
+def edit_standard_load() -> Subgraph | None:
+    standard_load: StandardLoad = StandardLoad.objects.latest()
+    standard_load.load_lecture += 1
+    standard_load.save()
+    return Subgraph.for_instance(standard_load)
+
+
+EDITS: List[Callable[[], Subgraph | None]] = [
+    edit_task,
+    edit_unit,
+    edit_assignment,
+    move_assignment,
+    delete_assignment,
+    edit_staff,
+    edit_standard_load,
+]
+
+
+@pytest.mark.parametrize("edit", EDITS)
+def test_edit_matches_full_calculation(department, edit: Callable[[], Subgraph | None]):
+    """
+    Checks recalculating just the rows an edit affects gives the same loads as recalculating everything.
+    """
+    recalculate_all_loads()
+    subgraph: Subgraph | None = edit()
+    if subgraph is not None:
+        assert_subgraph_matches_full_calculation(subgraph)
+
+    recalculate_loads(subgraph)
+    department: Department = Department(CalculationContext.for_year())
+    department.calculate()
+    assert StandardLoad.objects.latest().target_load_per_fte_calc == department.target_load_per_fte
+    assert get_saved_loads() == get_loads(department)
+
+
+def test_edits_match_full_calculation(department):
+    """
+    Checks a run of edits, each recalculated on its own, keeps the loads the same as recalculating everything.
+    """
+    recalculate_all_loads()
+    for edit in EDITS:
+        recalculate_loads(edit())
+
+    department: Department = Department(CalculationContext.for_year())
+    department.calculate()
+    assert get_saved_loads() == get_loads(department)
+
+
+def test_move_assignment_recalculates_affected_loads(department):
+    """
+    Checks an edit that leaves the total load, and so the target load per FTE, alone doesn't recalculate everything.
+    """
+    recalculate_all_loads()
+    recalculate_loads(move_assignment())
+    assert get_recent_profiles()[0].label == "affected loads"
+
+
+def test_unknown_model():
+    """
+    Checks an edit to a model without known dependencies is treated as affecting everything.
+    """
+    assert Subgraph.for_instance(Info(name="Unknown")) is None
@@ -0,0 +1,80 @@
+import pytest
+from django.conf import LazySettings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from app.models import Assignment, Staff
+
+
+@pytest.fixture(autouse=True)
+def history_enabled(settings: LazySettings):
+    """
+    Writes historical records as rows are saved, which the site only does when rolling over.
+    """
+    settings.SIMPLE_HISTORY_ENABLED = True
+
+
+def count_history(staff: Staff) -> int:
+    """
+    :param staff: A staff member.
+    :return: The number of historical records of them.
+    """
+    return staff.history.count()
+
+
+def test_dynamic_fields_write_no_history(department):
+    """
+    Checks saving a row with only its dynamic fields changed writes no historical record, and doesn't look up the last one.
+    """
+    staff: Staff = Staff.objects.first()
+    records: int = count_history(staff)
+
+    staff.load_assigned += 10
+    with CaptureQueriesContext(connection) as context:
+        staff.save()
+    assert count_history(staff) == records
+    assert not [query for query in context.captured_queries if "historical" in query["sql"]]
+
+    staff.notes = "Moved office"
+    staff.save()
+    assert count_history(staff) == records + 1
+
+    # Compared to what was last saved, rather than what was loaded.
+    staff.load_target += 10
+    staff.save()
+    assert count_history(staff) == records + 1
+
+
+def test_update_fields(department):
+    """
+    Checks saving just some fields is judged on which fields they are.
+    """
+    assignment: Assignment = Assignment.objects.first()
+    records: int = assignment.history.count()
+
+    assignment.load_calc += 1
+    assignment.save(update_fields=["load_calc"])
+    assert assignment.history.count() == records
+
+    assignment.is_provisional = not assignment.is_provisional
+    assignment.save(update_fields=["is_provisional"])
+    assert assignment.history.count() == records + 1
+
+    # The saved field is now what the row is compared to.
+    assignment.save()
+    assert assignment.history.count() == records + 1
+
+
+def test_unloaded_row_writes_history(department):
+    """
+    Checks a row that wasn't loaded from the database, so might have changed in any way, writes a record.
+    """
+    staff: Staff = Staff.objects.first()
+    records: int = count_history(staff)
+
+    Staff(**{field.attname: getattr(staff, field.attname) for field in Staff._meta.concrete_fields}).save()
+    assert count_history(staff) == records + 1
+
+    # Loaded without some of its fields, so whether they changed is unknown.
+    Staff.objects.only("pk", "name").get(pk=staff.pk).save()
+    assert count_history(staff) == records + 2
@@ -0,0 +1,42 @@
+from app import expression
+from app.models import LoadFunction
+
+
+def get_cached_keys(load_function: LoadFunction) -> list:
+    """
+    :param load_function: A load function.
+    :return: The keys of the compiled expressions cached for it.
+    """
+    return [key for key in expression._cache if key[0] == load_function.pk]
+
+
+def test_edit_invalidates_compiled_expression(db):
+    """
+    Checks editing a load function's expression changes what it evaluates to, and drops the old compiled one.
+    """
+    load_function: LoadFunction = LoadFunction.objects.create(name="Tutees", expression="3 * s")
+    assert load_function.evaluate(10) == 30
+    assert load_function.evaluate_batch([10, 20]).tolist() == [30, 60]
+    assert len(get_cached_keys(load_function)) == 1
+
+    load_function.expression = "5 * s"
+    load_function.save()
+    assert get_cached_keys(load_function) == []
+
+    # A fresh copy, as a page loading it would have.
+    load_function = LoadFunction.objects.get(pk=load_function.pk)
+    assert load_function.evaluate(10) == 50
+    assert load_function.evaluate_batch([10, 20]).tolist() == [50, 100]
+    assert len(get_cached_keys(load_function)) == 1
+
+
+def test_delete_invalidates_compiled_expression(db):
+    """
+    Checks deleting a load function drops its compiled expression.
+    """
+    load_function: LoadFunction = LoadFunction.objects.create(name="Tutees", expression="3 * s")
+    assert load_function.evaluate(10) == 30
+
+    pk: int = load_function.pk
+    load_function.delete()
+    assert [key for key in expression._cache if key[0] == pk] == []
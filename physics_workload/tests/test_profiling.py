@@ -0,0 +1,51 @@
+from io import StringIO
+from json import loads
+
+from django.core.management import call_command
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory
+
+from app.calculation.profiling import Profile, Profiler, clear_profiles, get_recent_profiles
+from app.middlewares import ConditionalPageMiddleware
+
+
+def test_profiles_are_kept_in_the_cache(db, settings):
+    """
+    Checks recorded profiles come back out of the cache as they went in, newest first, up to the limit.
+    """
+    settings.RECALCULATION_PROFILE_HISTORY = 3
+    clear_profiles()
+    for index in range(4):
+        with Profiler(f"loads {index}") as profiler:
+            with profiler.phase("load"):
+                profiler.profile.rows_written = index
+
+    profiles = get_recent_profiles()
+    assert [profile.label for profile in profiles] == ["loads 3", "loads 2", "loads 1"]
+    assert profiles[0] == Profile.from_json(profiler.profile.to_json()) == profiler.profile
+    assert [phase.name for phase in profiles[0].phases] == ["load"]
+
+    clear_profiles()
+    assert get_recent_profiles() == []
+
+
+def test_diagnostics_not_conditional(db):
+    """
+    Checks the diagnostics page isn't given an ETag, as the recent recalculations change without the data version.
+    """
+    middleware: ConditionalPageMiddleware = ConditionalPageMiddleware(lambda request: HttpResponse("Diagnostics"))
+    request: HttpRequest = RequestFactory().get("/diagnostics/")
+    assert not middleware(request).has_header("ETag")
+
+
+def test_profile_command_without_cache(department, settings):
+    """
+    Checks the profile command reports each recalculation it runs, even if the cache doesn't keep the profiles.
+    """
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+    output: StringIO = StringIO()
+    call_command("profile_recalculation", "--repeat", "2", "--json", "--dry-run", stdout=output)
+
+    profiles = loads(output.getvalue())
+    assert [profile["label"] for profile in profiles] == ["all loads", "all loads"]
+    assert profiles[0]["rows_written"] > 0 and profiles[1]["rows_written"] == 0
@@ -0,0 +1,40 @@
+from typing import List
+
+from django.db import connection
+from django.db.models import Prefetch
+from django.test.utils import CaptureQueriesContext
+
+from app.models import Assignment, Task, Unit
+from app.tables.task import TaskTable
+
+
+def get_assignments(task: Task) -> List[int]:
+    """
+    :param task: The task, with its assignments prefetched.
+    :return: The primary keys of the prefetched assignments, sorted.
+    """
+    return sorted(assignment.pk for assignment in task.assignment_set.all())
+
+
+def test_prefetch_assignments(department):
+    """
+    Checks each task's prefetched assignments are its own, not just those of the first task, and are all fetched up front.
+    """
+    with CaptureQueriesContext(connection) as context:
+        tasks: List[Task] = list(TaskTable.prefetch_query_set(Task.objects.all()))
+        prefetched: List[List[int]] = [get_assignments(task) for task in tasks]
+        assert all(assignment.staff for task in tasks for assignment in task.assignment_set.all())
+
+    assert len(context.captured_queries) == 2
+    assert sum(1 for assignments in prefetched if assignments) > 1
+    assert prefetched == [sorted(Assignment.objects.filter(task=task).values_list("pk", flat=True)) for task in tasks]
+
+
+def test_prefetch_assignments_of_units(department):
+    """
+    Checks the assignments of each unit's tasks are its own, when the tasks are prefetched through the unit.
+    """
+    units: List[Unit] = list(Unit.objects.prefetch_related(Prefetch("task_set", queryset=TaskTable.prefetch_assignments(Task.objects.all()))))
+    tasks: List[Task] = [task for unit in units for task in unit.task_set.all()]
+    assert len(tasks) > 1
+    assert [get_assignments(task) for task in tasks] == [sorted(Assignment.objects.filter(task=task).values_list("pk", flat=True)) for task in tasks]
@@ -0,0 +1,131 @@
+from datetime import datetime
+from typing import List
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
+
+from app.calculation import Subgraph, worker
+from app.models import RecalculationJob, recalculation_job
+from app.models.data_version import DATA_VERSION_KEY, start_data_version
+
+
+@pytest.fixture
+def recalculated(monkeypatch: pytest.MonkeyPatch) -> List[Subgraph | None]:
+    """
+    Records the subgraphs the worker recalculates, rather than recalculating them.
+    """
+    subgraphs: List[Subgraph | None] = []
+    monkeypatch.setattr(worker, "recalculate_loads", subgraphs.append)
+    return subgraphs
+
+
+def fail_to_recalculate(subgraph: Subgraph | None):
+    raise ValueError("Something went wrong")
+
+
+def test_failed_job_is_stale_until_retried(db, monkeypatch: pytest.MonkeyPatch, recalculated: List[Subgraph | None]):
+    """
+    Checks a failed job keeps the loads marked out of date, and is retried along with the next job.
+    """
+    with monkeypatch.context() as patch:
+        patch.setattr(worker, "recalculate_loads", fail_to_recalculate)
+        RecalculationJob.queue(Subgraph(tasks={1}))
+        assert worker.run_pending_job()
+
+    job: RecalculationJob = RecalculationJob.objects.get()
+    assert job.status == RecalculationJob.Status.FAILED
+    assert job.error == "ValueError: Something went wrong"
+    assert RecalculationJob.is_stale()
+
+    # There's nothing new to run, so the failure is left alone.
+    assert not worker.run_pending_job()
+    assert RecalculationJob.is_stale()
+
+    RecalculationJob.queue(Subgraph(tasks={2}))
+    assert worker.run_pending_job()
+    assert recalculated == [Subgraph(tasks={1, 2})]
+    assert not RecalculationJob.objects.exists()
+    assert not RecalculationJob.is_stale()
+
+
+def test_failed_retry_stays_stale(db, monkeypatch: pytest.MonkeyPatch):
+    """
+    Checks that if the retry fails too, both jobs are kept.
+    """
+    monkeypatch.setattr(worker, "recalculate_loads", fail_to_recalculate)
+    for tasks in ({1}, {2}):
+        RecalculationJob.queue(Subgraph(tasks=tasks))
+        assert worker.run_pending_job()
+
+    assert list(RecalculationJob.objects.values_list("status", flat=True)) == [RecalculationJob.Status.FAILED] * 2
+    assert RecalculationJob.is_stale()
+
+
+def test_failed_full_recalculation_is_retried(db, monkeypatch: pytest.MonkeyPatch, recalculated: List[Subgraph | None]):
+    """
+    Checks a failed recalculation of everything turns the next job into one too.
+    """
+    with monkeypatch.context() as patch:
+        patch.setattr(worker, "recalculate_loads", fail_to_recalculate)
+        RecalculationJob.queue(None)
+        assert worker.run_pending_job()
+
+    RecalculationJob.queue(Subgraph(tasks={2}))
+    assert worker.run_pending_job()
+    assert recalculated == [None]
+    assert not RecalculationJob.is_stale()
+
+
+def test_stale_is_cached(db, recalculated: List[Subgraph | None]):
+    """
+    Checks whether the loads are stale is read from the cache, kept up to date as jobs are queued and run.
+    """
+    assert not RecalculationJob.is_stale()
+    RecalculationJob.queue(Subgraph(tasks={1}))
+    with CaptureQueriesContext(connection) as context:
+        assert RecalculationJob.is_stale()
+    assert not context.captured_queries
+
+    # Starting a new data version doesn't lose it.
+    start_data_version()
+    assert RecalculationJob.is_stale()
+
+    assert worker.run_pending_job()
+    assert not RecalculationJob.is_stale()
+
+
+def test_stale_after_eviction(db):
+    """
+    Checks whether the loads are stale is found from the jobs if the cache entry's gone.
+    """
+    RecalculationJob.queue(Subgraph(tasks={1}))
+    cache.delete(DATA_VERSION_KEY)
+    assert RecalculationJob.is_stale()
+
+    RecalculationJob.objects.all().delete()
+    cache.delete(DATA_VERSION_KEY)
+    assert not RecalculationJob.is_stale()
+
+
+def test_edit_merged_while_claiming(db, monkeypatch: pytest.MonkeyPatch, recalculated: List[Subgraph | None]):
+    """
+    Checks an edit merged into a job after it's been read, but before it's claimed, is still recalculated.
+    """
+    RecalculationJob.queue(Subgraph(tasks={1}))
+
+    # The time's taken once for the abandoned jobs before reading them, then again just before claiming one.
+    times: List[datetime] = []
+
+    def now_with_edit() -> datetime:
+        if len(times) == 1:
+            RecalculationJob.queue(Subgraph(tasks={2}))
+        times.append(now())
+        return times[-1]
+
+    monkeypatch.setattr(recalculation_job, "now", now_with_edit)
+    assert worker.run_pending_job()
+    assert recalculated == [Subgraph(tasks={1, 2})]
+    assert not RecalculationJob.objects.exists()
@@ -0,0 +1,94 @@
+from typing import Any, Dict, List, Type
+
+import pytest
+from django.db import connection
+from django.db.models import Model
+from django.test.utils import CaptureQueriesContext
+
+from app.charts import get_balance_series
+from app.models import AcademicGroup, Assignment, Staff, StandardLoad, Task, Unit, YearSnapshot
+
+
+@pytest.mark.parametrize("model", [Staff, Unit, AcademicGroup, Task, Assignment])
+def test_history_matches_snapshots(department, model: Type[Model]):
+    """
+    Checks the history of a row is the same as finding it in each year's snapshot.
+    """
+    snapshots: List[YearSnapshot] = list(YearSnapshot.objects.all())
+    assert snapshots
+
+    for pk in model.objects.values_list("pk", flat=True)[:5]:
+        history: List[Model] = YearSnapshot.get_history(model, pk)
+        expected: List[Model] = [instance for snapshot in snapshots if (instance := snapshot.get_instance(model, pk))]
+        assert [instance.snapshot.year for instance in history] == [snapshot.year for snapshot in snapshots if snapshot.get_instance(model, pk)]
+
+        columns: List[str] = YearSnapshot.COLUMNS[model]
+        values: List[Dict[str, Any]] = [{column: getattr(instance, column) for column in columns} for instance in history]
+        assert values == [{column: getattr(instance, column) for column in columns} for instance in expected]
+
+
+def test_history_reads_only_the_row(department):
+    """
+    Checks the history of a row is read in one query, without loading any year's snapshot of the whole department.
+    """
+    staff: Staff = Staff.objects.first()
+    with CaptureQueriesContext(connection) as context:
+        history: List[Staff] = YearSnapshot.get_history(Staff, staff.pk)
+        assert [f"{instance.snapshot}" for instance in history]
+
+    assert len(context.captured_queries) == 1
+    assert '"app_yearsnapshot"."staff"' not in context.captured_queries[0]["sql"]
+
+
+def test_history_of_missing_row(department):
+    """
+    Checks a row that wasn't in any year has no history.
+    """
+    assert YearSnapshot.get_history(Staff, "nobody") == []
+
+
+def test_str_matches_standard_load(department):
+    """
+    Checks each year's snapshot is labelled the same as the standard load for the year.
+    """
+    for snapshot in YearSnapshot.objects.all():
+        assert f"{snapshot}" == f"{snapshot.get_standard_load()}" == f"{StandardLoad(year=snapshot.year)}"
+
+    assert f"{YearSnapshot(year=2024)}" == "24/25"
+
+
+def test_balance_series_years(department):
+    """
+    Checks the balance chart labels each year once, oldest first, ending with this one.
+    """
+    dates: List[str] = get_balance_series(Staff.objects.first())["dates"]
+    assert dates == sorted(set(dates))
+    assert dates[-1] == f"{StandardLoad.objects.latest()}"
+
+
+def test_take_from_history(department):
+    """
+    Checks a snapshot taken from history is the same as the one taken at the time, reading each model's rows in one query.
+    """
+    for snapshot in YearSnapshot.objects.all():
+        standard_load_historic: Model = StandardLoad.history.get(history_date=snapshot.date)
+        standard_load_historic.year = snapshot.year
+        snapshot.delete()
+
+        with CaptureQueriesContext(connection) as context:
+            taken: YearSnapshot = YearSnapshot.take_from_history(standard_load_historic)
+
+        assert len([query for query in context.captured_queries if '"app_historical' in query["sql"]]) == len(YearSnapshot.COLUMNS)
+        for field in YearSnapshot.FIELDS.values():
+            assert getattr(taken, field) == getattr(snapshot, field)
+
+
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="Reads SQLite's query plans.")
+def test_as_of_uses_indexes(department):
+    """
+    Checks finding the latest record of each row before a date looks up the indexes, rather than scanning the history.
+    """
+    date: Any = YearSnapshot.objects.first().date
+    plan: str = Assignment.history.as_of(date).filter(staff_id="nobody").explain()
+    assert "SCAN" not in plan
+    assert all(f"INDEX {index.name}" in plan for index in Assignment.history.model._meta.indexes if index.fields[0] in ("id", "staff"))